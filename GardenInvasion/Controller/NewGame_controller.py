@@ -1,37 +1,69 @@
 import pygame
 import sys
+import os
 from pathlib import Path
-import random
 from ..Model.menu_model import MenuModel, BackgroundModel
-from ..View.menu_view import draw_pause_modal, get_pause_menu_button_rects
+from ..View.menu_view import draw_pause_modal, pause_modal
 from ..Utilities.constants import*
-from ..Model.plant_model import Player
-from ..Model.wallnut_model import WallNutManager
-from ..Model.wave_model import WaveManager
-from .plant_controller import handle_player_input
-from .wallnut_controller import handle_wallnut_placement
-from ..View.RunGame_view import draw_game
+from .simulation_controller import GameSimulation
+from .collision_controller import (
+    _handle_projectile_zombie_collisions,
+    _handle_zombie_projectile_plant_collisions,
+    _handle_zombie_projectile_wallnut_collisions,
+    _handle_zombie_plant_collisions,
+    _handle_zombie_wallnut_collisions,
+)
+from ..View.RunGame_view import draw_game, DirtyGameRenderer
+from ..View.hud_view import GameHUD, HEART_SIZE
 from .menu_controller_utilities import show_confirm_quit
 from ..Model.setting_volume_model import SettingsModel
 from ..Model.sound_manager_model import SoundManager
 from ..Model.game_over_model import GameOverModel
-from ..View.game_over_view import draw_game_over_screen
+from ..View.game_over_view import draw_game_over_screen, game_over_modal
 from ..Model.victory_model import VictoryModel
-from ..View.victory_view import draw_victory_screen
-from ..Model.PowerUp_model import PowerUpManager, IncreasingFirePU, RepairWallnutPU
+from ..View.victory_view import draw_victory_screen, victory_modal
+from ..Utilities.asset_cache import asset_cache, image_path, SCALE_FAST, SCALE_SMOOTH
+from ..Utilities.input_log import InputRecorder, session_log_path
+from ..Utilities.game_rng import parse_seed
+from ..Utilities.frame_profiler import FrameProfiler, output_prefix
+from ..View.profiler_view import ProfilerOverlay
+from ..View.backdrop_view import build_backdrop, DIALOG_DARKEN
+from ..Utilities.preloader import Preloader
+from ..Utilities.idle_redraw import IdleRedraw
+from ..Model.skin_selection_model import SKINS, skin_sprite_path
+from ..Model.plant_model import PLAYER_SPRITE_SCALE
+
+
+# life heart, already at the size the HUD draws it
+HEART_SPEC = (image_path("HeartShape.png"), (HEART_SIZE, HEART_SIZE), SCALE_FAST)
+asset_cache.register(*HEART_SPEC)
+RUNGAME_BG_PATH = Path(__file__).resolve().parent.parent / "Assets" / "images" / "RunGame01.png"
+
+
+def _preload_sprites() -> int:
+    # every registered gameplay sprite plus the player skins (any can be picked in Options)
+    skins = [(skin_sprite_path(skin_id), PLAYER_SPRITE_SCALE, SCALE_SMOOTH) for skin_id, _, _ in SKINS]
+    return asset_cache.preload() + asset_cache.preload(skins)
+
+
+def start_preloading(preloader: Preloader, sound_manager: SoundManager) -> None:
+    # Queue what run_game needs on the preloader's worker thread, so starting a game
+    # from the menu doesn't stall on decoding; run_game waits for whatever isn't done yet
+    preloader.submit('sprites', _preload_sprites)
+    preloader.submit('background', BackgroundModel, RUNGAME_BG_PATH)
+    preloader.submit('music', sound_manager.preload_music, 'gameplay')
 
 
 def show_pause_menu(screen: pygame.Surface, model: MenuModel) -> str:
     clock = pygame.time.Clock()
-    background_copy = screen.copy()
-    small_size = (screen.get_width() // 3, screen.get_height() // 3)
-    blurred = pygame.transform.smoothscale(background_copy, small_size)
-    blurred = pygame.transform.smoothscale(blurred, screen.get_size())
+    backdrop = build_backdrop(screen, darken=DIALOG_DARKEN) # blurred and darkened once
     # Reset to middle button (Resume) by default
     pause_selected = 1  # 0=Main Menu, 1=Resume, 2=Quit
+    idle = IdleRedraw() # the game is frozen, redraw only when the selection changes
+    modal = pause_modal() # buttons hit-tested where they are drawn
     
     while True:
-        for event in pygame.event.get():
+        for event in idle.get_events():
             if event.type == pygame.QUIT:
                 print ("Quit event detected in pause menu, Bye Bye!")
                 return 'quit' # Quit the game
@@ -55,28 +87,11 @@ def show_pause_menu(screen: pygame.Surface, model: MenuModel) -> str:
                     return 'resume'  # ESC in pause menu = resume
                     
             if event.type == pygame.MOUSEMOTION:
-                menu_rect, resume_rect, quit_rect = get_pause_menu_button_rects()# get button rects
-
-                # Calculate dialog box position (matching draw_pause_modal positioning)
-                box_width, box_height = int(SCREEN_WIDTH * 0.7), int(SCREEN_HEIGHT * 0.35)
-                box_rect = pygame.Rect(0, 0, box_width, box_height)
-                box_rect.center = (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2)
-                
-                # Position buttons relative to dialog box
-                buttons_y = box_rect.top + int(box_height * 0.65)
-                menu_rect.center = (box_rect.centerx - 160, buttons_y)
-                resume_rect.center = (box_rect.centerx, buttons_y)
-                quit_rect.center = (box_rect.centerx + 160, buttons_y)
-
-                if menu_rect.collidepoint(event.pos):
-                    pause_selected = 0
-                elif resume_rect.collidepoint(event.pos):
-                    pause_selected = 1
-                elif quit_rect.collidepoint(event.pos):
-                    pause_selected = 2
+                hovered = modal.hit_test(event.pos) # 0=Main Menu, 1=Resume, 2=Quit, -1=none
+                if hovered >= 0:
+                    pause_selected = hovered
                     
             if event.type == pygame.MOUSEBUTTONDOWN:
-                menu_rect, resume_rect, quit_rect = get_pause_menu_button_rects()
                 if pause_selected == 0:
                     print ("Returning to Main Menu from Pause Menu via Mouse Click")
                     return 'menu'
@@ -86,13 +101,12 @@ def show_pause_menu(screen: pygame.Surface, model: MenuModel) -> str:
                 else:
                     print ("Quitting Game from Pause Menu via Mouse Click, Bye Bye!")
                     return 'quit'
-        
-        screen.blit(blurred, (0, 0))
-        overlay = pygame.Surface(screen.get_size(), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 150))
-        screen.blit(overlay, (0, 0))
-        draw_pause_modal(screen, pause_selected)
-        pygame.display.flip()
+
+        idle.watch(pause_selected)
+        if idle.should_draw():
+            screen.blit(backdrop, (0, 0))
+            draw_pause_modal(screen, pause_selected, darken=False)
+            pygame.display.flip()
         clock.tick(60)
 
 def show_game_over_screen(screen: pygame.Surface, menu_model: MenuModel, sound_manager: SoundManager) -> str:
@@ -101,16 +115,10 @@ def show_game_over_screen(screen: pygame.Surface, menu_model: MenuModel, sound_m
     game_over_model = GameOverModel()
     sound_manager.play_sound('game_over') 
 
-    # Capture and blur the background ONCE before the loop
-    background_snapshot = screen.copy() # Capture current screen
-    small_size = (screen.get_width() // 8, screen.get_height() // 8) # Reduce size for blurring
-    blurred_bg = pygame.transform.smoothscale(background_snapshot, small_size)
-    blurred_bg = pygame.transform.smoothscale(blurred_bg, (screen.get_width() // 6, screen.get_height() // 6))
-    blurred_bg = pygame.transform.smoothscale(blurred_bg, screen.get_size())
+    # Blur and darken the background ONCE before the loop
+    blurred_bg = build_backdrop(screen, radius=16, darken=150)
     
-    # Store button rects (will be updated after first draw)
-    restart_rect = None
-    menu_rect = None
+    modal = game_over_modal() # buttons hit-tested where they are drawn
     
     # Fade-in animation variables
     fade_alpha = 0  # Start fully transparent
@@ -140,11 +148,9 @@ def show_game_over_screen(screen: pygame.Surface, menu_model: MenuModel, sound_m
                             return 'menu'
                             
                 if event.type == pygame.MOUSEMOTION: # Handle mouse hover
-                    if restart_rect and menu_rect:
-                        if restart_rect.collidepoint(event.pos):
-                            game_over_model.selected_index = 0
-                        elif menu_rect.collidepoint(event.pos):
-                            game_over_model.selected_index = 1
+                    hovered = modal.hit_test(event.pos) # 0 = Start Again, 1 = Main Menu
+                    if hovered >= 0:
+                        game_over_model.selected_index = hovered
                         
                 if event.type == pygame.MOUSEBUTTONDOWN: # Handle mouse clicks
                     selected = game_over_model.get_selected_option()
@@ -153,15 +159,11 @@ def show_game_over_screen(screen: pygame.Surface, menu_model: MenuModel, sound_m
                     else:
                         return 'menu'
         
-        # Draw blurred background first
+        # Draw blurred, already darkened background first
         screen.blit(blurred_bg, (0, 0))
-        # Draw dark overlay
-        overlay = pygame.Surface(screen.get_size(), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 150))
-        screen.blit(overlay, (0, 0))
         
         # Draw game over screen with current fade alpha
-        restart_rect, menu_rect = draw_game_over_screen(screen, game_over_model, fade_alpha)
+        draw_game_over_screen(screen, game_over_model, fade_alpha)
         
         # Update fade-in animation
         if fade_alpha < 255:
@@ -178,16 +180,10 @@ def show_victory_screen(screen: pygame.Surface, menu_model: MenuModel, sound_man
     victory_model = VictoryModel()
     sound_manager.play_sound('victory')
     
-    # Capture and blur the background ONCE before the loop
-    background_snapshot = screen.copy()
-    small_size = (screen.get_width() // 8, screen.get_height() // 8)
-    blurred_bg = pygame.transform.smoothscale(background_snapshot, small_size)
-    blurred_bg = pygame.transform.smoothscale(blurred_bg, (screen.get_width() // 6, screen.get_height() // 6))
-    blurred_bg = pygame.transform.smoothscale(blurred_bg, screen.get_size())
+    # Blur and darken the background ONCE before the loop (lighter for victory)
+    blurred_bg = build_backdrop(screen, radius=16, darken=100)
     
-    # Store button rects
-    play_again_rect = None
-    menu_rect = None
+    modal = victory_modal() # buttons hit-tested where they are drawn
     
     # Fade-in animation variables
     fade_alpha = 0
@@ -217,11 +213,9 @@ def show_victory_screen(screen: pygame.Surface, menu_model: MenuModel, sound_man
                             return 'menu'
                 
                 if event.type == pygame.MOUSEMOTION:
-                    if play_again_rect and menu_rect:
-                        if play_again_rect.collidepoint(event.pos):
-                            victory_model.selected_index = 0
-                        elif menu_rect.collidepoint(event.pos):
-                            victory_model.selected_index = 1
+                    hovered = modal.hit_test(event.pos) # 0 = Play Again, 1 = Main Menu
+                    if hovered >= 0:
+                        victory_model.selected_index = hovered
                 
                 if event.type == pygame.MOUSEBUTTONDOWN:
                     selected = victory_model.get_selected_option()
@@ -230,16 +224,11 @@ def show_victory_screen(screen: pygame.Surface, menu_model: MenuModel, sound_man
                     else:
                         return 'menu'
         
-        # Draw blurred background
+        # Draw blurred, already darkened background
         screen.blit(blurred_bg, (0, 0))
         
-        # Draw dark overlay
-        overlay = pygame.Surface(screen.get_size(), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 100))  # Lighter overlay for victory (less dark)
-        screen.blit(overlay, (0, 0))
-        
         # Draw victory screen with current fade alpha
-        play_again_rect, menu_rect = draw_victory_screen(screen, victory_model, fade_alpha)
+        draw_victory_screen(screen, victory_model, fade_alpha)
         
         # Update fade-in animation
         if fade_alpha < 255:
@@ -250,310 +239,200 @@ def show_victory_screen(screen: pygame.Surface, menu_model: MenuModel, sound_man
         pygame.display.flip()
         clock.tick(60)
 
-# series of functions to handle different types of collisions in the game
-
-def _handle_projectile_zombie_collisions(projectile_group, zombie_group, sound_manager=None, powerup_manager=None):
-    # Handle collisions between player projectiles and zombies
-    collisions = pygame.sprite.groupcollide(
-        projectile_group,
-        zombie_group,
-        True,
-        False
-    )
-    
-    # For each collision, make the zombie take damage
-    for projectile, zombies_hit in collisions.items():
-        for zombie in zombies_hit:
-            zombie_destroyed = zombie.take_damage(1)  # Deal 1 damage
-            if sound_manager:
-                sound_manager.play_sound('zombie_hit')
-            
-            if zombie_destroyed and powerup_manager is not None: # spawn power-up with 50% probability if zombie was destroyed
-                if random.random() < 0.5:
-                    powerup_manager.spawn_random_powerup(zombie.rect.center)
-                    
-    return len(collisions) > 0  # Return True if any collisions occurred
-
-def _handle_zombie_projectile_plant_collisions(zombie_projectile_group, player, sound_manager=None):
-    # Handle collisions between zombie projectiles and plant
-    
-    # Check collision between zombie projectiles and player
-    collisions = pygame.sprite.spritecollide(
-        player,                    
-        zombie_projectile_group,   
-        True,                      
-        pygame.sprite.collide_rect 
-    )
-        
-    plant_was_destroyed = False
-    
-    # For each collision, make the plant take damage
-    for projectile in collisions:        
-        # Plant hit by projectile
-        if sound_manager:
-            sound_manager.play_sound('plant_hit')
-        
-        plant_destroyed = player.take_damage()
-        
-        # Check if plant was destroyed
-        if plant_destroyed:
-            print("plant destroyed by zombie projectile")
-            plant_was_destroyed = True
-            break
-    
-    # Return True only if plant was actually destroyed, not just hit
-    return plant_was_destroyed
-
-
-def _handle_zombie_projectile_wallnut_collisions(zombie_projectile_group, wallnut_manager, sound_manager=None):
-    # Handle collisions between zombie projectiles and wallnuts
-
-    # Get the wallnut sprite group
-    wallnut_group = wallnut_manager.get_wallnuts()
-    
-    # Check collisions between zombie projectiles and wallnuts
-    collisions = pygame.sprite.groupcollide(
-        zombie_projectile_group,  
-        wallnut_group,            
-        True,                     
-        False                     
-    )
-    
-    wallnut_destroyed_count = 0
-    
-    # For each collision, make the wallnut take damage
-    for projectile, wallnuts_hit in collisions.items():
-        for wallnut in wallnuts_hit:
-            wallnut_destroyed = wallnut.take_damage()
-            if wallnut_destroyed:
-                wallnut_destroyed_count += 1
-                print(f"Wallnut {wallnut.slot_index} destroyed by zombie projectile")
-            else:
-                print(f"Wallnut {wallnut.slot_index} hit by zombie projectile! Health: {wallnut.health}")
-    
-    return len(collisions) > 0  # Return True if any collisions occurred
-
-
-def _handle_zombie_wallnut_collisions(zombie_group, wallnut_manager, sound_manager=None):
-    # Handle collisions between zombies and wallnuts
-    # Zombie is destroyed on contact, wallnut takes damage
-    
-    wallnut_group = wallnut_manager.get_wallnuts()
-    
-    # Check collisions between zombies and wallnuts
-    # True = remove zombie on collision (it gets destroyed)
-    # False = don't auto-remove wallnut (it takes damage via take_damage())
-    collisions = pygame.sprite.groupcollide(
-        zombie_group,      
-        wallnut_group,     
-        True,              
-        False              
-    )
-    
-    wallnut_destroyed_count = 0
-    
-    # For each collision, make the wallnut take damage
-    for zombie, wallnuts_hit in collisions.items():
-        for wallnut in wallnuts_hit:
-            wallnut_destroyed = wallnut.take_damage()
-            if wallnut_destroyed:
-                wallnut_destroyed_count += 1
-                print(f"Wallnut {wallnut.slot_index} destroyed by zombie")
-            else:
-                print(f"Zombie destroyed by wallnut {wallnut.slot_index}! Wallnut health: {wallnut.health}")
-    
-    return len(collisions) > 0  # Return True if any collisions occurred
-
-
-def _handle_zombie_plant_collisions(zombie_group, player, sound_manager=None):
-    # Handle collisions between zombies and the plant.
-    # Zombie is destroyed on contact, plant takes damage.
-
-    # Check collisions between zombies and player
-    # True = remove zombie on collision (it gets destroyed)
-    collisions = pygame.sprite.spritecollide(
-        player,              
-        zombie_group,        
-        True,                
-        pygame.sprite.collide_rect  
-    )
-    
-    plant_was_destroyed = False
-    
-    # For each collision, make the plant take damage
-    for zombie in collisions:
-        print(f"Zombie hits plant. Plant life before: {player.life_points}")
-        if sound_manager:
-            sound_manager.play_sound('plant_hit')
-        
-        plant_destroyed = player.take_damage()
-        print(f"Plant life after: {player.life_points}")
-        
-        if plant_destroyed:
-            print("PLANT DESTROYED BY ZOMBIE! GAME OVER!")
-            plant_was_destroyed = True
-        else:
-            print(f"Plant health: {player.life_points}/{player.max_life_points}")
-    return plant_was_destroyed  
-
 # Main game loop controller
-def run_game(screen: pygame.Surface, model: MenuModel, settings_model: SettingsModel, sound_manager: SoundManager) -> None:
+def run_game(screen: pygame.Surface, model: MenuModel, settings_model: SettingsModel, sound_manager: SoundManager,
+             preloader: Preloader | None = None) -> None:
     
     clock = pygame.time.Clock()
 
-    pkg_root = Path(__file__).resolve().parent.parent
-    RunGame_bg_path = pkg_root / "Assets" / "images" / "RunGame01.png"
-    RunGame_background = BackgroundModel(RunGame_bg_path)
+    # assets queued by start_preloading are usually ready by now, wait for the rest
+    if preloader is not None:
+        preloader.wait('sprites')
+        preloader.wait('music')
+        RunGame_background = preloader.wait('background') or BackgroundModel(RUNGAME_BG_PATH)
+    else:
+        RunGame_background = BackgroundModel(RUNGAME_BG_PATH)
+
+    # decode every registered gameplay sprite now, so spawning and shooting never hit the disk
+    # (only cache hits when they were preloaded)
+    asset_cache.preload()
 
-    heart_path = pkg_root / "Assets" / "images" / "HeartShape.png"
     try:
-        heart_image = pygame.image.load(heart_path).convert_alpha()
+        heart_image = asset_cache.get_image(*HEART_SPEC)
     except pygame.error as e:
         print(f"Error loading heart image: {e}")
         # Create a fallback red heart rectangle if image not found
         heart_image = pygame.Surface((40, 40))
         heart_image.fill((255, 0, 0))
 
-    sound_manager = SoundManager(settings_model)
-
-    # Create player with selected skin
-    player = Player((SCREEN_WIDTH // 2, SCREEN_HEIGHT * 0.95), settings_model)
-    player_group = pygame.sprite.GroupSingle(player)
-    projectile_group = pygame.sprite.Group()
-
-    # create wall-nut manager with 4 wall-nut slots
-    wallnut_manager = WallNutManager(
-        player_position=(SCREEN_WIDTH // 2, SCREEN_HEIGHT * 0.95),
-        screen_width=SCREEN_WIDTH,
-        screen_height=SCREEN_HEIGHT,
-        sound_manager=sound_manager
-    )
+    # gameplay runs on its own logical clock, one fixed step per frame,
+    # so game time stops while the pause menu or a dialog is open
+    # fixed seed to replay a session, random otherwise
+    seed = None
+    seed_setting = os.environ.get(SEED_ENV)
+    if seed_setting:
+        try:
+            seed = parse_seed(seed_setting)
+        except ValueError as e:
+            print(f"Warning: {SEED_ENV} ignored, {e}; playing with a random seed")
 
-    wallnut_manager.place_all_wallnuts()
+    # per-phase frame timing, on from the start with the env switch, F3 toggles it in game
+    profile_setting = os.environ.get(PROFILE_ENV)
+    profiler = FrameProfiler(enabled=profile_setting not in (None, '', '0'))
+    profiler_overlay = ProfilerOverlay(profiler)
 
-    # Create power-up manager
-    powerup_manager = PowerUpManager()
-    powerup_group = powerup_manager.powerup_group
-    
-    # Create wave manager
-    wave_manager = WaveManager()
-    wave_manager.start_first_wave()
+    waves = os.environ.get(WAVES_ENV)
+    horde = os.environ.get(HORDE_ENV) == '1'
+    endless = os.environ.get(ENDLESS_ENV) == '1'
+    simulation = GameSimulation(settings_model, sound_manager, seed=seed,
+                                profiler=profiler, waves=waves, horde=horde, endless=endless)
+    player = simulation.player
+    wave_manager = simulation.wave_manager
         
-    sound_manager.play_music('gameplay', loops=-1, fade_ms=1000)
+    # hearts (and future counters) pre-rendered on one layer, rebuilt only when they change
+    hud = GameHUD(heart_image, screen.get_size(), player.max_life_points)
 
-    running = True
-    while running:
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                print ("Quit event detected in game loop")
-                if show_confirm_quit(screen, model):
-                    sound_manager.stop_music(fade_ms=500)
-                    pygame.quit()
-                    sys.exit()
-            elif event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
-                print("Escape key pressed, Pause Menu shown")
-                sound_manager.pause_music()
-                action = show_pause_menu(screen, model)
-                if action == 'quit':
-                    sound_manager.stop_music(fade_ms=500)
-                    pygame.quit()
-                    sys.exit()
-                elif action == 'menu':
-                    sound_manager.stop_music(fade_ms=1000)
-                    running = False
-                else:
-                    sound_manager.unpause_music()
-        
-        handle_player_input(player, projectile_group, sound_manager)
-        keys = pygame.key.get_pressed()
-        handle_wallnut_placement(keys, wallnut_manager)
-
-        # Update all entities
-        player_group.update()
-        projectile_group.update()
-        wallnut_manager.update()
-        wave_manager.update()
-        powerup_manager.update()
-        
-        _handle_projectile_zombie_collisions(projectile_group, wave_manager.zombie_group, sound_manager, powerup_manager)
-        plant_destroyed_by_projectile = _handle_zombie_projectile_plant_collisions(
-            wave_manager.zombie_projectile_group, 
-            player, 
-            sound_manager
-        )
-        _handle_zombie_projectile_wallnut_collisions(
-            wave_manager.zombie_projectile_group,
-            wallnut_manager,
-            sound_manager
-        )
-        plant_destroyed_by_zombie = _handle_zombie_plant_collisions(
-            wave_manager.zombie_group,
-            player,
-            sound_manager
-        )
+    # opt-in dirty-rect rendering: only the areas that changed are pushed to the display
+    renderer = None
+    if os.environ.get(DIRTY_RECTS_ENV) == '1':
+        renderer = DirtyGameRenderer(screen, RunGame_background, heart_image, hud)
         
-        _handle_zombie_wallnut_collisions(
-            wave_manager.zombie_group,
-            wallnut_manager,
-            sound_manager
-        )
+    # opt-in input recording, replayable with replay_controller.replay_input_log
+    recorder = None
+    record_path = os.environ.get(RECORD_ENV)
+    if record_path:
+        recorder = InputRecorder(session_log_path(record_path, simulation.rng.seed), simulation.rng.seed,
+                                 simulation.dt_ms, settings_model.player_skin, waves, endless, horde)
+        print(f"Recording input to {recorder.path}")
+    # endless mode slows spawning down when frames run long; recorded games leave it out,
+    # replays have no frame times and must spawn the same way
+    report_frame_time = getattr(wave_manager, 'report_frame_time', None) if not recorder else None
         
-        # Combined plant destruction check (from any source)
-        plant_destroyed = plant_destroyed_by_projectile or plant_destroyed_by_zombie
+    sound_manager.play_music('gameplay', loops=-1, fade_ms=1000)
 
-        # power-up collection
-        collected_powerups = pygame.sprite.spritecollide(
-            player,
-            powerup_group,
-            dokill=True  # remove collected power-ups from the game
-        )
-        for pu in collected_powerups:
-            # Fire-rate power-up
-            if isinstance(pu, IncreasingFirePU):
-                pu.apply(player)
-            # Repair all wallnuts
-            elif isinstance(pu, RepairWallnutPU):
-                pu.apply(wallnut_manager) 
+    running = True
+    restart = False
+    try:
+        while running:
+            profiler.start_frame()
+            escape_pressed = False
+            modal_shown = False # a dialog ran in this frame, its time is not the game's
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    print ("Quit event detected in game loop")
+                    if show_confirm_quit(screen, model):
+                        sound_manager.stop_music(fade_ms=500)
+                        pygame.quit()
+                        sys.exit()
+                    modal_shown = True
+                    profiler.start_frame() # time the frame from the dialog's return
+                    if renderer:
+                        renderer.invalidate() # the dialog drew over the game
+                elif event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+                    escape_pressed = True
+                    print("Escape key pressed, Pause Menu shown")
+                    sound_manager.pause_music()
+                    action = show_pause_menu(screen, model)
+                    if action == 'quit':
+                        sound_manager.stop_music(fade_ms=500)
+                        pygame.quit()
+                        sys.exit()
+                    elif action == 'menu':
+                        sound_manager.stop_music(fade_ms=1000)
+                        running = False
+                    else:
+                        sound_manager.unpause_music()
+                    modal_shown = True
+                    profiler.start_frame() # time the frame from the menu's return
+                    if renderer:
+                        renderer.invalidate() # the pause menu drew over the game
+                elif event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                    profiler.toggle()
+                    print(f"Frame profiler {'on' if profiler.enabled else 'off'}")
+            profiler.lap('events')
         
-        # draw all entities and UI elements
-        draw_game(screen, RunGame_background, player_group, projectile_group, 
-                  wallnut_manager.get_wallnuts(),
-                  player.life_points,
-                  heart_image,
-                  wave_manager.zombie_group,
-                  wave_manager.zombie_projectile_group,
-                  powerup_group)
+            keys = pygame.key.get_pressed() # read once, the same state drives (and is recorded for) this step
+            if recorder:
+                recorder.record(simulation.ticks + 1, keys, escape_pressed)
+            simulation.step(keys)
+            plant_destroyed = simulation.plant_destroyed
         
-        pygame.display.flip()
+            # draw all entities and UI elements
+            if renderer:
+                dirty_rects = renderer.draw(simulation.player_group, simulation.projectile_group,
+                                            simulation.wallnut_manager.get_wallnuts(),
+                                            player.life_points,
+                                            wave_manager.zombie_group,
+                                            wave_manager.zombie_projectile_group,
+                                            simulation.powerup_group)
+                if profiler.enabled:
+                    overlay_rect = profiler_overlay.draw(screen)
+                    renderer.mark_drawn(overlay_rect)
+                    dirty_rects.append(overlay_rect)
+                profiler.lap('draw')
+                pygame.display.update(dirty_rects)
+            else:
+                draw_game(screen, RunGame_background, simulation.player_group, simulation.projectile_group, 
+                          simulation.wallnut_manager.get_wallnuts(),
+                          player.life_points,
+                          heart_image,
+                          wave_manager.zombie_group,
+                          wave_manager.zombie_projectile_group,
+                          simulation.powerup_group,
+                          hud)
+                if profiler.enabled:
+                    profiler_overlay.draw(screen)
+                profiler.lap('draw')
+            
+                pygame.display.flip()
         
-        # Check if plant was destroyed (game over)
-        if plant_destroyed:
-            print("game over, plant destroyed")
-            sound_manager.stop_music(fade_ms=500)
-            # Show game over screen
-            action = show_game_over_screen(screen, model, sound_manager)
+            # Check if plant was destroyed (game over)
+            if plant_destroyed:
+                print("game over, plant destroyed")
+                sound_manager.stop_music(fade_ms=500)
+                # Show game over screen
+                action = show_game_over_screen(screen, model, sound_manager)
+                modal_shown = True
+                profiler.discard_frame() # the frame lasted as long as the screen was shown
             
-            if action == 'restart': 
-                run_game(screen, model, settings_model, sound_manager)
-                return
-            elif action == 'menu': 
-                running = False
-            else:  # quit
-                pygame.quit()
-                sys.exit()
+                if action == 'restart': 
+                    restart = True
+                    break
+                elif action == 'menu': 
+                    running = False
+                else:  # quit
+                    pygame.quit()
+                    sys.exit()
         
-        if wave_manager.is_victory():
-            print("Victory, all waves defeated")
-            sound_manager.stop_music(fade_ms=500)
-            action = show_victory_screen(screen, model, sound_manager)
+            if simulation.victory:
+                print("Victory, all waves defeated")
+                sound_manager.stop_music(fade_ms=500)
+                action = show_victory_screen(screen, model, sound_manager)
+                modal_shown = True
+                profiler.discard_frame()
             
-            if action == 'restart':
-                run_game(screen, model, settings_model, sound_manager)
-                return
-            elif action == 'menu':
-                running = False
-            else:  # quit
-                pygame.quit()
-                sys.exit()
+                if action == 'restart':
+                    restart = True
+                    break
+                elif action == 'menu':
+                    running = False
+                else:  # quit
+                    pygame.quit()
+                    sys.exit()
+
+            profiler.lap('flip')
+            profiler.end_frame()
+            clock.tick(60)
+            if report_frame_time and not modal_shown:
+                report_frame_time(clock.get_rawtime()) # work time of the frame, without the wait
+    finally:
+        if recorder:
+            recorder.close() # also on quit, so the log is complete
+        if profiler.phases:
+            prefix = output_prefix(profile_setting).resolve()
+            profiler.write_csv(f"{prefix}.csv")
+            profiler.write_json(f"{prefix}.json")
+            print(f"Frame profile written to {prefix}.csv and {prefix}.json")
 
-        clock.tick(60)
\ No newline at end of file
+    if restart:
+        run_game(screen, model, settings_model, sound_manager, preloader)
\ No newline at end of file
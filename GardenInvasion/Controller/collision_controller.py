@@ -0,0 +1,172 @@
+import pygame
+import random
+from ..Model.PowerUp_model import IncreasingFirePU, RepairWallnutPU
+
+# series of functions to handle different types of collisions in the game
+
+def _handle_projectile_zombie_collisions(projectile_group, zombie_group, sound_manager=None, powerup_manager=None, grid=None, rng=None):
+    # Handle collisions between player projectiles and zombies
+    collide = grid if grid is not None else pygame.sprite # grid = SpatialGrid indexing zombie_group
+    drop_rng = rng if rng is not None else random # session drops stream, global random without one
+    collisions = collide.groupcollide(
+        projectile_group,
+        zombie_group,
+        True,
+        False
+    )
+    
+    # For each collision, make the zombie take damage
+    for projectile, zombies_hit in collisions.items():
+        for zombie in zombies_hit:
+            zombie_destroyed = zombie.take_damage(1)  # Deal 1 damage
+            if sound_manager:
+                sound_manager.play_sound('zombie_hit')
+            
+            if zombie_destroyed and powerup_manager is not None: # spawn power-up with 50% probability if zombie was destroyed
+                if drop_rng.random() < 0.5:
+                    powerup_manager.spawn_random_powerup(zombie.rect.center)
+                    
+    return len(collisions) > 0  # Return True if any collisions occurred
+
+def _handle_zombie_projectile_plant_collisions(zombie_projectile_group, player, sound_manager=None, grid=None):
+    # Handle collisions between zombie projectiles and plant
+    collide = grid if grid is not None else pygame.sprite # grid = SpatialGrid indexing zombie_projectile_group
+    
+    # Check collision between zombie projectiles and player
+    collisions = collide.spritecollide(
+        player,                    
+        zombie_projectile_group,   
+        True,                      
+        pygame.sprite.collide_rect 
+    )
+        
+    plant_was_destroyed = False
+    
+    # For each collision, make the plant take damage
+    for projectile in collisions:        
+        # Plant hit by projectile
+        if sound_manager:
+            sound_manager.play_sound('plant_hit')
+        
+        plant_destroyed = player.take_damage()
+        
+        # Check if plant was destroyed
+        if plant_destroyed:
+            print("plant destroyed by zombie projectile")
+            plant_was_destroyed = True
+            break
+    
+    # Return True only if plant was actually destroyed, not just hit
+    return plant_was_destroyed
+
+
+def _handle_zombie_projectile_wallnut_collisions(zombie_projectile_group, wallnut_manager, sound_manager=None, grid=None):
+    # Handle collisions between zombie projectiles and wallnuts
+    collide = grid if grid is not None else pygame.sprite # grid = SpatialGrid indexing the wallnuts
+
+    # Get the wallnut sprite group
+    wallnut_group = wallnut_manager.get_wallnuts()
+    
+    # Check collisions between zombie projectiles and wallnuts
+    collisions = collide.groupcollide(
+        zombie_projectile_group,  
+        wallnut_group,            
+        True,                     
+        False                     
+    )
+    
+    wallnut_destroyed_count = 0
+    
+    # For each collision, make the wallnut take damage
+    for projectile, wallnuts_hit in collisions.items():
+        for wallnut in wallnuts_hit:
+            wallnut_destroyed = wallnut.take_damage()
+            if wallnut_destroyed:
+                wallnut_destroyed_count += 1
+                print(f"Wallnut {wallnut.slot_index} destroyed by zombie projectile")
+            else:
+                print(f"Wallnut {wallnut.slot_index} hit by zombie projectile! Health: {wallnut.health}")
+    
+    return len(collisions) > 0  # Return True if any collisions occurred
+
+
+def _handle_zombie_wallnut_collisions(zombie_group, wallnut_manager, sound_manager=None, grid=None):
+    # Handle collisions between zombies and wallnuts
+    # Zombie is destroyed on contact, wallnut takes damage
+    collide = grid if grid is not None else pygame.sprite # grid = SpatialGrid indexing the wallnuts
+    
+    wallnut_group = wallnut_manager.get_wallnuts()
+    
+    # Check collisions between zombies and wallnuts
+    # True = remove zombie on collision (it gets destroyed)
+    # False = don't auto-remove wallnut (it takes damage via take_damage())
+    collisions = collide.groupcollide(
+        zombie_group,      
+        wallnut_group,     
+        True,              
+        False              
+    )
+    
+    wallnut_destroyed_count = 0
+    
+    # For each collision, make the wallnut take damage
+    for zombie, wallnuts_hit in collisions.items():
+        for wallnut in wallnuts_hit:
+            wallnut_destroyed = wallnut.take_damage()
+            if wallnut_destroyed:
+                wallnut_destroyed_count += 1
+                print(f"Wallnut {wallnut.slot_index} destroyed by zombie")
+            else:
+                print(f"Zombie destroyed by wallnut {wallnut.slot_index}! Wallnut health: {wallnut.health}")
+    
+    return len(collisions) > 0  # Return True if any collisions occurred
+
+
+def _handle_zombie_plant_collisions(zombie_group, player, sound_manager=None, grid=None):
+    # Handle collisions between zombies and the plant.
+    # Zombie is destroyed on contact, plant takes damage.
+    collide = grid if grid is not None else pygame.sprite # grid = SpatialGrid indexing zombie_group
+
+    # Check collisions between zombies and player
+    # True = remove zombie on collision (it gets destroyed)
+    collisions = collide.spritecollide(
+        player,              
+        zombie_group,        
+        True,                
+        pygame.sprite.collide_rect  
+    )
+    
+    plant_was_destroyed = False
+    
+    # For each collision, make the plant take damage
+    for zombie in collisions:
+        print(f"Zombie hits plant. Plant life before: {player.life_points}")
+        if sound_manager:
+            sound_manager.play_sound('plant_hit')
+        
+        plant_destroyed = player.take_damage()
+        print(f"Plant life after: {player.life_points}")
+        
+        if plant_destroyed:
+            print("PLANT DESTROYED BY ZOMBIE! GAME OVER!")
+            plant_was_destroyed = True
+        else:
+            print(f"Plant health: {player.life_points}/{player.max_life_points}")
+    return plant_was_destroyed
+
+def _handle_powerup_collection(player, powerup_group, wallnut_manager, grid=None):
+    # Handle the player collecting falling power-ups
+    collide = grid if grid is not None else pygame.sprite # grid = SpatialGrid indexing powerup_group
+    collected_powerups = collide.spritecollide(
+        player,
+        powerup_group,
+        dokill=True  # remove collected power-ups from the game
+    )
+    for pu in collected_powerups:
+        # Fire-rate power-up
+        if isinstance(pu, IncreasingFirePU):
+            pu.apply(player)
+        # Repair all wallnuts
+        elif isinstance(pu, RepairWallnutPU):
+            pu.apply(wallnut_manager)
+    return collected_powerups
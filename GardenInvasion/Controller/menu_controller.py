@@ -1,33 +1,47 @@
 import pygame
 import sys
 from ..Model.menu_model import MenuModel
-from ..View.menu_view import draw_menu
+from ..View.menu_view import draw_menu, menu_layout
 from ..Utilities.constants import*
 from ..Model.setting_volume_model import SettingsModel
 from .menu_controller_utilities import _global_quit
 from .options_controller import run_options
-from .NewGame_controller import run_game
-from ..Model.sound_manager_model import SoundManager
+from .NewGame_controller import run_game, start_preloading
+from ..Model.sound_manager_model import get_sound_manager
+from ..Utilities.preloader import Preloader
+from ..Utilities.idle_redraw import IdleRedraw
 
-settings_model = SettingsModel()
-settings_model.load()
-sound_manager = SoundManager(settings_model) # Initialize sound manager with settings
+# created by the first main_menu_loop call, not at import (the mixer needs pygame.init)
+settings_model = None
+sound_manager = None
 
 def main_menu_loop(screen: pygame.Surface,
                    background_surf: pygame.Surface | None,
                    background_rect: pygame.Rect | None,
-                   fonts: tuple,):
+                   fonts: tuple,
+                   preloader: Preloader | None = None):
     # main menu loop, returns when user starts game or options
     # it handles user's input and enter either run_game or run_options
+    # with a preloader, gameplay assets are loaded in the background while the menu is shown
+    global settings_model, sound_manager
+    if settings_model is None:
+        settings_model = SettingsModel()
+        settings_model.load()
+        sound_manager = get_sound_manager(settings_model) # shared, sounds are loaded once per process
+    if preloader is not None:
+        start_preloading(preloader, sound_manager)
+
     model  = MenuModel()
     clock  = pygame.time.Clock()
+    idle   = IdleRedraw() # draw only when something changed, sleep in between
+    items  = menu_layout(fonts, tuple(model.menu_items)).items # hit-tested where they are drawn
 
     sound_manager.play_music('menu', loops=-1, fade_ms=2000) # Play menu music with fade-in
 
     running = True
 
     while running: # loop reads events, updates model, draws view
-        for event in pygame.event.get():
+        for event in idle.get_events():
             if _global_quit(event, screen, model):
                 print("Global quit confirmed from main menu")
                 sound_manager.stop_music(fade_ms=1000) # Fade out music over 1 second
@@ -44,7 +58,7 @@ def main_menu_loop(screen: pygame.Surface,
                     if model.selected_index == 0:
                         print ("Starting Game from enter/space key")
                         sound_manager.stop_music(fade_ms=500) # Fade out menu music quickly
-                        run_game(screen, model, settings_model, sound_manager)  # Pass sound_manager
+                        run_game(screen, model, settings_model, sound_manager, preloader)  # Pass sound_manager
                         # Restart menu music when returning
                         sound_manager.play_music('menu', loops=-1, fade_ms=2000) # Play menu music with fade-in
                     else:
@@ -53,33 +67,27 @@ def main_menu_loop(screen: pygame.Surface,
             # this if handles the input from the keyboard (UP/W and DOWN/S to navigate, ENTER/SPACE to select)
             
             elif event.type == pygame.MOUSEMOTION: # mouse hover detection
-                mx, my = event.pos # get mouse position
-                line_h = SCREEN_HEIGHT * 0.1
-                for i in range(len(model.menu_items)):
-                    cy = SCREEN_HEIGHT * 0.4 + i * line_h  # Center y of each menu item
-                    if abs(my - cy) < line_h * 0.4:  # Within 40% of line height
-                        model.selected_index = i  # Update selection on hover
-                        break
+                hovered = items.hit_test(event.pos) # index of the item under the mouse, -1 if none
+                if hovered >= 0:
+                    model.selected_index = hovered  # Update selection on hover
 
             elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-                # simple click detection using View-computed rects
-                mx, my = event.pos
-                line_h = SCREEN_HEIGHT*0.1
-                for i in range(len(model.menu_items)):
-                    cy = SCREEN_HEIGHT*0.4 + i*line_h # compute center y of each menu item, i.e. new game and options
-                    if abs(my - cy) < line_h*0.4: # checks if the mouse y is close enough to the center of the item
-                        # within 40% of the line height
-                        model.selected_index = i
-                        if i == 0:
-                            print ("Starting Game from Mouse Click")
+                # click detection using the rects the View draws the items in
+                clicked = items.hit_test(event.pos)
+                if clicked >= 0:
+                    model.selected_index = clicked
+                    if clicked == 0:
+                        print ("Starting Game from Mouse Click")
 
-                            sound_manager.stop_music(fade_ms=500) # Fade out menu music quickly
-                            run_game(screen, model, settings_model, sound_manager)  # Pass sound_manager
-                            # Restart menu music when returning
-                            sound_manager.play_music('menu', loops=-1, fade_ms=2000) # Play menu music with fade-in
-                        else:
-                            print ("Opening Options from Mouse Click")
-                            run_options(screen, model, background_surf, background_rect, fonts, settings_model, sound_manager)
-            # this if handles the input from the mouse left click with an approximate hitbox
-        draw_menu(screen, model, background_surf, background_rect, fonts) # draw the menu
+                        sound_manager.stop_music(fade_ms=500) # Fade out menu music quickly
+                        run_game(screen, model, settings_model, sound_manager, preloader)  # Pass sound_manager
+                        # Restart menu music when returning
+                        sound_manager.play_music('menu', loops=-1, fade_ms=2000) # Play menu music with fade-in
+                    else:
+                        print ("Opening Options from Mouse Click")
+                        run_options(screen, model, background_surf, background_rect, fonts, settings_model, sound_manager)
+            # this if handles the input from the mouse left click
+        idle.watch(model.selected_index)
+        if idle.should_draw():
+            draw_menu(screen, model, background_surf, background_rect, fonts) # draw the menu
         clock.tick(60) # limit to 60 FPS
\ No newline at end of file
@@ -1,19 +1,19 @@
 import pygame
 from ..Model.menu_model import MenuModel
-from ..View.menu_view import draw_modal
-from ..Utilities.constants import SCREEN_WIDTH, SCREEN_HEIGHT
+from ..View.menu_view import draw_modal, quit_modal
+from ..View.backdrop_view import build_backdrop, DIALOG_DARKEN
+from ..Utilities.idle_redraw import IdleRedraw
 
 def show_confirm_quit(screen: pygame.Surface, model: MenuModel) -> bool:
     # Returns True if user confirmed quit, False otherwise
     clock = pygame.time.Clock()
-    background_copy = screen.copy() # Create a copy of the current screen to blur later
-    small_size = (screen.get_width() // 3, screen.get_height() // 3) # Reduce size for faster blurring
-    blurred = pygame.transform.smoothscale(background_copy, small_size) 
-    blurred = pygame.transform.smoothscale(blurred, screen.get_size())
-    # scales down the background image, which is a screen of the current game 
+    blurred = build_backdrop(screen, darken=DIALOG_DARKEN)
+    # blurred and darkened copy of the current screen, built once for the whole dialog
+    idle = IdleRedraw()
+    modal = quit_modal() # Yes/No buttons, hit-tested where they are drawn
     
     while True: 
-        for event in pygame.event.get():
+        for event in idle.get_events():
             if event.type == pygame.QUIT:
                 return True # User closed the window
             elif event.type == pygame.KEYDOWN:
@@ -29,25 +29,17 @@ def show_confirm_quit(screen: pygame.Surface, model: MenuModel) -> bool:
                 elif event.key == pygame.K_ESCAPE:
                     return False        
             elif event.type == pygame.MOUSEMOTION: # Update selection based on mouse position
-                yes_rect = pygame.Rect(0, 0, 140, 50)
-                no_rect = pygame.Rect(0, 0, 140, 50)
-                box_y = SCREEN_HEIGHT//2 + int(SCREEN_HEIGHT*0.35*0.15)
-                yes_rect.center = (SCREEN_WIDTH//2 - 110, box_y)
-                no_rect.center = (SCREEN_WIDTH//2 + 110, box_y)
-                # define buttons for yes and no selection
-                if yes_rect.collidepoint(event.pos):
-                    model.modal_selected_button = 0 # Yes button selected
-                elif no_rect.collidepoint(event.pos):
-                    model.modal_selected_button = 1 # No button selected
+                hovered = modal.hit_test(event.pos) # 0 = Yes, 1 = No, -1 = neither
+                if hovered >= 0:
+                    model.modal_selected_button = hovered
             elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
                 return model.modal_selected_button == 0 # Confirm selection on left mouse click
-        
-        screen.blit(blurred, (0, 0)) # Draw the blurred background
-        overlay = pygame.Surface(screen.get_size(), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 150))
-        screen.blit(overlay, (0, 0)) # Darken the background
-        draw_modal(screen, model.modal_selected_button) # Draw the modal dialog
-        pygame.display.flip() # Update the display
+
+        idle.watch(model.modal_selected_button)
+        if idle.should_draw():
+            screen.blit(blurred, (0, 0)) # Draw the blurred, darkened background
+            draw_modal(screen, model.modal_selected_button, darken=False) # Draw the modal dialog
+            pygame.display.flip() # Update the display
         clock.tick(60)
 
 def _global_quit(event: pygame.event.Event, screen: pygame.Surface, model: MenuModel) -> bool:
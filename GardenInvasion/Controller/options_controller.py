@@ -5,23 +5,23 @@ from .menu_controller_utilities import show_confirm_quit
 from ..Model.menu_model import MenuModel
 from ..Model.options_model import OptionsModel, VolumeModel
 from ..Model.setting_volume_model import SettingsModel
-from ..View.options_view import draw_options_menu, draw_contact_modal, draw_volume_menu
-from ..Utilities.constants import SCREEN_WIDTH, SCREEN_HEIGHT
+from ..View.options_view import draw_options_menu, draw_contact_modal, draw_volume_menu, options_layout, volume_layout, contact_modal
+from ..View.backdrop_view import build_backdrop, DIALOG_DARKEN
 from .skin_selection_controller import run_skin_selection
 from ..Model.sound_manager_model import SoundManager
+from ..Utilities.idle_redraw import IdleRedraw
 
 # Function to show the contact confirmation modal when "Contact Us" is selected in the options menu
 def show_contact_confirmation(screen: pygame.Surface, options_model: OptionsModel) -> bool:
     clock = pygame.time.Clock()
-    background_copy = screen.copy()
-    small_size = (screen.get_width() // 3, screen.get_height() // 3)
-    blurred = pygame.transform.smoothscale(background_copy, small_size)
-    blurred = pygame.transform.smoothscale(blurred, screen.get_size())
-    # create a blurred background screen for the pop up regarding the contact us option
+    blurred = build_backdrop(screen, darken=DIALOG_DARKEN)
+    # create a blurred, darkened background screen for the pop up regarding the contact us option
     options_model.modal_selected_button = 0 # set default selected button to "Open Email Client"
+    idle = IdleRedraw()
+    modal = contact_modal() # "Open Email" and "Back" buttons, hit-tested where they are drawn
     
     while True:
-        for event in pygame.event.get():
+        for event in idle.get_events():
             if event.type == pygame.QUIT: # Handle quit event
                 #print ("Quit event detected in contact confirmation modal")
                 return False
@@ -41,28 +41,18 @@ def show_contact_confirmation(screen: pygame.Surface, options_model: OptionsMode
                     return False
                 
             elif event.type == pygame.MOUSEMOTION: # Handle mouse hover over buttons
-                open_rect = pygame.Rect(0, 0, 120, 45)
-                back_rect = pygame.Rect(0, 0, 120, 45)
-                box_height = int(SCREEN_HEIGHT * 0.4)
-                buttons_y = SCREEN_HEIGHT // 2 + int(box_height * 0.23)
-
-                open_rect.center = (SCREEN_WIDTH // 2 - 80, buttons_y) # "Open Email" button to the left
-                back_rect.center = (SCREEN_WIDTH // 2 + 80, buttons_y) # "Back" button to the right
-
-                if open_rect.collidepoint(event.pos):
-                    options_model.modal_selected_button = 0 # Hovering over "Open Email Client"
-                elif back_rect.collidepoint(event.pos):
-                    options_model.modal_selected_button = 1 # Hovering over "Back"
+                hovered = modal.hit_test(event.pos) # 0 = "Open Email Client", 1 = "Back", -1 = neither
+                if hovered >= 0:
+                    options_model.modal_selected_button = hovered
 
             elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
                 return options_model.modal_selected_button == 0 # Return True if "Open Email Client" is selected
 
-        screen.blit(blurred, (0, 0))
-        overlay = pygame.Surface(screen.get_size(), pygame.SRCALPHA) 
-        overlay.fill((0, 0, 0, 150))
-        screen.blit(overlay, (0, 0)) # Darken the background
-        draw_contact_modal(screen, options_model.modal_selected_button)
-        pygame.display.flip()
+        idle.watch(options_model.modal_selected_button)
+        if idle.should_draw():
+            screen.blit(blurred, (0, 0)) # already darkened
+            draw_contact_modal(screen, options_model.modal_selected_button, darken=False)
+            pygame.display.flip()
         clock.tick(60)
 
 # Function to run the volume menu, allowing the user to adjust the volume in real-time and see immediate feedback
@@ -72,10 +62,12 @@ def run_volume_menu(screen: pygame.Surface, model: MenuModel, background_surf, b
                     settings_model: SettingsModel) -> int:
     volume_model = VolumeModel(initial_volume) # Initialize volume model with the current volume
     clock = pygame.time.Clock()
+    idle = IdleRedraw()
+    back_button = volume_layout(fonts).back # hit-tested where it is drawn
     running = True
     
     while running:
-        for event in pygame.event.get():
+        for event in idle.get_events():
             if event.type == pygame.QUIT:
                 # Show quit confirmation
                 print ("'X' Click detected, global quit shown in volume submenu")
@@ -105,21 +97,14 @@ def run_volume_menu(screen: pygame.Surface, model: MenuModel, background_surf, b
                         pygame.quit()
                         sys.exit()
                         
-            if event.type == pygame.MOUSEMOTION:
-                # Get back button rect for hover detection
-                back_rect = pygame.Rect(0, 0, 60, 30)
-                back_rect.center = (SCREEN_WIDTH * 0.5, SCREEN_HEIGHT * 0.61)
-                    
             if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-                # Get back button rect for click detection
-                back_rect = pygame.Rect(0, 0, 60, 30)
-                back_rect.center = (SCREEN_WIDTH * 0.5, SCREEN_HEIGHT * 0.61)
-                
-                if back_rect.collidepoint(event.pos):
+                if back_button.hit_rect.collidepoint(event.pos):
                     print ("Back button clicked in volume menu, exiting volume menu")
                     running = False # Exit volume menu
-        back_rect = draw_volume_menu(screen, volume_model, background_surf, background_rect, fonts)
-        pygame.display.flip()
+        idle.watch(volume_model.volume)
+        if idle.should_draw():
+            draw_volume_menu(screen, volume_model, background_surf, background_rect, fonts)
+            pygame.display.flip()
         clock.tick(60)
     
     return volume_model.volume
@@ -138,10 +123,11 @@ def run_options(screen: pygame.Surface,
     clock = pygame.time.Clock()
     running = True
     
-    label_rects = [] # Store label_rects from draw
+    items = options_layout(fonts, tuple(options_model.options_items)).items # hit-tested where they are drawn
+    idle = IdleRedraw()
     
     while running:
-        for event in pygame.event.get():
+        for event in idle.get_events():
             if event.type == pygame.QUIT:
                 print("'X' click detected in options menu, global quit shown")
                 if show_confirm_quit(screen, model):
@@ -190,52 +176,48 @@ def run_options(screen: pygame.Surface,
             
             # Mouse hover detection to highlight options
             elif event.type == pygame.MOUSEMOTION:
-                mx, my = event.pos
-                # Check which option is being hovered over
-                for i, rect in enumerate(label_rects):
-                    if rect.collidepoint(event.pos):
-                        options_model.selected_index = i  # Highlight hovered option
-                        break
+                hovered = items.hit_test(event.pos) # Check which option is being hovered over
+                if hovered >= 0:
+                    options_model.selected_index = hovered  # Highlight hovered option
             
-            # Use actual label_rects from view for click detection
+            # Use the rects the view draws the options in for click detection
             elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-                mx, my = event.pos
-                # Check which option was clicked using actual rects
-                for i, rect in enumerate(label_rects):
-                    if rect.collidepoint(event.pos):
-                        options_model.selected_index = i
-                        
-                        if i == 0:  # Volume
-                            print("Volume option clicked, opening volume menu")
-                            options_model.volume = run_volume_menu(screen, model, background_surf, background_rect, fonts, options_model.volume, sound_manager, settings_model)
-                            settings_model.volume = options_model.volume
-                            settings_model.save()
+                # Check which option was clicked
+                clicked = items.hit_test(event.pos)
+                if clicked >= 0:
+                    options_model.selected_index = clicked
+                    
+                    if clicked == 0:  # Volume
+                        print("Volume option clicked, opening volume menu")
+                        options_model.volume = run_volume_menu(screen, model, background_surf, background_rect, fonts, options_model.volume, sound_manager, settings_model)
+                        settings_model.volume = options_model.volume
+                        settings_model.save()
 
-                        elif i == 1:  # Skin Personalization
-                            print("Skin Personalization clicked, opening skin selector")
-                            result = run_skin_selection(screen, model, background_surf, background_rect, fonts, settings_model)
-                            if result == 'main_menu':
-                                print("Skin selected, returning to main menu")
-                                running = False
+                    elif clicked == 1:  # Skin Personalization
+                        print("Skin Personalization clicked, opening skin selector")
+                        result = run_skin_selection(screen, model, background_surf, background_rect, fonts, settings_model)
+                        if result == 'main_menu':
+                            print("Skin selected, returning to main menu")
+                            running = False
 
-                        elif i == 2:  # Contact Us
-                            print("Contact Us option clicked, showing contact confirmation modal")
-                            if show_contact_confirmation(screen, options_model):
-                                email = "GardenInvasion@email.com"
-                                mailto_url = "mailto:" + email
-                                webbrowser.open(mailto_url)
-                                print(f"Click detected. Opening email client with URL: {mailto_url}")
-                            else:
-                                print("Contact Us confirmation modal closed without opening email client")
+                    elif clicked == 2:  # Contact Us
+                        print("Contact Us option clicked, showing contact confirmation modal")
+                        if show_contact_confirmation(screen, options_model):
+                            email = "GardenInvasion@email.com"
+                            mailto_url = "mailto:" + email
+                            webbrowser.open(mailto_url)
+                            print(f"Click detected. Opening email client with URL: {mailto_url}")
+                        else:
+                            print("Contact Us confirmation modal closed without opening email client")
 
-                        elif i == 3:  # Back
-                            print("Back option clicked, exiting options menu")
-                            running = False
-                        break
+                    elif clicked == 3:  # Back
+                        print("Back option clicked, exiting options menu")
+                        running = False
                 if not running: # Exit the loop if "Back" was clicked
                     break
         
-        # Get actual label_rects from view
-        label_rects = draw_options_menu(screen, options_model, background_surf, background_rect, fonts)
-        pygame.display.flip()
+        idle.watch(options_model.selected_index)
+        if idle.should_draw():
+            draw_options_menu(screen, options_model, background_surf, background_rect, fonts)
+            pygame.display.flip()
         clock.tick(60)
\ No newline at end of file
@@ -2,8 +2,9 @@ import pygame
 from ..Model.projectile_model import Projectile
 from ..Model.sound_manager_model import SoundManager
 
-def handle_player_input(player, projectile_group, sound_manager:SoundManager=None):
-    keys = pygame.key.get_pressed()
+def handle_player_input(player, projectile_group, sound_manager:SoundManager=None, projectile_pool=None, keys=None):
+    if keys is None: # no injected key state, read the keyboard
+        keys = pygame.key.get_pressed()
     if keys[pygame.K_LEFT] or keys[pygame.K_a]:
         player.move_left()
     if keys[pygame.K_RIGHT] or keys[pygame.K_d]:
@@ -11,8 +12,13 @@ def handle_player_input(player, projectile_group, sound_manager:SoundManager=Non
     # move the plant left or right based on key press
 
     if player.can_shoot(): # check if the player can shoot based on cooldown
-        projectile = Projectile(player.rect.midtop) # create a new projectile at the top center of the player
-        projectile_group.add(projectile) # add the new projectile to the group
+        if projectile_pool: # reuse a pooled projectile at the top center of the player
+            projectile = projectile_pool.acquire(player.rect.midtop, projectile_group)
+            if projectile is None:
+                return # pool is full, no shot this time
+        else:
+            projectile = Projectile(player.rect.midtop) # create a new projectile at the top center of the player
+            projectile_group.add(projectile) # add the new projectile to the group
 
         if sound_manager: # play shooting sound if sound manager is provided
             sound_manager.play_sound('plant_shoot') # play plant shooting sound effect
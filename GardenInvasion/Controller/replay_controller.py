@@ -0,0 +1,55 @@
+import os
+import sys
+import time
+import pygame
+from ..Model.setting_volume_model import SettingsModel
+from ..Utilities.input_log import read_input_log, decode_keys, InputLog
+from .simulation_controller import GameSimulation, KeyState
+
+
+def replay_input_log(log, max_ticks: int = None) -> GameSimulation:
+    # Replay a recorded game headlessly, as fast as possible.
+    # log = InputLog or path of a log written by run_game. The simulation is rebuilt with
+    # the recorded seed, step length, skin and game mode (wave file, endless, horde), then
+    # every tick gets the recorded key state, so the match unfolds exactly as it was played
+    # (a custom wave file must still be at the recorded path). Returns the simulation at the end
+    if not isinstance(log, InputLog):
+        log = read_input_log(log)
+
+    # sprites must load with their real sizes for collisions to match the recorded game:
+    # a 1x1 hidden display is enough (use SDL_VIDEODRIVER=dummy on machines without one)
+    if not pygame.get_init():
+        pygame.init()
+    if not pygame.display.get_surface():
+        pygame.display.set_mode((1, 1))
+
+    settings_model = SettingsModel()
+    settings_model.player_skin = log.skin_id
+    simulation = GameSimulation(settings_model, dt_ms=log.dt_ms, seed=log.seed, waves=log.waves,
+                                horde=log.horde, endless=log.endless)
+
+    key_states = {} # one KeyState per distinct mask, reused across ticks
+    for mask in log.masks():
+        keys = key_states.get(mask)
+        if keys is None:
+            keys = key_states[mask] = KeyState(decode_keys(mask))
+        simulation.step(keys) # ESC is in the log but pausing doesn't advance game time
+        if simulation.is_over() or (max_ticks is not None and simulation.ticks >= max_ticks):
+            break
+    return simulation
+
+
+if __name__ == "__main__":
+    # python -m GardenInvasion.Controller.replay_controller <input log>
+    if len(sys.argv) != 2:
+        print("usage: python -m GardenInvasion.Controller.replay_controller <input log>")
+        sys.exit(2)
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+    started = time.perf_counter()
+    result = replay_input_log(sys.argv[1])
+    elapsed = time.perf_counter() - started
+    outcome = "victory" if result.victory else "plant destroyed" if result.plant_destroyed else "interrupted"
+    print(f"Replayed {result.ticks} ticks in {elapsed:.2f}s ({result.ticks / max(elapsed, 1e-9):.0f} ticks/s), "
+          f"wave {result.wave_manager.current_wave}, {outcome}")
@@ -0,0 +1,200 @@
+import pygame
+from ..Utilities.constants import SCREEN_WIDTH, SCREEN_HEIGHT
+from ..Utilities.game_clock import LogicalClock, FIXED_DT_MS
+from ..Utilities.spatial_grid import SpatialGrid, pair_checks
+from ..Utilities.game_rng import GameRng
+from ..Utilities.frame_profiler import FrameProfiler
+from ..Utilities.scheduler import Scheduler
+from ..Model.plant_model import Player
+from ..Model.projectile_model import Projectile
+from ..Model.projectile_pool_model import ProjectilePool
+from ..Model.wallnut_model import WallNutManager
+from ..Model.wave_model import WaveManager
+from ..Model.endless_wave_model import EndlessWaveManager
+from ..Model.PowerUp_model import PowerUpManager
+from ..Model.setting_volume_model import SettingsModel
+from ..Model.sound_manager_model import SoundManager
+from .plant_controller import handle_player_input
+from .wallnut_controller import handle_wallnut_placement
+from .collision_controller import (
+    _handle_projectile_zombie_collisions,
+    _handle_zombie_projectile_plant_collisions,
+    _handle_zombie_projectile_wallnut_collisions,
+    _handle_zombie_plant_collisions,
+    _handle_zombie_wallnut_collisions,
+    _handle_powerup_collection,
+)
+
+PLAYER_START_POS = (SCREEN_WIDTH // 2, SCREEN_HEIGHT * 0.95)
+
+
+class KeyState:
+    # Key state for a simulation step, readable like pygame.key.get_pressed()
+
+    def __init__(self, pressed=()):
+        self.pressed = set(pressed)
+
+    def __getitem__(self, key) -> bool:
+        return key in self.pressed
+
+
+NO_KEYS = KeyState()
+
+
+class GameSimulation:
+    # Gameplay of one match (player, wall-nuts, waves, power-ups and collisions)
+    # advanced in fixed steps on a logical clock: no window, no real time needed.
+    # run_game drives it once per frame, tests and batch runs can call step() in a loop
+
+    def __init__(self, settings_model: SettingsModel = None, sound_manager: SoundManager = None,
+                 clock: LogicalClock = None, dt_ms: float = FIXED_DT_MS, seed: int = None, rng: GameRng = None,
+                 profiler: FrameProfiler = None, waves=None, horde: bool = False, endless: bool = False):
+        self.clock = clock if clock is not None else LogicalClock()
+        self.dt_ms = dt_ms
+        # one random source per session, the seed is logged so any run can be replayed
+        self.rng = rng if rng is not None else GameRng(seed)
+        print(f"Game session seed: {self.rng.seed}")
+        # per-phase timing of step(), disabled unless one is passed in
+        self.profiler = profiler if profiler is not None else FrameProfiler(enabled=False)
+        self.sound_manager = sound_manager
+        self.ticks = 0 # steps done so far
+        # timed game events (wave countdown and phases, delayed zombies, power-up expiry), run once per step
+        self.scheduler = Scheduler(self.clock)
+
+        self.player = Player(PLAYER_START_POS, settings_model, clock=self.clock, scheduler=self.scheduler)
+        self.player_group = pygame.sprite.GroupSingle(self.player)
+        self.projectile_group = pygame.sprite.Group()
+        self.projectile_pool = ProjectilePool(Projectile, max_size=32, prewarm=8)
+
+        # wall-nut manager with 4 wall-nut slots
+        self.wallnut_manager = WallNutManager(
+            player_position=PLAYER_START_POS,
+            screen_width=SCREEN_WIDTH,
+            screen_height=SCREEN_HEIGHT,
+            sound_manager=sound_manager
+        )
+        self.wallnut_manager.place_all_wallnuts()
+
+        self.powerup_manager = PowerUpManager(rng=self.rng.drops)
+        self.powerup_group = self.powerup_manager.powerup_group
+
+        # waves = WaveSchedule or wave file path, the campaign by default;
+        # horde = vectorized zombie backend (NumPy) for very large waves;
+        # endless = generated waves without end instead of the wave file
+        if endless:
+            self.wave_manager = EndlessWaveManager(clock=self.clock, rng=self.rng.spawns,
+                                                   scheduler=self.scheduler, horde=horde)
+        else:
+            self.wave_manager = WaveManager(clock=self.clock, rng=self.rng.spawns, schedule=waves,
+                                            scheduler=self.scheduler, horde=horde)
+        self.wave_manager.start_first_wave()
+
+        # one broadphase index shared by all the collision passes of a step
+        self.collision_grid = SpatialGrid()
+
+        self.plant_destroyed = False
+        self.victory = False
+
+    def step(self, keys=None) -> bool:
+        # Advance the game by one fixed step. keys = KeyState (or get_pressed() result),
+        # None reads the keyboard. Returns True when the match is over
+        self.clock.advance(self.dt_ms)
+        self.ticks += 1
+        lap = self.profiler.lap
+        self.scheduler.run_due()
+        lap('scheduler')
+
+        if keys is None:
+            keys = pygame.key.get_pressed()
+        handle_player_input(self.player, self.projectile_group, self.sound_manager, self.projectile_pool, keys)
+        handle_wallnut_placement(keys, self.wallnut_manager)
+        lap('input')
+
+        # Update all entities
+        self.player_group.update()
+        lap('update_player')
+        self.projectile_group.update()
+        lap('update_projectiles')
+        self.wallnut_manager.update()
+        lap('update_wallnuts')
+        self.wave_manager.update()
+        lap('update_waves')
+        self.powerup_manager.update()
+        lap('update_powerups')
+
+        # index the groups that get hit once, every pass below queries the same grid.
+        # Power-ups are left out: drops spawned by this step's kills must be collectable
+        # right away, and the grid falls back to pygame for groups it doesn't index.
+        # On a campaign-sized field the passes are cheaper than the index: rebuild() skips it
+        grid = self.collision_grid
+        zombies = self.wave_manager.zombie_group
+        zombie_projectiles = self.wave_manager.zombie_projectile_group
+        wallnuts = self.wallnut_manager.get_wallnuts()
+        grid.rebuild(
+            zombies,
+            zombie_projectiles,
+            wallnuts,
+            checks=pair_checks(
+                (self.projectile_group, zombies),
+                (self.player_group, zombie_projectiles),
+                (zombie_projectiles, wallnuts),
+                (self.player_group, zombies),
+                (zombies, wallnuts)
+            )
+        )
+        lap('collision_grid')
+
+        _handle_projectile_zombie_collisions(
+            self.projectile_group,
+            self.wave_manager.zombie_group,
+            self.sound_manager,
+            self.powerup_manager,
+            grid,
+            self.rng.drops
+        )
+        lap('collide_projectile_zombie')
+        plant_destroyed_by_projectile = _handle_zombie_projectile_plant_collisions(
+            self.wave_manager.zombie_projectile_group,
+            self.player,
+            self.sound_manager,
+            grid
+        )
+        lap('collide_zombie_projectile_plant')
+        _handle_zombie_projectile_wallnut_collisions(
+            self.wave_manager.zombie_projectile_group,
+            self.wallnut_manager,
+            self.sound_manager,
+            grid
+        )
+        lap('collide_zombie_projectile_wallnut')
+        plant_destroyed_by_zombie = _handle_zombie_plant_collisions(
+            self.wave_manager.zombie_group,
+            self.player,
+            self.sound_manager,
+            grid
+        )
+        lap('collide_zombie_plant')
+        _handle_zombie_wallnut_collisions(
+            self.wave_manager.zombie_group,
+            self.wallnut_manager,
+            self.sound_manager,
+            grid
+        )
+        lap('collide_zombie_wallnut')
+        _handle_powerup_collection(self.player, self.powerup_group, self.wallnut_manager, grid)
+        lap('powerup_pickup')
+
+        # Combined plant destruction check (from any source)
+        self.plant_destroyed = plant_destroyed_by_projectile or plant_destroyed_by_zombie
+        self.victory = self.wave_manager.is_victory()
+        return self.is_over()
+
+    def is_over(self) -> bool:
+        return self.plant_destroyed or self.victory
+
+    def run(self, max_ticks: int, keys=NO_KEYS) -> int:
+        # Step until the match is over or max_ticks steps are done, returns the steps done
+        for _ in range(max_ticks):
+            if self.step(keys):
+                break
+        return self.ticks
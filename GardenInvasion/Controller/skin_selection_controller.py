@@ -3,8 +3,9 @@ import sys
 from ..Model.menu_model import MenuModel
 from ..Model.skin_selection_model import SkinSelectionModel
 from ..Model.setting_volume_model import SettingsModel
-from ..View.skin_selection_view import draw_skin_selection_menu
+from ..View.skin_selection_view import draw_skin_selection_menu, layout_for
 from .menu_controller_utilities import show_confirm_quit
+from ..Utilities.idle_redraw import IdleRedraw
 
 
 def run_skin_selection(screen: pygame.Surface,
@@ -22,10 +23,11 @@ def run_skin_selection(screen: pygame.Surface,
     clock = pygame.time.Clock()
     running = True
     return_to = 'back'  # Default: return to options menu
-    back_rect = None # To store the Back button rect for mouse interaction
+    layout = layout_for(skin_model, fonts) # previews and Back button, hit-tested where they are drawn
+    idle = IdleRedraw()
     
     while running:
-        for event in pygame.event.get():
+        for event in idle.get_events():
             # Handle universal quit via X button
             if event.type == pygame.QUIT:
                 print("'X' click detected in skin selection menu, global quit shown")
@@ -85,58 +87,42 @@ def run_skin_selection(screen: pygame.Surface,
             
             # Handle mouse hover to highlight skins
             elif event.type == pygame.MOUSEMOTION:
-                mx, my = event.pos # Mouse coordinates
-
-                if back_rect and back_rect.collidepoint(event.pos):
+                if layout.back.hit_rect.collidepoint(event.pos):
                     skin_model.select_back_button()
                 else:
                     skin_model.deselect_back_button()
                     
                     # Check if hovering over any skin
-                    total_skins = skin_model.get_total_skins()
-                    spacing = screen.get_width() * 0.7 / (total_skins + 1)
-                    start_x = screen.get_width() * 0.15
-                    
-                    for i in range(total_skins): # Iterate through skins
-                        x = start_x + spacing * (i + 1)
-                        y = screen.get_height() * 0.45
-                        if abs(mx - x) < 50 and abs(my - y) < 50: # Within preview bounds
-                            skin_model.selected_index = i
-                            break # Stop checking after first match
+                    hovered = layout.previews.hit(event.pos)
+                    if hovered >= 0: # Within preview bounds
+                        skin_model.selected_index = hovered
             
             elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1: # Left click
-                mx, my = event.pos
-                # Use the actual back_rect from view
-                if back_rect and back_rect.collidepoint(event.pos):
+                # Use the Back button where the view draws it
+                if layout.back.hit_rect.collidepoint(event.pos):
                     print("Back button clicked, returning to options")
                     return_to = 'back'
                     running = False
                     break
                 # Check if player clicked on a skin preview
-                total_skins = skin_model.get_total_skins()
-                spacing = screen.get_width() * 0.7 / (total_skins + 1)
-                start_x = screen.get_width() * 0.15
-                
-                for i in range(total_skins):
-                    x = start_x + spacing * (i + 1)
-                    y = screen.get_height() * 0.45
-                    # Check if click is within preview bounds
-                    if abs(mx - x) < 50 and abs(my - y) < 50:
-                        skin_model.selected_index = i
-                        skin_model.current_skin_id = skin_model.available_skins[i].skin_id
-                        
-                        # Confirm selection immediately on click
-                        selected_skin = skin_model.get_selected_skin()
-                        settings_model.player_skin = selected_skin.skin_id
-                        settings_model.save()
-                        print(f"Mouse click: Skin changed to {selected_skin.display_name}")
-                        return_to = 'main_menu'
-                        running = False
-                        break
+                clicked = layout.previews.hit(event.pos)
+                if clicked >= 0:
+                    skin_model.selected_index = clicked
+                    skin_model.current_skin_id = skin_model.available_skins[clicked].skin_id
+                    
+                    # Confirm selection immediately on click
+                    selected_skin = skin_model.get_selected_skin()
+                    settings_model.player_skin = selected_skin.skin_id
+                    settings_model.save()
+                    print(f"Mouse click: Skin changed to {selected_skin.display_name}")
+                    return_to = 'main_menu'
+                    running = False
+                    break
         
-        # Draw and get the actual back_rect
-        back_rect = draw_skin_selection_menu(screen, skin_model, background_surf, background_rect, fonts)
-        pygame.display.flip()
+        idle.watch(skin_model.selected_index, skin_model.back_button_selected)
+        if idle.should_draw():
+            draw_skin_selection_menu(screen, skin_model, background_surf, background_rect, fonts)
+            pygame.display.flip()
         clock.tick(60)
         
     return return_to
@@ -1,8 +1,11 @@
-import os
 import pygame
 import random
 from .zombie_projectile_model import ZombieProjectile
 from .wallnut_model import WallNutManager
+from ..Utilities.asset_cache import asset_cache, image_path
+
+INCREASE_FIRE_SPRITE = image_path("IncreaseFirePU.png")
+REPAIR_WALLNUT_SPRITE = image_path("RepairWallnutPU.png")
 
 _ZOMBIE_PROJECTILE_SIZE = None
 
@@ -17,6 +20,16 @@ def get_zombie_projectile_size(): # helper to get the size of zombie projectiles
                     
     return _ZOMBIE_PROJECTILE_SIZE
 
+def _load_powerup_image(path, target_size, color):
+    # shared, already scaled power-up image, or a colored square if it can't be loaded
+    try:
+        return asset_cache.get_image(path, target_size)
+    except (pygame.error, FileNotFoundError):
+        print(f"Warning: Could not load sprite {path}, using colored surface")
+        image = pygame.Surface(target_size or (30, 30))
+        image.fill(color)
+        return image
+
 class PowerUp(pygame.sprite.Sprite):
     # Base class for power-ups dropped in the game world.
 
@@ -41,9 +54,8 @@ class PowerUp(pygame.sprite.Sprite):
 class IncreasingFirePU(PowerUp):
 
     def __init__(self, pos, duration_ms: int = 5000, cooldown_multiplier: float = 0.6, target_size=None):
-        img_path = os.path.join("GardenInvasion", "Assets", "images", "IncreaseFirePU.png")
-        image = pygame.image.load(img_path).convert_alpha()
-        super().__init__(pos, image, target_size=target_size)
+        image = _load_powerup_image(INCREASE_FIRE_SPRITE, target_size, (255, 140, 0))
+        super().__init__(pos, image)
 
         self.duration_ms = duration_ms
         self.cooldown_multiplier = cooldown_multiplier
@@ -58,9 +70,8 @@ class IncreasingFirePU(PowerUp):
 class RepairWallnutPU(PowerUp):
     
     def __init__(self, pos, target_size=None):
-        img_path = os.path.join("GardenInvasion", "Assets", "images", "RepairWallnutPU.png")
-        image = pygame.image.load(img_path).convert_alpha()
-        super().__init__(pos, image, target_size=target_size)
+        image = _load_powerup_image(REPAIR_WALLNUT_SPRITE, target_size, (139, 90, 43))
+        super().__init__(pos, image)
 
     def apply(self, wallnut_manager) -> None:
         wallnut_manager.repair_all_wallnuts()
@@ -68,9 +79,15 @@ class RepairWallnutPU(PowerUp):
 class PowerUpManager:
     # Small helper to spawn and keep track of power-ups.
 
-    def __init__(self):
+    def __init__(self, rng=None):
         self.powerup_group = pygame.sprite.Group()
+        self.rng = rng if rng is not None else random # random.Random for the drop type, e.g. GameRng.drops
         self.target_size = get_zombie_projectile_size()
+        # build both drop images now, so the first drop of a wave doesn't hit the disk
+        asset_cache.preload([
+            (INCREASE_FIRE_SPRITE, self.target_size),
+            (REPAIR_WALLNUT_SPRITE, self.target_size),
+        ])
 
     def spawn_increasing_fire(self, pos):
         self.powerup_group.add(IncreasingFirePU(pos, target_size=self.target_size))
@@ -79,7 +96,7 @@ class PowerUpManager:
         self.powerup_group.add(RepairWallnutPU(pos, target_size=self.target_size))
 
     def spawn_random_powerup(self, pos): # Randomly decide which power-up to spawn at the given position
-        if random.random() < 0.5:
+        if self.rng.random() < 0.5:
             self.spawn_increasing_fire(pos)
         else:
             self.spawn_repair_wallnut(pos)
@@ -0,0 +1,124 @@
+import math
+from collections import namedtuple
+from .wave_model import WaveManager
+from .wave_definition_model import SpawnEvent, WaveSchedule, SPAWN_POINTS
+from .movement_pattern_model import MOVEMENT_REGISTRY
+from .horde_model import supports_movement
+from ..Utilities.game_clock import get_ticks
+
+# Endless (survival) mode.
+# Waves never run out: wave N is generated when it starts, from difficulty curves
+# (zombie count, share of orange zombies, speed, shooting cooldown, time between bursts)
+# and the session's spawn stream, so the same seed plays the same waves.
+# Long sessions keep their frame rate: the zombies on the field are capped and, when the
+# cap is reached or frames run over budget, the rest of the wave waits (back-pressure)
+# instead of piling up. Slow frames never hold the field below MIN_ZOMBIES, a machine that
+# can't keep up still gets a game. With the horde backend dead zombie sprites are reused.
+
+MAX_ZOMBIES = 150        # zombies on the field at once, sprite backend
+HORDE_MAX_ZOMBIES = 2000 # with the horde backend
+MIN_ZOMBIES = 8          # below this many zombies slow frames don't hold spawns back
+MAX_WAVE_SPAWNS = 5000   # largest generated wave
+FRAME_BUDGET_MS = 1000 / 60
+FRAME_TIME_SMOOTHING = 0.1  # weight of the newest frame in the running average
+BACKPRESSURE_RETRY_MS = 250 # held back spawns try again after this long
+EARLY_MOVEMENTS = ('straight', 'zigzag') # the only patterns of the first two waves
+
+# difficulty of one wave
+WaveDifficulty = namedtuple('WaveDifficulty', ['spawns', 'orange_share', 'speed_scale',
+                                               'shoot_cooldown', 'burst_size', 'burst_interval'])
+
+
+def wave_difficulty(wave_number: int) -> WaveDifficulty:
+    # Difficulty curves: the count grows 25% a wave, the rest ramps up linearly to a ceiling
+    level = wave_number - 1
+    return WaveDifficulty(
+        spawns=min(int(4 * 1.25 ** level), MAX_WAVE_SPAWNS),
+        orange_share=min(0.1 + 0.05 * level, 0.6),
+        speed_scale=min(1 + 0.05 * level, 2.0),
+        shoot_cooldown=max(1000 - 40 * level, 350),
+        burst_size=min(2 + level // 2, 25),
+        burst_interval=max(1500 - 60 * level, 300),
+    )
+
+
+def generate_wave(wave_number: int, rng, movements: tuple = None) -> tuple:
+    # Spawn timeline of wave N (SpawnEvent by time, like a compiled wave file).
+    # movements: patterns to draw from, every registered one by default (patterns added
+    # with @movement_pattern included). Zombies come in bursts; the first waves only use
+    # the simple movement patterns
+    difficulty = wave_difficulty(wave_number)
+    if movements is None:
+        movements = tuple(MOVEMENT_REGISTRY)
+    if wave_number <= 2:
+        movements = tuple(name for name in movements if name in EARLY_MOVEMENTS) or movements
+    events = []
+    for i in range(difficulty.spawns):
+        zombie = 'orange' if rng.random() < difficulty.orange_share else 'red'
+        events.append(SpawnEvent(
+            (i // difficulty.burst_size) * difficulty.burst_interval,
+            zombie,
+            rng.choice(SPAWN_POINTS),
+            rng.choice(movements),
+            rng.randrange(0, 600, 100), # small stagger inside a burst
+        ))
+    return tuple(events)
+
+
+class EndlessWaveManager(WaveManager):
+    # WaveManager playing generated waves until the plant falls
+
+    def __init__(self, clock=None, rng=None, scheduler=None, horde=False, max_zombies: int = None,
+                 frame_budget_ms: float = FRAME_BUDGET_MS, min_zombies: int = MIN_ZOMBIES):
+        super().__init__(clock=clock, rng=rng, schedule=WaveSchedule((), "endless"), scheduler=scheduler, horde=horde)
+        self.total_waves = math.inf # no victory
+        if max_zombies is None:
+            max_zombies = HORDE_MAX_ZOMBIES if self.horde is not None else MAX_ZOMBIES
+        self.max_zombies = max_zombies
+        self.min_zombies = min_zombies
+        self.frame_budget_ms = frame_budget_ms
+        self.frame_time_ms = 0.0 # running average reported by the game loop, 0 = no reports
+        self.difficulty = None   # WaveDifficulty of the running wave
+        self.held_back = 0       # times the spawns were held back (stats)
+
+    def report_frame_time(self, frame_ms: float):
+        # Time the last frame took, fed by the game loop. Headless runs don't report
+        # and only the zombie cap holds spawns back, which keeps them replayable
+        self.frame_time_ms += (frame_ms - self.frame_time_ms) * FRAME_TIME_SMOOTHING
+
+    def _wave_timeline(self, wave_number) -> tuple:
+        self.difficulty = wave_difficulty(wave_number)
+        movements = tuple(MOVEMENT_REGISTRY)
+        if self.horde is not None:
+            movements = tuple(name for name in movements if supports_movement(name))
+        return generate_wave(wave_number, self.rng, movements)
+
+    def _spawn_allowed(self) -> bool:
+        on_field = len(self.zombie_group)
+        if on_field >= self.max_zombies:
+            return False
+        return on_field < self.min_zombies or self.frame_time_ms <= self.frame_budget_ms
+
+    def _spawn_due(self, current_time=None):
+        if current_time is None:
+            current_time = get_ticks(self.clock)
+        timeline = self.wave_timeline
+        if self.next_spawn < len(timeline) and not self._spawn_allowed():
+            # back-pressure: the rest of the wave moves later, the next spawn retries in a while
+            next_time = self.wave_start_time + timeline[self.next_spawn].time
+            if next_time <= current_time:
+                self.wave_start_time += current_time + BACKPRESSURE_RETRY_MS - next_time
+                self.held_back += 1
+        super()._spawn_due(current_time)
+
+    def _spawn_red(self, spawn_point, movement_pattern, wave_delay=0):
+        return self._apply_difficulty(super()._spawn_red(spawn_point, movement_pattern, wave_delay))
+
+    def _spawn_orange(self, spawn_point, movement_pattern='straight', wave_delay=0):
+        return self._apply_difficulty(super()._spawn_orange(spawn_point, movement_pattern, wave_delay))
+
+    def _apply_difficulty(self, zombie):
+        if zombie is not None and self.difficulty is not None:
+            zombie.speed_y = zombie.speed_y * self.difficulty.speed_scale
+            zombie.shoot_cooldown = self.difficulty.shoot_cooldown
+        return zombie
@@ -0,0 +1,268 @@
+import pygame
+from ..Utilities.constants import SCREEN_HEIGHT
+from ..Utilities.game_clock import get_ticks
+from .zombie_model import load_zombie_image
+from .movement_pattern_model import create_movement, StraightMovement, ZigzagMovement, RoamMovement
+
+try:
+    import numpy as np
+except ImportError: # optional dependency, the horde backend is unavailable without it
+    np = None
+
+# Structure-of-arrays zombie storage ("horde" backend of WaveManager).
+# Positions, accumulators, directions, speeds, bounds, movement kinds and health of every
+# zombie live in NumPy arrays and one update() moves the whole horde with vectorized
+# bounce logic, the same movement as Zombie.update() but without per-zombie branching.
+# Each zombie still has a light HordeZombie sprite (image + rect, synced after every
+# update) so draw_game, the collision handlers and the spatial grid work unchanged.
+# Sprites of dead zombies are kept and reused by the next spawns.
+
+HORDE_AVAILABLE = np is not None
+
+RED = (255, 0, 0)
+ORANGE = (255, 165, 0)
+
+# movement kinds the horde moves in bulk, parameters come from the pattern strategies
+STRAIGHT, ZIGZAG, ROAM = range(3)
+ZIGZAG_FLIP_FRAMES = ZigzagMovement.FLIP_FRAMES
+SHOOT_COOLDOWN = 1000  # ms, as Zombie.shoot_cooldown
+
+# per type: health, vertical speed, can shoot
+ZOMBIE_STATS = {
+    RED: (1, 2, False),
+    ORANGE: (2, 1.5, True),
+}
+
+
+def _movement_kind(movement) -> int:
+    # vectorized equivalent of a movement strategy
+    if isinstance(movement, ZigzagMovement):
+        return ZIGZAG
+    if isinstance(movement, RoamMovement):
+        return ROAM
+    if isinstance(movement, StraightMovement):
+        return STRAIGHT
+    raise ValueError(f"movement pattern {movement.name!r} is not supported by the horde backend")
+
+
+def supports_movement(name: str) -> bool:
+    # True if the horde can move zombies with the named (registered) pattern
+    try:
+        _movement_kind(create_movement(name, RED, 'A'))
+    except ValueError:
+        return False
+    return True
+
+
+class HordeZombie(pygame.sprite.Sprite):
+    # Sprite view of one horde zombie: image and rect for drawing and collisions,
+    # the rest of the state is read from the horde arrays
+
+    def __init__(self, horde, index: int, image: pygame.Surface, color, movement_pattern: str, spawn_point: str):
+        super().__init__()
+        self.horde = horde
+        self.reset(index, image, color, movement_pattern, spawn_point)
+
+    def reset(self, index: int, image: pygame.Surface, color, movement_pattern: str, spawn_point: str):
+        # (re)bind the sprite to a horde slot
+        self.index = index
+        self.image = image
+        self.rect = image.get_rect()
+        self.color = color
+        self.movement_pattern = movement_pattern
+        self.spawn_point = spawn_point
+
+    @property
+    def health(self) -> int:
+        return int(self.horde.health[self.index])
+
+    @health.setter
+    def health(self, value):
+        self.horde.health[self.index] = value
+
+    @property
+    def max_health(self) -> int:
+        return ZOMBIE_STATS[self.color][0]
+
+    @property
+    def active(self) -> bool:
+        return bool(self.horde.active[self.index])
+
+    @property
+    def speed_y(self) -> float:
+        return float(self.horde.speed_y[self.index])
+
+    @speed_y.setter
+    def speed_y(self, value):
+        self.horde.speed_y[self.index] = value
+
+    @property
+    def shoot_cooldown(self) -> float:
+        return float(self.horde.shoot_cooldown[self.index])
+
+    @shoot_cooldown.setter
+    def shoot_cooldown(self, value):
+        self.horde.shoot_cooldown[self.index] = value
+
+    def update(self):
+        pass # moved by Horde.update()
+
+    def take_damage(self, damage=1):
+        self.horde.health[self.index] -= damage
+        if self.horde.health[self.index] <= 0:
+            self.kill()
+            return True
+        return False
+
+    def kill(self):
+        self.horde._free(self)
+        super().kill()
+
+
+class Horde:
+
+    def __init__(self, clock=None, capacity: int = 256):
+        if np is None:
+            raise ImportError("the horde backend needs NumPy (pip install numpy)")
+        self.clock = clock # game clock, None = pygame real time
+        self.group = pygame.sprite.Group() # sprite views of the living zombies
+        self._sprites = [None] * capacity  # slot -> HordeZombie, None when free
+        self._free_slots = list(range(capacity - 1, -1, -1))
+        self._spare = [] # sprites of dead zombies, reused by spawn()
+        self._allocate(capacity)
+
+    def _allocate(self, capacity: int):
+        self.alive = np.zeros(capacity, bool)
+        self.active = np.zeros(capacity, bool)
+        self.activate_at = np.zeros(capacity, np.float64)
+        self.x = np.zeros(capacity, np.int64)           # rect.x
+        self.y = np.zeros(capacity, np.int64)           # rect.y
+        self.x_acc = np.zeros(capacity, np.float64)     # sub-pixel horizontal position
+        self.direction = np.ones(capacity, np.float64)  # +1 right, -1 left
+        self.counter = np.zeros(capacity, np.int64)     # zigzag frames since the last flip
+        self.speed_x = np.zeros(capacity, np.float64)
+        self.speed_y = np.zeros(capacity, np.float64)
+        self.min_x = np.zeros(capacity, np.float64)
+        self.max_x = np.zeros(capacity, np.float64)
+        self.inclusive = np.zeros(capacity, bool)       # roam patterns bounce on reaching a bound
+        self.pattern = np.zeros(capacity, np.int8)
+        self.health = np.zeros(capacity, np.int64)
+        self.can_shoot = np.zeros(capacity, bool)
+        self.last_shot = np.zeros(capacity, np.float64)
+        self.shoot_cooldown = np.zeros(capacity, np.float64)
+
+    def _grow(self):
+        # double every array, living zombies keep their slots
+        old_capacity = len(self.alive)
+        arrays = {name: getattr(self, name) for name in (
+            'alive', 'active', 'activate_at', 'x', 'y', 'x_acc', 'direction', 'counter', 'speed_x',
+            'speed_y', 'min_x', 'max_x', 'inclusive', 'pattern', 'health', 'can_shoot', 'last_shot',
+            'shoot_cooldown')}
+        self._allocate(old_capacity * 2)
+        for name, values in arrays.items():
+            getattr(self, name)[:old_capacity] = values
+        self._sprites.extend([None] * old_capacity)
+        self._free_slots = list(range(old_capacity * 2 - 1, old_capacity - 1, -1)) + self._free_slots
+
+    def __len__(self) -> int:
+        return len(self.group)
+
+    def spawn(self, color, pos, movement_pattern: str = 'straight', spawn_point: str = 'A', wave_delay: int = 0) -> HordeZombie:
+        # Add a zombie (RED or ORANGE) with its top center at pos, same rules as Zombie
+        if not self._free_slots:
+            self._grow()
+        movement = create_movement(movement_pattern, color, spawn_point)
+        kind = _movement_kind(movement)
+        index = self._free_slots.pop()
+        health, speed_y, can_shoot = ZOMBIE_STATS[color]
+        if self._spare:
+            sprite = self._spare.pop()
+            sprite.reset(index, load_zombie_image(color), color, movement_pattern, spawn_point)
+        else:
+            sprite = HordeZombie(self, index, load_zombie_image(color), color, movement_pattern, spawn_point)
+        sprite.rect.midtop = pos
+        now = get_ticks(self.clock)
+
+        self.alive[index] = True
+        self.active[index] = wave_delay == 0
+        self.activate_at[index] = now + wave_delay
+        self.x[index], self.y[index] = sprite.rect.topleft
+        self.x_acc[index] = sprite.rect.x
+        self.direction[index] = movement.initial_direction
+        self.counter[index] = 0
+        self.speed_x[index] = movement.speed
+        self.min_x[index] = movement.min_x
+        self.max_x[index] = movement.max_x
+        self.inclusive[index] = movement.inclusive
+        self.speed_y[index] = speed_y
+        self.pattern[index] = kind
+        self.health[index] = health
+        self.can_shoot[index] = can_shoot
+        self.last_shot[index] = now
+        self.shoot_cooldown[index] = SHOOT_COOLDOWN
+
+        self._sprites[index] = sprite
+        self.group.add(sprite)
+        return sprite
+
+    def update(self):
+        # Move every active zombie one frame, then sync the sprite rects
+        now = get_ticks(self.clock)
+        self.active |= self.alive & (self.activate_at <= now)
+        moving = np.flatnonzero(self.active)
+        if len(moving) == 0:
+            return
+
+        # vertical: rect.y += speed_y, pygame rounds half away from zero
+        y = self.y[moving] + self.speed_y[moving]
+        self.y[moving] = np.copysign(np.floor(np.abs(y) + 0.5), y)
+
+        pattern = self.pattern[moving]
+        # zigzag turns around every ZIGZAG_FLIP_FRAMES frames
+        zigzag = moving[pattern == ZIGZAG]
+        self.counter[zigzag] += 1
+        flip = zigzag[self.counter[zigzag] >= ZIGZAG_FLIP_FRAMES]
+        self.direction[flip] *= -1
+        self.counter[flip] = 0
+
+        # horizontal: advance, then bounce on the bounds of each zombie's pattern
+        sideways = moving[pattern != STRAIGHT]
+        x_acc = self.x_acc[sideways] + self.direction[sideways] * self.speed_x[sideways]
+        min_x, max_x, inclusive = self.min_x[sideways], self.max_x[sideways], self.inclusive[sideways]
+        low = np.where(inclusive, x_acc <= min_x, x_acc < min_x)
+        high = ~low & np.where(inclusive, x_acc >= max_x, x_acc > max_x)
+        x_acc = np.where(low, min_x, np.where(high, max_x, x_acc))
+        direction = self.direction[sideways]
+        self.direction[sideways] = np.where(low, 1, np.where(high, -1, direction))
+        self.x_acc[sideways] = x_acc
+        self.x[sideways] = np.trunc(x_acc)
+
+        # off the bottom of the screen
+        for index in moving[self.y[moving] > SCREEN_HEIGHT].tolist():
+            self._sprites[index].kill()
+
+        self.sync_rects()
+
+    def sync_rects(self):
+        # Copy the array positions to the sprite rects
+        sprites = self._sprites
+        living = np.flatnonzero(self.alive)
+        for index, x, y in zip(living.tolist(), self.x[living].tolist(), self.y[living].tolist()):
+            sprites[index].rect.topleft = (x, y)
+
+    def due_shots(self) -> list:
+        # Bottom centers of the shooting zombies whose cooldown is over (WaveManager spawns the shots)
+        now = get_ticks(self.clock)
+        ready = np.flatnonzero(self.active & self.can_shoot & (now - self.last_shot >= self.shoot_cooldown))
+        self.last_shot[ready] = now
+        return [self._sprites[index].rect.midbottom for index in ready.tolist()]
+
+    def _free(self, sprite: HordeZombie):
+        # a zombie died: its slot goes back to the free list
+        index = sprite.index
+        if self._sprites[index] is not sprite:
+            return
+        self.alive[index] = self.active[index] = False
+        self._sprites[index] = None
+        self._free_slots.append(index)
+        self._spare.append(sprite)
@@ -0,0 +1,125 @@
+from functools import lru_cache
+from ..Utilities.constants import SCREEN_WIDTH
+
+# Zombie movement patterns.
+# A pattern is resolved once, when the zombie spawns: the registry builds a strategy that
+# already holds everything fixed for that zombie (speed, bounds) and Zombie.update makes a
+# single move() call per frame, no string or color checks. The per-zombie state (sub-pixel
+# x, direction, frame counter) stays on the zombie, so zombies of the same color and
+# spawn point share one strategy.
+# New patterns subclass Movement and register with @movement_pattern("name"), wave files
+# can use them right away.
+
+ORANGE = (255, 165, 0)
+
+MOVEMENT_REGISTRY = {} # pattern name -> Movement subclass
+
+
+def movement_pattern(name: str):
+    # class decorator adding a pattern to the registry
+    def register(cls):
+        cls.name = name
+        MOVEMENT_REGISTRY[name] = cls
+        create_movement.cache_clear() # a pattern can be replaced
+        return cls
+    return register
+
+
+@lru_cache(maxsize=None)
+def create_movement(name: str, color, spawn_point: str) -> "Movement":
+    # Strategy of the named pattern for zombies of the given color and spawn point (shared)
+    cls = MOVEMENT_REGISTRY.get(name)
+    if cls is None:
+        raise ValueError(f"unknown movement pattern {name!r}, expected one of {', '.join(MOVEMENT_REGISTRY)}")
+    return cls(color, spawn_point)
+
+
+class Movement:
+    # Horizontal movement of one zombie (vertical speed is the zombie's own)
+    name = None
+    initial_direction = 1 # +1 right, -1 left
+
+    def __init__(self, color, spawn_point: str):
+        self.color = color
+        self.spawn_point = spawn_point
+
+    def move(self, zombie):
+        pass
+
+
+@movement_pattern('straight')
+class StraightMovement(Movement):
+    # no horizontal movement
+    speed, min_x, max_x, inclusive = 0, 0, 0, True
+
+
+@movement_pattern('zigzag')
+class ZigzagMovement(Movement):
+    # turns around every FLIP_FRAMES frames, clamped between its bounds
+    FLIP_FRAMES = 32
+    inclusive = False # bounces once past a bound
+
+    def __init__(self, color, spawn_point: str):
+        super().__init__(color, spawn_point)
+        if color == ORANGE: # wider and faster, across the whole screen
+            self.speed, self.min_x, self.max_x = 5, 15, SCREEN_WIDTH - 45
+        elif spawn_point in ('B', 'D'):
+            self.speed, self.min_x, self.max_x = 2.5, 15, SCREEN_WIDTH // 2 - 15
+        else:
+            self.speed, self.min_x, self.max_x = 2.5, SCREEN_WIDTH // 2 + 15, SCREEN_WIDTH - 45
+
+    def move(self, zombie):
+        zombie.movement_counter += 1
+        if zombie.movement_counter >= self.FLIP_FRAMES:
+            zombie.horizontal_direction *= -1
+            zombie.movement_counter = 0
+
+        # use accumulator for smoother movement and better boundary control
+        x = zombie.x_accumulator + zombie.horizontal_direction * self.speed
+        if x < self.min_x:
+            x = self.min_x
+            zombie.horizontal_direction = 1
+        elif x > self.max_x:
+            x = self.max_x
+            zombie.horizontal_direction = -1
+        zombie.x_accumulator = x
+        zombie.rect.x = int(x)
+
+
+class RoamMovement(Movement):
+    # back and forth between two bounds, turning around on reaching one
+    inclusive = True
+    speed = 2.5
+
+    def move(self, zombie):
+        x = zombie.x_accumulator + zombie.horizontal_direction * self.speed
+        if x <= self.min_x:
+            x = self.min_x
+            zombie.horizontal_direction = 1
+        elif x >= self.max_x:
+            x = self.max_x
+            zombie.horizontal_direction = -1
+        zombie.x_accumulator = x
+        zombie.rect.x = int(x)
+
+
+@movement_pattern('roam_left')
+class RoamLeftMovement(RoamMovement):
+    # left half of the screen, meeting the right roamers at the center without overlap
+    min_x, max_x = 15, SCREEN_WIDTH // 2 - 30
+
+
+@movement_pattern('roam_right')
+class RoamRightMovement(RoamMovement):
+    min_x, max_x = SCREEN_WIDTH // 2, SCREEN_WIDTH - 45
+    initial_direction = -1
+
+
+@movement_pattern('roam_full')
+class RoamFullMovement(RoamMovement):
+    min_x, max_x = 15, SCREEN_WIDTH - 45
+
+    def __init__(self, color, spawn_point: str):
+        super().__init__(color, spawn_point)
+        if color == ORANGE and spawn_point == 'A':
+            self.speed = 3.0  # 1.5x speed per orange zombie in wave 4
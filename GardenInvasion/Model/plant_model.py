@@ -2,31 +2,35 @@ import pygame
 from pathlib import Path
 from ..Utilities.constants import SCREEN_WIDTH, SCREEN_HEIGHT
 from .setting_volume_model import SettingsModel 
+from ..Utilities.asset_cache import asset_cache
+from ..Utilities.game_clock import get_ticks
+from ..Utilities.scheduler import Scheduler
+
+PLAYER_SPRITE_SCALE = 0.15 # of the skin image, keeping the aspect ratio
 
 class Player(pygame.sprite.Sprite): 
-    def __init__(self, pos:tuple, settings_model: SettingsModel=None):
+    def __init__(self, pos:tuple, settings_model: SettingsModel=None, clock=None, scheduler: Scheduler=None):
         super().__init__() 
+        self.clock = clock # game clock, None = pygame real time
+        # timed effects (power-up expiry) go through the game scheduler; without one the
+        # player keeps its own and runs it in update()
+        self._owns_scheduler = scheduler is None
+        self.scheduler = scheduler if scheduler is not None else Scheduler(clock)
+        self._boost_end_event = None
         
         # Determine which sprite to load
         if settings_model:
             # Import here to avoid circular dependency
-            from ..Model.skin_selection_model import SkinSelectionModel
-            skin_model = SkinSelectionModel()
-            selected_skin = skin_model.get_skin_by_id(settings_model.player_skin) # get selected skin
-            sprite_path = Path(selected_skin.sprite_path) # get path to the sprite
+            from ..Model.skin_selection_model import skin_sprite_path
+            sprite_path = Path(skin_sprite_path(settings_model.player_skin)) # sprite of the selected skin
         else:
             # Default fallback
             pkg_root = Path(__file__).resolve().parent.parent
             sprite_path = pkg_root / "Assets" / "images" / "BasePlant01.png"
         
-        try: # load and scale the image
-            original_image = pygame.image.load(str(sprite_path)).convert_alpha()
-            self.scale_factor = 0.15
-            new_size = (
-                max(1, int(original_image.get_width() * self.scale_factor)),
-                max(1, int(original_image.get_height() * self.scale_factor))
-            )
-            self.image = pygame.transform.smoothscale(original_image, new_size)
+        self.scale_factor = PLAYER_SPRITE_SCALE
+        try: # shared image, scaled by scale_factor keeping the aspect ratio
+            self.image = asset_cache.get_image(sprite_path, self.scale_factor)
         except (pygame.error, FileNotFoundError):
             # Create placeholder if image doesn't exist
             self.image = pygame.Surface((50, 50))
@@ -40,10 +44,10 @@ class Player(pygame.sprite.Sprite):
         self.base_shoot_cooldown = 1000          
         # Current cooldown (can be modified by power‑ups)
         self.shoot_SecondTime = self.base_shoot_cooldown
-        self.last_shot = pygame.time.get_ticks()
+        self.last_shot = get_ticks(self.clock)
 
         # Power‑up related: when does the fire‑rate boost end? 0 = no boost active
-        self.fire_rate_boost_end_time = 0
+        self._fire_rate_boost_end_time = 0
         
         # NEW: Life points system (2 life points)
         self.life_points = 2  # Start with 2 life points
@@ -52,20 +56,36 @@ class Player(pygame.sprite.Sprite):
     def apply_fire_rate_boost(self, cooldown_multiplier: float, duration_ms: int):
         # Temporarily increases fire rate by reducing shooting cooldown.
 
-        now = pygame.time.get_ticks()
+        now = get_ticks(self.clock)
         # Reduce cooldown, but keep a small lower bound to avoid zero/negative
         new_cooldown = int(self.base_shoot_cooldown * cooldown_multiplier)
         self.shoot_SecondTime = max(100, new_cooldown)
         # Extend boost time if another power‑up is collected while active
         self.fire_rate_boost_end_time = max(self.fire_rate_boost_end_time, now + duration_ms)
 
+    @property
+    def fire_rate_boost_end_time(self):
+        return self._fire_rate_boost_end_time
+
+    @fire_rate_boost_end_time.setter
+    def fire_rate_boost_end_time(self, end_time):
+        # Moving the end of the boost reschedules its expiry
+        self._fire_rate_boost_end_time = end_time
+        if self._boost_end_event:
+            self._boost_end_event.cancel()
+            self._boost_end_event = None
+        if end_time:
+            self._boost_end_event = self.scheduler.schedule_at(end_time, self._end_fire_rate_boost)
+
+    def _end_fire_rate_boost(self):
+        # Boost expired → restore normal fire rate
+        self._boost_end_event = None
+        self._fire_rate_boost_end_time = 0
+        self.shoot_SecondTime = self.base_shoot_cooldown
+
     def update(self):
-        
-        now = pygame.time.get_ticks() # Check if fire‑rate boost has expired
-        if self.fire_rate_boost_end_time and now >= self.fire_rate_boost_end_time:
-            # Boost expired → restore normal fire rate
-            self.fire_rate_boost_end_time = 0
-            self.shoot_SecondTime = self.base_shoot_cooldown
+        if self._owns_scheduler: # a shared scheduler is run by the game loop
+            self.scheduler.run_due()
 
     def move_left(self): # move left
         self.rect.x -= self.speed
@@ -78,7 +98,7 @@ class Player(pygame.sprite.Sprite):
             self.rect.right = SCREEN_WIDTH # prevent moving out of screen on the right side
 
     def can_shoot(self):
-        current_time = pygame.time.get_ticks()
+        current_time = get_ticks(self.clock)
         if current_time - self.last_shot >= self.shoot_SecondTime:
             self.last_shot = current_time
             return True
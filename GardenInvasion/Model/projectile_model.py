@@ -1,14 +1,34 @@
 import pygame
+from ..Utilities.asset_cache import asset_cache, image_path, SCALE_NONE
+
+PROJECTILE_SPRITE = image_path("Projectile.png")
+asset_cache.register(PROJECTILE_SPRITE, None, SCALE_NONE)
+
+PROJECTILE_SPEED = -10
 
 class Projectile(pygame.sprite.Sprite):
     def __init__(self, pos):
         super().__init__() # call the parent class constructor
-        self.image = pygame.image.load(r'GardenInvasion/Assets/images/Projectile.png').convert_alpha()
-        # load the projectile image with transparency
+        self.pool = None # set by ProjectilePool when the projectile is pooled
+        try: # shared projectile image with transparency, decoded only once
+            self.image = asset_cache.get_image(PROJECTILE_SPRITE, None, SCALE_NONE)
+        except (pygame.error, FileNotFoundError):
+            # Fallback to colored surface
+            self.image = pygame.Surface((10, 20))
+            self.image.fill((0, 200, 0))
         self.rect = self.image.get_rect(midbottom=pos) # set the position of the projectile
-        self.speed = -10 # the speed at which the projectile moves upwards, if positive if moves backwards
+        self.speed = PROJECTILE_SPEED # the speed at which the projectile moves upwards, if positive if moves backwards
+
+    def reset(self, pos): # reuse the projectile for a new shot
+        self.rect.midbottom = pos
+        self.speed = PROJECTILE_SPEED
 
     def update(self): # update the position of the projectile
         self.rect.y += self.speed
         if self.rect.bottom < 0:
             self.kill() # remove the projectile if it goes off-screen
+
+    def kill(self): # remove from all groups, pooled projectiles go back to their pool
+        super().kill()
+        if self.pool:
+            self.pool.release(self)
@@ -0,0 +1,65 @@
+class ProjectilePool:
+    # Reusable store of projectile sprites: shots are taken from the pool with acquire()
+    # and go back to it when they are killed (off screen or on collision),
+    # so long fights don't keep building and throwing away sprites
+
+    def __init__(self, projectile_class, max_size: int = 64, prewarm: int = 0):
+        self.projectile_class = projectile_class
+        self.max_size = max_size   # max projectiles alive + free at the same time, None = no limit
+        self._free = []            # projectiles ready to be reused
+
+        # stats
+        self.created = 0           # sprites built by the pool
+        self.reused = 0            # acquire() served from the free list
+        self.dropped = 0           # acquire() refused because the pool was full
+        self.in_use = 0            # projectiles currently on screen
+        self.high_water = 0        # max projectiles on screen at the same time
+
+        for _ in range(min(prewarm, max_size) if max_size is not None else prewarm):
+            self._free.append(self._create((0, 0)))
+
+    def acquire(self, pos, *groups):
+        # Get a projectile placed at pos and added to the given groups.
+        # Returns None if the pool already reached max_size
+        if self._free:
+            projectile = self._free.pop()
+            self.reused += 1
+        elif self.max_size is None or self.created < self.max_size:
+            projectile = self._create(pos)
+        else:
+            self.dropped += 1
+            return None
+
+        projectile.reset(pos)
+        projectile.in_pool = False
+        projectile.add(*groups)
+
+        self.in_use += 1
+        self.high_water = max(self.high_water, self.in_use)
+        return projectile
+
+    def release(self, projectile):
+        # Put a projectile back in the pool, called by the projectile's kill()
+        if projectile.in_pool:
+            return # already released, kill() can be called more than once
+        projectile.in_pool = True
+        self._free.append(projectile)
+        self.in_use -= 1
+
+    def stats(self) -> dict:
+        return {
+            'created': self.created,
+            'reused': self.reused,
+            'dropped': self.dropped,
+            'in_use': self.in_use,
+            'free': len(self._free),
+            'high_water': self.high_water,
+            'max_size': self.max_size,
+        }
+
+    def _create(self, pos):
+        projectile = self.projectile_class(pos)
+        projectile.pool = self
+        projectile.in_pool = True
+        self.created += 1
+        return projectile
@@ -2,6 +2,24 @@ import pygame
 from pathlib import Path
 from typing import List, Dict
 
+SKINS_PATH = Path(__file__).resolve().parent.parent / "Assets" / "images"
+# available skins: id (key in the settings file), name shown in the menu, sprite file
+# (expand this list as you add more skins)
+SKINS = (
+    ("default", "Classic Plant", "BasePlant01.png"),
+    ("Carnivorous", "Carnivorous Plant", "BasePlant02.png"),
+    ("Cactus", "Cactus Plant", "BasePlant03.png"),
+)
+
+
+def skin_sprite_path(skin_id: str) -> str:
+    # Sprite of a skin without building the selection menu (no previews decoded),
+    # the default skin if the id is unknown
+    for candidate_id, _, filename in SKINS:
+        if candidate_id == skin_id:
+            return str(SKINS_PATH / filename)
+    return str(SKINS_PATH / SKINS[0][2])
+
 
 class SkinOption:
     def __init__(self, skin_id: str, display_name: str, sprite_path: str, preview_path: str = None):
@@ -33,25 +51,9 @@ class SkinSelectionModel:
     def _load_available_skins(self):
         # Load all available player skins.
         
-        pkg_root = Path(__file__).resolve().parent.parent
-        assets_path = pkg_root / "Assets" / "images"
-        # Define available skins (expand this list as you add more skins)
         self.available_skins = [
-            SkinOption(
-                skin_id="default",
-                display_name="Classic Plant",
-                sprite_path=str(assets_path / "BasePlant01.png")
-            ),
-            SkinOption(
-                skin_id="Carnivorous",
-                display_name="Carnivorous Plant",
-                sprite_path=str(assets_path / "BasePlant02.png")
-            ),
-            SkinOption(
-                skin_id="Cactus",
-                display_name="Cactus Plant",
-                sprite_path=str(assets_path / "BasePlant03.png")
-            )
+            SkinOption(skin_id=skin_id, display_name=display_name, sprite_path=str(SKINS_PATH / filename))
+            for skin_id, display_name, filename in SKINS
         ]
     
     def get_selected_skin(self) -> SkinOption:
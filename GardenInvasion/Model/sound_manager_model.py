@@ -1,7 +1,43 @@
+import io
 import pygame
 from pathlib import Path
 from typing import Optional 
 import os
+from collections import deque
+
+# Sound effects: name -> (file in Assets/sounds, max voices).
+# An effect plays at most max voices at once, a new one stops (steals) its oldest
+# voice, so a heavy wave can't fill the mixer with overlapping hits. The effect
+# channel pool is exactly the sum of the caps, so there is always a free channel.
+# Stingers (max voices None) play on channels reserved for them, effects can't cut them.
+SOUND_FILES = {
+    'plant_shoot': ('shoot_plant.wav', 3),
+    'wallnut_destroyed': ('wallnut_destroyed.wav', 2),
+    'zombie_hit': ('zombie_hit.ogg', 4),
+    'plant_hit': ('plant_hit.ogg', 2),
+    'game_over': ('gameover_sound.ogg', None),
+    'victory': ('victory.mp3', None),
+}
+STINGER_CHANNELS = 2
+EFFECT_CHANNELS = sum(voices for _, voices in SOUND_FILES.values() if voices)
+
+_shared_manager = None
+pcm_cache = None # PcmCache the effects are loaded through, None = always decode
+
+
+def use_pcm_cache(cache):
+    # Load sound effects through this PcmCache from now on (None detaches it)
+    global pcm_cache
+    pcm_cache = cache
+
+
+def get_sound_manager(settings_model):
+    # Process-wide SoundManager, sounds are loaded by the first call only
+    global _shared_manager
+    if _shared_manager is None:
+        _shared_manager = SoundManager(settings_model)
+    return _shared_manager
+
 
 class SoundManager:
     # Manages game sound effects with volume control
@@ -23,7 +59,10 @@ class SoundManager:
             pygame.mixer.init()
 
         self.sounds= {} # Dictionary to hold sound effects
+        self.voices = {name: deque() for name in SOUND_FILES} # channels last used by each effect, oldest first
+        self.applied_volume = None # volume last pushed to the mixer
         self.music_tracks = {}  # Dictionary to hold music file paths
+        self.music_data = {}  # music name -> file bytes read ahead by preload_music
         self.current_music = None  # Track currently playing music
 
         self.audio_available = True
@@ -52,11 +91,22 @@ class SoundManager:
                 except:
                     pass
         
+        self._reserve_channels() # Channel pools for effects and stingers
         self._load_sounds() # Load all sound effects
         self._load_music() # Load music tracks
         
         self._update_volume() # Update volume based on settings
     
+    def _reserve_channels(self):
+        # the first STINGER_CHANNELS are kept out of Sound.play(), effects share the rest
+        if not self.audio_available:
+            return
+        try:
+            pygame.mixer.set_num_channels(STINGER_CHANNELS + EFFECT_CHANNELS)
+            pygame.mixer.set_reserved(STINGER_CHANNELS)
+        except pygame.error as e:
+            print(f"Warning: Could not reserve mixer channels: {e}")
+
     def _load_sounds(self):
         # Load all game sound effects
 
@@ -67,21 +117,14 @@ class SoundManager:
         pkg_root = Path(__file__).resolve().parent.parent
         sounds_path = pkg_root / "Assets" / "sounds"
         
-        # Define sound file mappings - AGGIUNGI I NUOVI SUONI
-        sound_files = {
-            'plant_shoot': 'shoot_plant.wav',           
-            'wallnut_destroyed': 'wallnut_destroyed.wav', 
-            'game_over': 'gameover_sound.ogg',           
-            'zombie_hit': 'zombie_hit.ogg',              
-            'plant_hit': 'plant_hit.ogg',                  
-            'victory': 'victory.mp3'                      
-        }
-    
-        # Load each sound file
-        for sound_name, filename in sound_files.items(): # Load sounds
+        # Load each sound file (new sounds go in SOUND_FILES)
+        for sound_name, (filename, _) in SOUND_FILES.items(): # Load sounds
             sound_file = sounds_path / filename 
             try:
-                self.sounds[sound_name] = pygame.mixer.Sound(str(sound_file)) 
+                if pcm_cache is not None: # decoded once per machine, mapped afterwards
+                    self.sounds[sound_name] = pcm_cache.get_sound(sound_file)
+                else:
+                    self.sounds[sound_name] = pygame.mixer.Sound(str(sound_file)) 
                 # print(f"Loaded sound: {sound_name}")  # Aggiungi print per debug
             except (pygame.error, FileNotFoundError) as e: # Handle loading errors
                 print(f"Warning: Could not load sound '{filename}': {e}")
@@ -112,12 +155,26 @@ class SoundManager:
             else:
                 print(f"Warning: Music file not found: {filename}") 
                 self.music_tracks[music_name] = None # No file available
+
+    def preload_music(self, music_name: str) -> bool:
+        # Read a music file into memory, so play_music doesn't touch the disk.
+        # Only file I/O, safe to call from a worker thread (see preloader)
+        path = self.music_tracks.get(music_name)
+        if not self.audio_available or not path:
+            return False
+        if music_name not in self.music_data:
+            with open(path, "rb") as f:
+                self.music_data[music_name] = f.read()
+        return True
         
     def _update_volume(self):
-        # Update volume for all sounds based on settings
+        # Update volume for all sounds based on settings, only when the setting changed
 
         if not self.audio_available: # No audio available
             return
+        if self.settings_model.volume == self.applied_volume:
+            return
+        self.applied_volume = self.settings_model.volume
 
         volume = self.settings_model.volume / 100.0
         
@@ -136,12 +193,38 @@ class SoundManager:
         if not self.audio_available:
             return
         
-        self._update_volume()
+        if self.settings_model.volume != self.applied_volume:
+            self._update_volume()
         
-        if sound_name in self.sounds and self.sounds[sound_name]:
-            self.sounds[sound_name].play()
-        else: # Handle missing sound
+        sound = self.sounds.get(sound_name)
+        if not sound: # Handle missing sound
             print(f"Sound '{sound_name}' not found or not loaded")
+            return
+
+        max_voices = SOUND_FILES[sound_name][1] if sound_name in SOUND_FILES else None
+        if max_voices is None: # stinger, on a reserved channel
+            self._play_stinger(sound)
+            return
+
+        # forget channels that finished or moved on to another sound (a few at most)
+        voices = deque(channel for channel in self.voices.get(sound_name, ())
+                       if channel.get_busy() and channel.get_sound() is sound)
+        self.voices[sound_name] = voices
+        if len(voices) >= max_voices:
+            voices.popleft().stop() # steal the oldest voice
+        channel = sound.play()
+        if channel is not None:
+            voices.append(channel)
+
+    def _play_stinger(self, sound):
+        # first idle reserved channel, or the first one if all are busy
+        channel = pygame.mixer.Channel(0)
+        for index in range(STINGER_CHANNELS):
+            candidate = pygame.mixer.Channel(index)
+            if not candidate.get_busy():
+                channel = candidate
+                break
+        channel.play(sound)
 
     def play_music(self, music_name: str, loops: int = -1, fade_ms: int = 1000):
         # Play background music (looping by default)
@@ -154,7 +237,11 @@ class SoundManager:
         
         if music_name in self.music_tracks and self.music_tracks[music_name]: # Check if music track exists
             try:
-                pygame.mixer.music.load(self.music_tracks[music_name])
+                data = self.music_data.get(music_name)
+                if data is not None: # preloaded, stream it from memory
+                    pygame.mixer.music.load(io.BytesIO(data), Path(self.music_tracks[music_name]).suffix[1:])
+                else:
+                    pygame.mixer.music.load(self.music_tracks[music_name])
                 self._update_volume()  # Set volume before playing
                 pygame.mixer.music.play(loops=loops, fade_ms=fade_ms) # Play music with fade-in
                 self.current_music = music_name # Update currently playing music
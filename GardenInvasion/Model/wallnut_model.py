@@ -1,6 +1,14 @@
 import pygame
 from ..Utilities.constants import Brown, Lighter_Brown, Even_Lighter_Brown
 from .sound_manager_model import SoundManager
+from ..Utilities.asset_cache import asset_cache, image_path
+
+WALLNUT_FULL_SPRITE = image_path("Wallnut_body_Undamaged.png")
+WALLNUT_DAMAGED_SPRITE = image_path("Wallnut_Body_cracked1.png")
+WALLNUT_SIZE = (60, 60)
+
+asset_cache.register(WALLNUT_FULL_SPRITE, WALLNUT_SIZE)
+asset_cache.register(WALLNUT_DAMAGED_SPRITE, WALLNUT_SIZE)
 
 class WallNut(pygame.sprite.Sprite): # Model for a defensive wall-nut that protects the player.
     def __init__(self, position: tuple, slot_index: int, sound_manager: SoundManager = None):
@@ -12,19 +20,15 @@ class WallNut(pygame.sprite.Sprite): # Model for a defensive wall-nut that prote
         self.sound_manager = sound_manager  # Sound manager for playing sounds
 
         # Define wall-nut size (width, height)
-        self.wallnut_size = (60, 60)
+        self.wallnut_size = WALLNUT_SIZE
         
         try:
-            # Load original sprites
-            sprite_full=pygame.image.load(r"GardenInvasion/Assets/images/Wallnut_body_Undamaged.png").convert_alpha() # Full health
-            sprite_dmg1=pygame.image.load(r"GardenInvasion/Assets/images/Wallnut_Body_cracked1.png").convert_alpha()  # 1 hit taken
-            
-            # Scale sprites to desired size above
+            # Shared sprites, already scaled to the size above by the asset cache
             self.sprites = {
-                2: pygame.transform.smoothscale(sprite_full, self.wallnut_size),  # Full health (2 life points)
-                1: pygame.transform.smoothscale(sprite_dmg1, self.wallnut_size),  # Damaged (1 life point)
+                2: asset_cache.get_image(WALLNUT_FULL_SPRITE, self.wallnut_size),  # Full health (2 life points)
+                1: asset_cache.get_image(WALLNUT_DAMAGED_SPRITE, self.wallnut_size),  # Damaged (1 life point)
             }
-        except pygame.error as e:
+        except (pygame.error, FileNotFoundError) as e:
             print(f"Error loading wallnut sprites: {e}")
             # Create placeholder colored rectangles if images don't exist
             self.sprites = {
@@ -38,6 +42,12 @@ class WallNut(pygame.sprite.Sprite): # Model for a defensive wall-nut that prote
         self.rect = self.image.get_rect()
         self.rect.center = position  # Position of wall-nut
     
+    def _create_placeholder(self, size: tuple, color: tuple) -> pygame.Surface:
+        # Colored rectangle used when the wall-nut sprites can't be loaded
+        placeholder = pygame.Surface(size)
+        placeholder.fill(color)
+        return placeholder
+
     def update_image_by_health(self):
         if self.health in self.sprites:
             self.image = self.sprites[self.health]
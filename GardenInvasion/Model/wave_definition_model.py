@@ -0,0 +1,104 @@
+import json
+import tomllib
+from collections import namedtuple
+from functools import lru_cache
+from pathlib import Path
+from .movement_pattern_model import MOVEMENT_REGISTRY
+
+# Declarative wave sets.
+# A wave file (JSON, or TOML with the same structure) lists the waves in order; a wave is
+# a list of phases starting "at" ms after the wave start, each spawning zombies:
+#
+#   {"waves": [{"phases": [{"at": 0, "spawns": [
+#       {"zombie": "red", "spawn_point": "A", "movement": "straight", "delay": 0}]}]}]}
+#
+# "delay" (optional) keeps a spawned zombie still for that many ms.
+# The file is validated once and compiled into one timeline per wave, spawn events sorted
+# by time, that WaveManager walks with an index while the wave runs.
+
+WAVES_PATH = Path(__file__).resolve().parent.parent / "Assets" / "waves"
+DEFAULT_WAVES = WAVES_PATH / "campaign.json"
+
+ZOMBIE_TYPES = ('red', 'orange')
+SPAWN_POINTS = ('A', 'B', 'C', 'D', 'E')
+
+# one zombie spawn, time in ms from the wave start
+SpawnEvent = namedtuple('SpawnEvent', ['time', 'zombie', 'spawn_point', 'movement', 'delay'])
+
+
+class WaveSchedule:
+    # Compiled wave set: waves[i] is the timeline of wave i + 1, a tuple of SpawnEvent by time
+
+    def __init__(self, waves: tuple, name: str = ""):
+        self.waves = waves
+        self.name = name
+
+    def __len__(self) -> int:
+        return len(self.waves)
+
+
+def _check_ms(value, where: str) -> int:
+    # times are whole, non-negative milliseconds
+    if isinstance(value, bool) or not isinstance(value, int) or value < 0:
+        raise ValueError(f"{where}: expected a non-negative number of ms, got {value!r}")
+    return value
+
+
+def _check_choice(value, choices: tuple, where: str) -> str:
+    if value not in choices:
+        raise ValueError(f"{where}: {value!r} is not one of {', '.join(choices)}")
+    return value
+
+
+def compile_waves(data: dict, name: str = "") -> WaveSchedule:
+    # Validate a parsed wave file and build its timelines
+    waves = data.get('waves') if isinstance(data, dict) else None
+    if not waves or not isinstance(waves, list):
+        raise ValueError(f"{name}: a wave file needs a non-empty 'waves' list")
+
+    timelines = []
+    for wave_number, wave in enumerate(waves, start=1):
+        phases = wave.get('phases') if isinstance(wave, dict) else None
+        if not phases or not isinstance(phases, list):
+            raise ValueError(f"{name} wave {wave_number}: a wave needs a non-empty 'phases' list")
+        events = []
+        for phase_number, phase in enumerate(phases, start=1):
+            where = f"{name} wave {wave_number} phase {phase_number}"
+            if not isinstance(phase, dict):
+                raise ValueError(f"{where}: a phase is an object with 'at' and 'spawns'")
+            at = _check_ms(phase.get('at', 0), f"{where} 'at'")
+            spawns = phase.get('spawns')
+            if not spawns or not isinstance(spawns, list):
+                raise ValueError(f"{where}: a phase needs a non-empty 'spawns' list")
+            for spawn_number, spawn in enumerate(spawns, start=1):
+                spawn_where = f"{where} spawn {spawn_number}"
+                if not isinstance(spawn, dict):
+                    raise ValueError(f"{spawn_where}: a spawn is an object with 'zombie' and 'spawn_point'")
+                events.append(SpawnEvent(
+                    at,
+                    _check_choice(spawn.get('zombie'), ZOMBIE_TYPES, f"{spawn_where} 'zombie'"),
+                    _check_choice(spawn.get('spawn_point'), SPAWN_POINTS, f"{spawn_where} 'spawn_point'"),
+                    _check_choice(spawn.get('movement', 'straight'), tuple(MOVEMENT_REGISTRY), f"{spawn_where} 'movement'"),
+                    _check_ms(spawn.get('delay', 0), f"{spawn_where} 'delay'"),
+                ))
+        # stable sort: spawns at the same time keep the file order
+        events.sort(key=lambda event: event.time)
+        timelines.append(tuple(events))
+    return WaveSchedule(tuple(timelines), data.get('name', name))
+
+
+@lru_cache(maxsize=None)
+def _load(path: str) -> WaveSchedule:
+    if path.endswith(".toml"):
+        with open(path, "rb") as f:
+            data = tomllib.load(f)
+    else:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+    return compile_waves(data, Path(path).name)
+
+
+def load_wave_schedule(path=DEFAULT_WAVES) -> WaveSchedule:
+    # Wave set from a JSON/TOML file, parsed and compiled once per file.
+    # Schedules are read-only, managers share them
+    return _load(str(Path(path).resolve()))
@@ -1,20 +1,52 @@
 import pygame
+import random
 from .zombie_model import RedZombie, OrangeZombie
+from .zombie_projectile_model import ZombieProjectile
+from .projectile_pool_model import ProjectilePool
+from .horde_model import Horde, HORDE_AVAILABLE, RED, ORANGE
+from .wave_definition_model import load_wave_schedule, WaveSchedule, DEFAULT_WAVES
 from ..Utilities.constants import SCREEN_WIDTH, SCREEN_HEIGHT
+from ..Utilities.game_clock import get_ticks
+from ..Utilities.scheduler import Scheduler
 
 class WaveManager:
-    # wave manager with 3 second timer between waves
-        
-    def __init__(self):
+    # wave manager with 3 second timer between waves, waves come from a wave file
+    # (Assets/waves/campaign.json by default, see wave_definition_model)
+        
+    def __init__(self, clock=None, rng=None, schedule=None, scheduler=None, horde=False):
+        self.clock = clock # game clock shared with the zombies, None = pygame real time
+        # wave countdown, later phases and delayed zombies run on the game scheduler;
+        # without one the manager keeps its own and runs it in update()
+        self._owns_scheduler = scheduler is None
+        self.scheduler = scheduler if scheduler is not None else Scheduler(clock)
+        self.rng = rng if rng is not None else random # random.Random for spawn variations, e.g. GameRng.spawns
+        # waves to play: WaveSchedule or path of a wave file
+        if schedule is None:
+            schedule = DEFAULT_WAVES
+        self.schedule = schedule if isinstance(schedule, WaveSchedule) else load_wave_schedule(schedule)
         self.current_wave = 0
-        self.total_waves = 5
+        self.total_waves = len(self.schedule)
         self.wave_complete = True
-        self.zombie_group = pygame.sprite.Group()
+        # horde=True keeps the zombies in NumPy arrays (horde_model), for very large waves
+        self.horde = None
+        if horde and not HORDE_AVAILABLE:
+            print("NumPy not installed, horde backend disabled")
+        elif horde:
+            self.horde = Horde(clock)
+        self.zombie_group = self.horde.group if self.horde is not None else pygame.sprite.Group()
         self.zombie_projectile_group = pygame.sprite.Group()
-        self.wave_timers = []
+        # zombie shots are reused instead of rebuilt, the cap bounds the worst waves
+        self.zombie_projectile_pool = ProjectilePool(ZombieProjectile, max_size=128)
+
+        # spawn timeline of the running wave, walked with an index as game time passes
+        self.wave_timeline = ()
+        self.next_spawn = 0
+        self.wave_start_time = 0
+        self._next_phase_event = None
         
-        self.next_wave_timer = 0 # timer for next wave start
         self.waiting_for_next_wave = False
+        self._next_wave_event = None
+        self.next_wave_timer = 0 # timer for next wave start
         
         # spawn points for zombies
         self.spawn_points = {
@@ -30,33 +62,40 @@ class WaveManager:
         self.current_wave = 0
         self.wave_complete = True
         self.waiting_for_next_wave = True
-        self.next_wave_timer = pygame.time.get_ticks() + 3000
+        self.next_wave_timer = get_ticks(self.clock) + 3000
         
+    @property
+    def next_wave_timer(self):
+        return self._next_wave_time
+
+    @next_wave_timer.setter
+    def next_wave_timer(self, start_time):
+        # Moving the countdown reschedules the start of the next wave
+        self._next_wave_time = start_time
+        if self._next_wave_event:
+            self._next_wave_event.cancel()
+            self._next_wave_event = None
+        if self.waiting_for_next_wave:
+            self._next_wave_event = self.scheduler.schedule_at(start_time, self._execute_wave_start)
+
     def update(self):
-        # update wave manager, called every frame
-        current_time = pygame.time.get_ticks()
-        
-        # check if we are waiting for next wave and timer has expired
-        if self.waiting_for_next_wave and current_time >= self.next_wave_timer:
-            self._execute_wave_start()
+        # update wave manager, called every frame.
+        # Next wave start and later phases come from the scheduler
+        if self._owns_scheduler: # a shared scheduler is run by the game loop
+            self.scheduler.run_due()
             
-        self.zombie_group.update()
+        if self.horde is not None:
+            self.horde.update()
+        else:
+            self.zombie_group.update()
         self.zombie_projectile_group.update()
         self._handle_zombie_shooting()
-        
-        # update wave timers, execute actions if timer has expired
-        current_timers = self.wave_timers.copy()
-        for timer in current_timers:
-            if current_time >= timer['time']:
-                timer['action']()
-                if timer in self.wave_timers:  
-                    self.wave_timers.remove(timer)
             
-        # check if current wave is complete (no zombies left and no pending timers)
+        # check if current wave is complete (no zombies left and no pending spawns)
         if (not self.wave_complete and 
             not self.waiting_for_next_wave and 
             len(self.zombie_group) == 0 and 
-            len(self.wave_timers) == 0):
+            self.pending_spawns() == 0):
             
             self.wave_complete = True
             # check if we have more waves to start
@@ -66,100 +105,94 @@ class WaveManager:
     def _prepare_next_wave(self):
         # prepare next wave with 3 second timer
         self.waiting_for_next_wave = True
-        self.next_wave_timer = pygame.time.get_ticks() + 3000
+        self.next_wave_timer = get_ticks(self.clock) + 3000
             
     def _execute_wave_start(self):
         # exectute wave start, spawn zombies based on current wave
         self.waiting_for_next_wave = False
-        self.current_wave += 1
+        self._next_wave_event = None
         self.wave_complete = False
-        self.wave_timers = []
-        
-        print(f"Wave {self.current_wave} begins")
-        
-        # execute wave logic based on current wave number
-        if self.current_wave == 1:
-            self._wave_1()
-        elif self.current_wave == 2:
-            self._wave_2()
-        elif self.current_wave == 3:
-            self._wave_3()
-        elif self.current_wave == 4:
-            self._wave_4()
-        elif self.current_wave == 5:
-            self._wave_5()
+        self._begin_wave(self.current_wave + 1)
+
+    def _begin_wave(self, wave_number):
+        # start the timeline of the given wave, spawns due at its start happen right away
+        self.current_wave = wave_number
+        self.wave_timeline = self._wave_timeline(wave_number)
+        self.next_spawn = 0
+        self.wave_start_time = get_ticks(self.clock)
+        print(f"Wave {wave_number} begins")
+        self._spawn_due(self.wave_start_time)
+
+    def _wave_timeline(self, wave_number) -> tuple:
+        # spawn events of the given wave, from the wave file
+        return self.schedule.waves[wave_number - 1]
+
+    def _spawn_allowed(self) -> bool:
+        # room for another zombie now, subclasses can hold spawns back
+        return True
+
+    def _spawn_due(self, current_time=None):
+        # spawn every event of the timeline whose time has come, in order,
+        # then wake up again for the next phase
+        if current_time is None:
+            current_time = get_ticks(self.clock)
+        if self._next_phase_event: # called early, the wake-up is rescheduled below
+            self._next_phase_event.cancel()
+        timeline = self.wave_timeline
+        elapsed = current_time - self.wave_start_time
+        while (self.next_spawn < len(timeline) and timeline[self.next_spawn].time <= elapsed
+               and self._spawn_allowed()):
+            event = timeline[self.next_spawn]
+            self.next_spawn += 1
+            if event.zombie == 'orange':
+                self._spawn_orange(event.spawn_point, event.movement, event.delay)
+            else:
+                self._spawn_red(event.spawn_point, event.movement, event.delay)
+        self._next_phase_event = None
+        if self.next_spawn < len(timeline):
+            self._next_phase_event = self.scheduler.schedule_at(
+                self.wave_start_time + timeline[self.next_spawn].time, self._spawn_due)
+
+    def pending_spawns(self) -> int:
+        # spawns of the running wave still to come
+        return len(self.wave_timeline) - self.next_spawn
             
     def _handle_zombie_shooting(self):
         # handling zombie shooting, spawn projectiles if zombies can shoot
+        if self.horde is not None:
+            for pos in self.horde.due_shots():
+                self._spawn_zombie_projectile(pos)
+            return
         for zombie in self.zombie_group:
             if hasattr(zombie, 'can_shoot_now') and zombie.can_shoot_now():
                 self._spawn_zombie_projectile(zombie.rect.midbottom)
                 
     def _spawn_zombie_projectile(self, pos):
         # zombie shoots a projectile, spawn it at given position
-        from .zombie_projectile_model import ZombieProjectile
-        projectile = ZombieProjectile(pos)
-        self.zombie_projectile_group.add(projectile)
+        self.zombie_projectile_pool.acquire(pos, self.zombie_projectile_group)
         
     def _spawn_red(self, spawn_point, movement_pattern, wave_delay=0):
         # spawna zombie base 1
-        if spawn_point in self.spawn_points:
-            zombie = RedZombie(self.spawn_points[spawn_point], movement_pattern, spawn_point, wave_delay)
+        if spawn_point in self.spawn_points and self.horde is not None:
+            return self.horde.spawn(RED, self.spawn_points[spawn_point], movement_pattern, spawn_point, wave_delay)
+        elif spawn_point in self.spawn_points:
+            zombie = RedZombie(self.spawn_points[spawn_point], movement_pattern, spawn_point, wave_delay,
+                               clock=self.clock, scheduler=self.scheduler)
             self.zombie_group.add(zombie)
             delay_msg = f" (delay: {wave_delay}ms)" if wave_delay > 0 else ""
+            return zombie
             
     def _spawn_orange(self, spawn_point, movement_pattern='straight', wave_delay=0):
         # spawn zombie base 2
-        if spawn_point in self.spawn_points:
-            zombie = OrangeZombie(self.spawn_points[spawn_point], spawn_point, wave_delay, movement_pattern)
+        if spawn_point in self.spawn_points and self.horde is not None:
+            return self.horde.spawn(ORANGE, self.spawn_points[spawn_point], movement_pattern, spawn_point, wave_delay)
+        elif spawn_point in self.spawn_points:
+            zombie = OrangeZombie(self.spawn_points[spawn_point], spawn_point, wave_delay, movement_pattern,
+                                  clock=self.clock, scheduler=self.scheduler)
             self.zombie_group.add(zombie)
             delay_msg = f" (delay: {wave_delay}ms)" if wave_delay > 0 else ""
+            return zombie
             
-    # waves logic, each wave has different spawn patterns and timings
-    def _wave_1(self):
-        self._spawn_red('A', 'straight')
-        
-    def _wave_2(self):
-        self._spawn_red('B', 'roam_left')   
-        self._spawn_red('C', 'roam_right')  
-        
-    def _wave_3(self):
-        self._spawn_orange('B', 'roam_left')   
-        self._spawn_orange('C', 'roam_right')  
-        
-    def _wave_4(self):
-        self._spawn_red('B', 'roam_left')
-        self._spawn_red('C', 'roam_right')
-        
-        self._spawn_orange('A', 'roam_full', 1000)
-        
-    def _wave_5(self):
-        print("Ondata 5 - Fase 1: 3 Rossi")
-        
-        # phase 1 with 3 base 1 zombies
-        self._spawn_red('D', 'straight')
-        self._spawn_red('A', 'straight')
-        self._spawn_red('E', 'straight')
-    
-        self.wave_timers.append({
-            'time': pygame.time.get_ticks() + 1000, 
-            'action': self._wave_5_phase2
-        })
-    
-        self.wave_timers.append({
-            'time': pygame.time.get_ticks() + 2000, 
-            'action': self._wave_5_phase3
-        })
-
-    def _wave_5_phase2(self):
-        self._spawn_red('B', 'roam_left')   
-        self._spawn_red('C', 'roam_right')  
-    
-    def _wave_5_phase3(self):
-        # base zombie 2 with delayed spawn to create more pressure on player
-        self._spawn_orange('B', 'roam_left')   
-        self._spawn_orange('C', 'roam_right')  
-        
     def all_waves_completed(self):
         # check if all waves are completed
         return self.current_wave >= self.total_waves and self.wave_complete
@@ -167,7 +200,7 @@ class WaveManager:
     def get_wave_info(self):
         # return string with current wave info for UI display
         if self.waiting_for_next_wave:
-            time_left = max(0, (self.next_wave_timer - pygame.time.get_ticks()) // 1000)
+            time_left = max(0, (self.next_wave_timer - get_ticks(self.clock)) // 1000)
             return f"Ondata {self.current_wave + 1} tra {time_left}s"
         elif self.wave_complete and self.current_wave >= self.total_waves:
             return "VITTORIA!"
@@ -179,6 +212,6 @@ class WaveManager:
     def is_victory(self) -> bool: # check if player won by completing all waves and defeating all zombies
         all_waves_completed = self.current_wave >= self.total_waves
         no_zombies_remaining = len(self.zombie_group) == 0
-        no_pending_spawns = len(self.wave_timers) == 0
+        no_pending_spawns = self.pending_spawns() == 0
         
         return all_waves_completed and no_zombies_remaining and no_pending_spawns
@@ -1,10 +1,41 @@
 import pygame
-from pathlib import Path
 from GardenInvasion.Utilities.constants import SCREEN_WIDTH, SCREEN_HEIGHT
+from GardenInvasion.Utilities.asset_cache import asset_cache, image_path, SCALE_SUPERSAMPLE
+from GardenInvasion.Utilities.game_clock import get_ticks
+from GardenInvasion.Model.movement_pattern_model import create_movement
+
+RED_ZOMBIE_SPRITE = image_path("BaseZombie01.png")
+ORANGE_ZOMBIE_SPRITE = image_path("BaseZombie02.png")
+ZOMBIE_SPRITE_SIZE = (None, 70)  # target height 70px, width from the aspect ratio
+
+asset_cache.register(RED_ZOMBIE_SPRITE, ZOMBIE_SPRITE_SIZE, SCALE_SUPERSAMPLE)
+asset_cache.register(ORANGE_ZOMBIE_SPRITE, ZOMBIE_SPRITE_SIZE, SCALE_SUPERSAMPLE)
+
+def load_zombie_image(color) -> pygame.Surface:
+    # Load zombie sprite based on color type, shared through the asset cache
+    # Determine which sprite to load based on color
+    if color == (255, 165, 0):  # Orange zombie
+        sprite_file = ORANGE_ZOMBIE_SPRITE
+    else:  # Red zombie and default fallback
+        sprite_file = RED_ZOMBIE_SPRITE
+    
+    try:
+        # Scaled to the target height keeping the aspect ratio, going through a 2x
+        # intermediate size for a smoother result
+        return asset_cache.get_image(sprite_file, ZOMBIE_SPRITE_SIZE, SCALE_SUPERSAMPLE)
+
+    except (pygame.error, FileNotFoundError):
+        # Fallback to colored surface
+        print(f"Warning: Could not load sprite {sprite_file}, using colored surface")
+        image = pygame.Surface((40,70))
+        image.fill(color)
+        return image
 
 class Zombie(pygame.sprite.Sprite):
-    def __init__(self, pos, color, health, speed_y, movement_pattern, spawn_point, wave_delay=0):
+    def __init__(self, pos, color, health, speed_y, movement_pattern, spawn_point, wave_delay=0, clock=None, scheduler=None):
         super().__init__()
+        self.clock = clock # game clock, None = pygame real time
+        self.scheduler = scheduler # game Scheduler activating delayed zombies, None = checked in update()
         
         self.color = color
         self._load_sprite()
@@ -18,177 +49,38 @@ class Zombie(pygame.sprite.Sprite):
         self.wave_delay = wave_delay
         self.active = wave_delay == 0
         
-        self.horizontal_speed = 2.5
+        # movement pattern resolved once, update() makes a single call to it
+        self.movement = create_movement(movement_pattern, color, spawn_point)
+        self._move = self.movement.move
         self.movement_counter = 0
         self.x_accumulator = self.rect.x
-        
-        # determine initial horizontal direction based on movement pattern and spawn point
-        if movement_pattern == 'roam_left':
-            self.horizontal_direction = 1
-        elif movement_pattern == 'roam_right':
-            self.horizontal_direction = -1
-        else:
-            self.horizontal_direction = 1
+        self.horizontal_direction = self.movement.initial_direction
             
         self.can_shoot = False
         self.shoot_cooldown = 1000  # milliseconds
-        self.last_shot = pygame.time.get_ticks()
-        self.spawn_time = pygame.time.get_ticks()
+        self.last_shot = get_ticks(self.clock)
+        self.spawn_time = get_ticks(self.clock)
+        if not self.active and scheduler is not None:
+            scheduler.schedule_in(wave_delay, self._activate)
 
-    def _load_sprite(self):
-        # Load zombie sprite based on color type
-        pkg_root = Path(__file__).resolve().parent.parent
-        sprites_path = pkg_root / "Assets" / "images"
-        
-        # Determine which sprite to load based on color
-        if self.color == (255, 0, 0):  # Red zombie
-            sprite_file = sprites_path / "BaseZombie01.png"
-        elif self.color == (255, 165, 0):  # Orange zombie
-            sprite_file = sprites_path / "BaseZombie02.png"
-        else:  # Default fallback
-            sprite_file = sprites_path / "BaseZombie01.png"
-        
-        try:
-            # Load and scale sprite
-            self.image = pygame.image.load(str(sprite_file)).convert_alpha()
-             # Load the original image
-            original_image = pygame.image.load(str(sprite_file)).convert_alpha()
-            # Get original dimensions to preserve aspect ratio
-            original_width, original_height = original_image.get_size()
-            # Calculate target size maintaining aspect ratio
-            target_height = 70  # Your desired height
-            aspect_ratio = original_width / original_height
-            target_width = int(target_height * aspect_ratio)
-            
-            # Use smoothscale with larger intermediate size for better quality
-            intermediate_size = (target_width * 2, target_height * 2) # Scale up first
-            temp_image = pygame.transform.smoothscale(original_image, intermediate_size) # Scale up
-            
-            # Then scale down to final size (produces smoother result)
-            self.image = pygame.transform.smoothscale(temp_image, (target_width, target_height))
-            # print(f"Loaded sprite: {sprite_file.name}")
+    def _activate(self):
+        self.active = True
 
-        except (pygame.error, FileNotFoundError):
-            # Fallback to colored surface
-            print(f"Warning: Could not load sprite {sprite_file}, using colored surface")
-            self.image = pygame.Surface((40,70))
-            self.image.fill(self.color)
+    def _load_sprite(self):
+        self.image = load_zombie_image(self.color)
 
     def update(self):
-        # delay management for wave spawning
-        current_time = pygame.time.get_ticks()
-        if not self.active and current_time - self.spawn_time >= self.wave_delay:
-            self.active = True
-        
+        # delay management for wave spawning, done by the scheduler when there is one
         if not self.active:
-            return
+            if self.scheduler is not None or get_ticks(self.clock) - self.spawn_time < self.wave_delay:
+                return
+            self.active = True
             
         self.rect.y += self.speed_y
-        
-        # different movement patterns based on type and wave
-        if self.movement_pattern == 'zigzag':
-            self._move_zigzag()
-        elif self.movement_pattern == 'straight':
-            pass
-        elif self.movement_pattern == 'roam_left':
-            self._move_roam_half_screen('left')
-        elif self.movement_pattern == 'roam_right':
-            self._move_roam_half_screen('right')
-        elif self.movement_pattern == 'roam_full':
-            self._move_roam_full_screen()
+        self._move(self)
         
         if self.rect.top > SCREEN_HEIGHT:
             self.kill()
-    
-    def _move_zigzag(self):
-        # existing zigzag movement with improved fluidity and better boundary handling
-        self.movement_counter += 1
-        
-        if self.movement_counter >= 32:
-            self.horizontal_direction *= -1
-            self.movement_counter = 0
-            
-        if self.color == (255, 165, 0):
-            zigzag_amplitude = 5
-        else:
-            zigzag_amplitude = 2.5
-        
-        # use accumulator for smoother movement and better boundary control
-        self.x_accumulator += self.horizontal_direction * zigzag_amplitude
-        
-        if self.color == (255, 165, 0):
-            min_x = 15
-            max_x = SCREEN_WIDTH - 45
-        else:
-            if self.spawn_point in ['B', 'D']:
-                min_x = 15
-                max_x = SCREEN_WIDTH // 2 - 15
-            else:
-                min_x = SCREEN_WIDTH // 2 + 15
-                max_x = SCREEN_WIDTH - 45
-        
-        if self.x_accumulator < min_x:
-            self.x_accumulator = min_x
-            self.horizontal_direction = 1
-        elif self.x_accumulator > max_x:
-            self.x_accumulator = max_x
-            self.horizontal_direction = -1
-            
-        self.rect.x = int(self.x_accumulator)
-    
-    def _move_roam_half_screen(self, side):
-        # movement pattern that roams across half the screen with smooth bouncing at edges, meeting at center without overlap
-        effective_speed = self.horizontal_speed
-        if (self.color == (255, 165, 0) and 
-            self.movement_pattern == 'roam_full' and 
-            self.spawn_point == 'A'):
-            effective_speed = 3.0  # 1.5x speed per orange zombie in wave 4
-        
-        # update accumulator for smoother movement and better boundary control
-        self.x_accumulator += self.horizontal_direction * effective_speed
-        
-        center_x = SCREEN_WIDTH // 2
-        zombie_width = 30
-        
-        if side == 'left':
-            min_x = 15
-            max_x = center_x - zombie_width
-        else:  # right
-            min_x = center_x
-            max_x = SCREEN_WIDTH - 45
-        
-        # check boundaries and reverse direction if needed
-        if self.x_accumulator <= min_x:
-            self.x_accumulator = min_x
-            self.horizontal_direction = 1
-        elif self.x_accumulator >= max_x:
-            self.x_accumulator = max_x
-            self.horizontal_direction = -1
-            
-        # update rect position based on accumulator
-        self.rect.x = int(self.x_accumulator)
-    
-    def _move_roam_full_screen(self):
-        # movement pattern that roams across the entire screen with smooth bouncing at edges
-        effective_speed = self.horizontal_speed
-        if (self.color == (255, 165, 0) and 
-            self.movement_pattern == 'roam_full' and 
-            self.spawn_point == 'A'):
-            effective_speed = 3.0  # 1.5x speed per orange zombie in wave 4
-        
-        self.x_accumulator += self.horizontal_direction * effective_speed
-        
-        min_x = 15
-        max_x = SCREEN_WIDTH - 45
-        
-        if self.x_accumulator <= min_x:
-            self.x_accumulator = min_x
-            self.horizontal_direction = 1
-        elif self.x_accumulator >= max_x:
-            self.x_accumulator = max_x
-            self.horizontal_direction = -1
-            
-        self.rect.x = int(self.x_accumulator)
             
     def take_damage(self, damage=1):
         self.health -= damage
@@ -200,14 +92,14 @@ class Zombie(pygame.sprite.Sprite):
     def can_shoot_now(self):
         if not self.can_shoot or not self.active:
             return False
-        current_time = pygame.time.get_ticks()
+        current_time = get_ticks(self.clock)
         if current_time - self.last_shot >= self.shoot_cooldown:
             self.last_shot = current_time
             return True
         return False
 
 class RedZombie(Zombie): # base zombie class 1
-    def __init__(self, pos, movement_pattern='straight', spawn_point='A', wave_delay=0):
+    def __init__(self, pos, movement_pattern='straight', spawn_point='A', wave_delay=0, clock=None, scheduler=None):
         super().__init__(
             pos=pos,
             color=(255, 0, 0),
@@ -215,12 +107,14 @@ class RedZombie(Zombie): # base zombie class 1
             speed_y=2,
             movement_pattern=movement_pattern,
             spawn_point=spawn_point,
-            wave_delay=wave_delay
+            wave_delay=wave_delay,
+            clock=clock,
+            scheduler=scheduler
         )
         self.can_shoot = False
 
 class OrangeZombie(Zombie): # base zombie class 2, can shoot and has zigzag movement by default
-    def __init__(self, pos, spawn_point='A', wave_delay=0, movement_pattern='zigzag'):
+    def __init__(self, pos, spawn_point='A', wave_delay=0, movement_pattern='zigzag', clock=None, scheduler=None):
         super().__init__(
             pos=pos,
             color=(255, 165, 0),
@@ -228,6 +122,8 @@ class OrangeZombie(Zombie): # base zombie class 2, can shoot and has zigzag move
             speed_y=1.5,
             movement_pattern=movement_pattern,
             spawn_point=spawn_point,
-            wave_delay=wave_delay
+            wave_delay=wave_delay,
+            clock=clock,
+            scheduler=scheduler
         )
         self.can_shoot = True
@@ -1,39 +1,38 @@
 import pygame
-from pathlib import Path
 from ..Utilities.constants import SCREEN_HEIGHT
+from ..Utilities.asset_cache import asset_cache, image_path, SCALE_ROTOZOOM
+
+ZOMBIE_PROJECTILE_SPRITE = image_path("zombie_projectile.png")
+ZOMBIE_PROJECTILE_SIZE = (None, 40)  # target height 40px, width from the aspect ratio
+
+ZOMBIE_PROJECTILE_SPEED = 5
+
+asset_cache.register(ZOMBIE_PROJECTILE_SPRITE, ZOMBIE_PROJECTILE_SIZE, SCALE_ROTOZOOM)
 
 class ZombieProjectile(pygame.sprite.Sprite):
     # projectile launched by zombies 02
     
     def __init__(self, pos):
         super().__init__()
+        self.pool = None # set by ProjectilePool when the projectile is pooled
         self._load_sprite()
         self.rect = self.image.get_rect(midbottom=pos)
-        self.speed = 5
+        self.speed = ZOMBIE_PROJECTILE_SPEED
+
+    def reset(self, pos):
+        # reuse the projectile for a new shot
+        self.rect.midbottom = pos
+        self.speed = ZOMBIE_PROJECTILE_SPEED
 
     def _load_sprite(self):
-        # Load zombie projectile sprite
-        pkg_root = Path(__file__).resolve().parent.parent
-        sprite_file = pkg_root / "Assets" / "images" / "zombie_projectile.png"
-        
+        # Load zombie projectile sprite, shared through the asset cache
         try:
-            # Load and scale sprite
-            original_image = pygame.image.load(str(sprite_file)).convert_alpha()
-            # Get original dimensions to preserve aspect ratio
-            original_width, original_height = original_image.get_size()
-            
-            # Define target size maintaining aspect ratio
-            target_height = 40
-            aspect_ratio = original_width / original_height
-            target_width = int(target_height * aspect_ratio)
-            
-            # Use rotozoom for best quality
-            scale_factor = target_height / original_height
-            self.image = pygame.transform.rotozoom(original_image, 0, scale_factor)
+            # Scaled to the target height with rotozoom, keeping the aspect ratio
+            self.image = asset_cache.get_image(ZOMBIE_PROJECTILE_SPRITE, ZOMBIE_PROJECTILE_SIZE, SCALE_ROTOZOOM)
                                     
         except (pygame.error, FileNotFoundError):
             # Fallback to colored surface
-            print(f"Warning: Could not load sprite {sprite_file}, using yellow rectangle")
+            print(f"Warning: Could not load sprite {ZOMBIE_PROJECTILE_SPRITE}, using yellow rectangle")
             self.image = pygame.Surface((20, 30))
             self.image.fill((255, 255, 0))
 
@@ -43,4 +42,9 @@ class ZombieProjectile(pygame.sprite.Sprite):
         # remove projectile if it goes off screen
         if self.rect.top > SCREEN_HEIGHT:
             self.kill()
-            
\ No newline at end of file
+
+    def kill(self):
+        # remove from all groups, pooled projectiles go back to their pool
+        super().kill()
+        if self.pool:
+            self.pool.release(self)
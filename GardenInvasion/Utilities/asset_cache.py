@@ -0,0 +1,151 @@
+import threading
+import pygame
+from pathlib import Path
+
+# Shared registry of game images: every (path, size, scale mode) is decoded, converted
+# and scaled once per process and the same Surface is handed out to every sprite.
+# With a texture atlas attached (use_atlas), sprites it holds are taken from its sheets
+# instead, already scaled (see texture_atlas). With a disk cache attached (use_disk_cache),
+# the other images are built once per machine and mapped from disk on later launches.
+# Images can be built from a worker thread (see preloader), misses are serialized.
+
+IMAGES_PATH = Path(__file__).resolve().parent.parent / "Assets" / "images"
+
+# Scale modes
+SCALE_NONE = 'none'                # keep the original size
+SCALE_SMOOTH = 'smooth'            # pygame.transform.smoothscale
+SCALE_FAST = 'fast'                # pygame.transform.scale
+SCALE_ROTOZOOM = 'rotozoom'        # pygame.transform.rotozoom (uniform factor)
+SCALE_SUPERSAMPLE = 'supersample'  # smoothscale to 2x the target, then down to the target
+
+
+def image_path(filename: str) -> str:
+    # Absolute path of an image inside Assets/images, independent of the working directory
+    return str(IMAGES_PATH / filename)
+
+
+def _target_size(original_size: tuple, size) -> tuple:
+    # Resolve a size spec against the original image size.
+    # size can be (w, h), (None, h) to keep the aspect ratio from a height, or a float scale factor
+    original_width, original_height = original_size
+    if isinstance(size, (int, float)):
+        return (max(1, int(original_width * size)), max(1, int(original_height * size)))
+    width, height = size
+    if width is None:
+        aspect_ratio = original_width / original_height
+        width = int(height * aspect_ratio)
+    return (width, height)
+
+
+class AssetCache:
+
+    def __init__(self):
+        self._sources = {}  # path -> decoded and converted original image
+        self._images = {}   # (path, size, mode) -> final Surface
+        self._specs = []    # specs registered by the models for preload()
+        self.atlas = None   # AtlasLoader looked up before decoding, None = no atlas
+        self.disk_cache = None # DiskImageCache looked up next, None = always decode
+        self._lock = threading.RLock() # one builder at a time (main thread or preloader)
+        self.hits = 0
+        self.misses = 0
+
+    def register(self, path, size=None, mode=SCALE_SMOOTH):
+        # Remember an image the game will need, so preload() can build it ahead of time
+        spec = (str(path), size, mode)
+        if spec not in self._specs:
+            self._specs.append(spec)
+
+    def get_image(self, path, size=None, mode=SCALE_SMOOTH) -> pygame.Surface:
+        # Return the shared Surface for this image, building it on the first request.
+        # Raises pygame.error / FileNotFoundError like pygame.image.load, callers keep their fallbacks
+        key = (str(path), size, mode)
+        image = self._images.get(key)
+        if image is not None:
+            self.hits += 1
+            return image
+
+        with self._lock:
+            image = self._images.get(key) # built by another thread while we waited
+            if image is not None:
+                self.hits += 1
+                return image
+            self.misses += 1
+            image = self.atlas.lookup(path, size, mode) if self.atlas is not None else None
+            if image is None and self.disk_cache is not None:
+                image = self.disk_cache.load(path, size, mode)
+            if image is None:
+                image = self._scale(self._load_source(key[0]), size, mode)
+                if self.disk_cache is not None:
+                    self.disk_cache.store(path, size, mode, image)
+            self._images[key] = image
+            return image
+
+    def use_atlas(self, atlas):
+        # Serve the sprites of this AtlasLoader from its sheets (None detaches it)
+        self.atlas = atlas
+        self.clear() # images built before come from the atlas from now on
+
+    def use_disk_cache(self, disk_cache):
+        # Keep built images in this DiskImageCache across launches (None detaches it).
+        # The images and their memory maps are released when pygame quits
+        if self.disk_cache is not None and self.disk_cache is not disk_cache:
+            self.clear() # mapped images of the old cache are dropped with it
+        self.disk_cache = disk_cache
+        if disk_cache is not None:
+            pygame.register_quit(self.clear)
+
+    def preload(self, specs=None) -> int:
+        # Build the given specs (or every registered one) now, instead of on first use.
+        # Returns how many images are ready
+        ready = 0
+        for spec in (self._specs if specs is None else specs):
+            try:
+                self.get_image(*spec)
+                ready += 1
+            except (pygame.error, FileNotFoundError) as e:
+                print(f"Warning: Could not preload image '{spec[0]}': {e}")
+        return ready
+
+    def stats(self) -> dict:
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'sources': len(self._sources),
+            'images': len(self._images),
+        }
+
+    def clear(self):
+        # Drop every cached Surface (registered specs are kept), and the disk cache's
+        # memory maps nobody else uses
+        with self._lock:
+            self._sources.clear()
+            self._images.clear()
+            self.hits = 0
+            self.misses = 0
+            if self.disk_cache is not None:
+                self.disk_cache.close()
+
+    def _load_source(self, path: str) -> pygame.Surface:
+        source = self._sources.get(path)
+        if source is None:
+            source = pygame.image.load(path).convert_alpha()
+            self._sources[path] = source
+        return source
+
+    def _scale(self, image: pygame.Surface, size, mode: str) -> pygame.Surface:
+        if size is None or mode == SCALE_NONE:
+            return image
+
+        target = _target_size(image.get_size(), size)
+        if mode == SCALE_FAST:
+            return pygame.transform.scale(image, target)
+        if mode == SCALE_ROTOZOOM:
+            return pygame.transform.rotozoom(image, 0, target[1] / image.get_height())
+        if mode == SCALE_SUPERSAMPLE:
+            intermediate = pygame.transform.smoothscale(image, (target[0] * 2, target[1] * 2))
+            return pygame.transform.smoothscale(intermediate, target)
+        return pygame.transform.smoothscale(image, target)
+
+
+# Process-wide instance used by the models
+asset_cache = AssetCache()
@@ -13,4 +13,17 @@ Even_Lighter_Brown = (205, 133, 63)
 GREEN_SI = (98, 222, 109)
 RED = (255, 0, 0)
 BLUE = (0, 0, 255)
-YELLOW = (255, 255, 0)
\ No newline at end of file
+YELLOW = (255, 255, 0)
+
+# Environment switches (set to "1" to enable)
+DIRTY_RECTS_ENV = "GARDEN_INVASION_DIRTY_RECTS"  # dirty-rect rendering during gameplay
+
+# Environment settings
+SEED_ENV = "GARDEN_INVASION_SEED"  # integer seed for the game session (signed 64-bit), random if not set
+RECORD_ENV = "GARDEN_INVASION_RECORD"  # input log path ("{seed}" is replaced by the session seed, a reused path gets a -2, -3... suffix)
+PROFILE_ENV = "GARDEN_INVASION_PROFILE"  # frame profiler: "1" or output path prefix ("0": off), F3 toggles in game (summary in ~/.cache/garden_invasion/profiles)
+WAVES_ENV = "GARDEN_INVASION_WAVES"  # wave file (JSON/TOML) to play instead of Assets/waves/campaign.json
+HORDE_ENV = "GARDEN_INVASION_HORDE"  # "1": zombies in NumPy arrays (needs numpy), for huge waves
+ENDLESS_ENV = "GARDEN_INVASION_ENDLESS"  # "1": endless survival mode, generated waves until the plant falls
+IMAGE_CACHE_ENV = "GARDEN_INVASION_IMAGE_CACHE"  # directory of the scaled image cache, "0" disables it
+SOUND_CACHE_ENV = "GARDEN_INVASION_SOUND_CACHE"  # directory of the decoded sound effect cache, "0" disables it
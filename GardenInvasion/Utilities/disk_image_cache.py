@@ -0,0 +1,114 @@
+import hashlib
+import mmap
+import os
+import struct
+import tempfile
+from pathlib import Path
+import pygame
+from .constants import SCREEN_WIDTH, SCREEN_HEIGHT
+
+# On-disk cache of final game images.
+# The first launch decodes and scales an image as usual and writes its pixels, already at
+# the final size, to one file per image; later launches map the file in memory and wrap
+# it with pygame.image.frombuffer, no PNG decoding and no resampling.
+# An entry is keyed by the hash of the source file, the target size and scale mode, the
+# screen size and the pygame version (scalers may change), so editing an image or
+# upgrading pygame just makes new entries. Files are written in the pixel layout of
+# convert_alpha(), so the surfaces blit as fast as converted ones.
+
+CACHE_VERSION = 1
+HEADER = struct.Struct("<8s4sII") # magic, pixel format, width, height
+MAGIC = b"GIIMAGE1"
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "garden_invasion" / "images"
+
+
+def _pixel_format(image: pygame.Surface) -> str:
+    # byte order of the image pixels as frombuffer/tobytes name it
+    if image.get_masks() == (0xff0000, 0xff00, 0xff, 0xff000000):
+        return 'BGRA' # what convert_alpha() gives on little-endian machines
+    return 'RGBA'
+
+
+class DiskImageCache:
+
+    def __init__(self, directory=DEFAULT_CACHE_DIR):
+        self.directory = Path(directory)
+        self._digests = {} # source path -> hash of its content, read once per process
+        self._maps = []    # open memory maps, the surfaces read their pixels from them
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+
+    def load(self, path, size, mode):
+        # Cached image of this spec, None if there is none (or it can't be read).
+        # Raises FileNotFoundError when the source image doesn't exist
+        entry = self._entry_path(path, size, mode)
+        try:
+            with open(entry, "rb") as f:
+                pixels = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY) # private pages, writable surfaces
+        except (OSError, ValueError): # missing or empty
+            self.misses += 1
+            return None
+
+        magic, pixel_format, width, height = HEADER.unpack_from(pixels) if len(pixels) >= HEADER.size else (b"", b"", 0, 0)
+        end = HEADER.size + width * height * 4
+        if magic != MAGIC or len(pixels) != end: # not an entry, or cut short
+            pixels.close()
+            self.misses += 1
+            return None
+        image = pygame.image.frombuffer(memoryview(pixels)[HEADER.size:end], (width, height),
+                                        pixel_format.decode("ascii"))
+        self._maps.append(pixels)
+        self.hits += 1
+        return image
+
+    def store(self, path, size, mode, image: pygame.Surface):
+        # Write an image built from this spec, failures only cost the next launch a decode
+        pixel_format = _pixel_format(image)
+        data = HEADER.pack(MAGIC, pixel_format.encode("ascii"), *image.get_size()) + \
+            pygame.image.tobytes(image, pixel_format)
+        tmp_path = None
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            # write aside and rename, a crash never leaves a half-written entry
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, self._entry_path(path, size, mode))
+            self.writes += 1
+        except OSError as e:
+            print(f"Warning: Could not write image cache entry for '{path}': {e}")
+            if tmp_path is not None:
+                try:
+                    os.remove(tmp_path) # not renamed, don't leave it in the cache directory
+                except OSError:
+                    pass
+
+    def close(self):
+        # Release the memory maps of the images loaded so far. A map still backing a
+        # surface someone holds can't be closed, it stays open until the next close()
+        still_used = []
+        for pixels in self._maps:
+            try:
+                pixels.close()
+            except BufferError:
+                still_used.append(pixels)
+        self._maps = still_used
+
+    def stats(self) -> dict:
+        return {'hits': self.hits, 'misses': self.misses, 'writes': self.writes}
+
+    def _digest(self, path) -> str:
+        path = str(path)
+        digest = self._digests.get(path)
+        if digest is None:
+            with open(path, "rb") as f:
+                digest = self._digests[path] = hashlib.sha1(f.read()).hexdigest()
+        return digest
+
+    def _entry_path(self, path, size, mode) -> Path:
+        if isinstance(size, list):
+            size = tuple(size)
+        key = (f"{CACHE_VERSION}|{self._digest(path)}|{size!r}|{mode}|"
+               f"{SCREEN_WIDTH}x{SCREEN_HEIGHT}|{pygame.version.ver}")
+        return self.directory / (hashlib.sha1(key.encode()).hexdigest() + ".img")
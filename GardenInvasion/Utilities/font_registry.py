@@ -0,0 +1,116 @@
+import time
+import pygame
+from pathlib import Path
+
+# Shared fonts of the views.
+# pygame.font.SysFont looks the family up among the system fonts and opens the TTF on
+# every call, so the views don't call it while drawing: they ask the registry for a
+# (family, size, bold) font and get the same Font object every frame.
+# A family is resolved once, the first match of:
+#   1. a TTF bundled in Assets/fonts, "<family>.ttf" (or "<family>-bold.ttf" for bold)
+#   2. the family itself among the system fonts
+#   3. FALLBACK_FAMILIES among the system fonts, in order
+#   4. pygame's default font
+# Family None is pygame's default font. Fonts registered by the views are opened by
+# preload() at startup, which also reports how long resolving the families took.
+
+FONTS_PATH = Path(__file__).resolve().parent.parent / "Assets" / "fonts"
+FALLBACK_FAMILIES = ("liberationsans", "dejavusans", "freesans", "helvetica")
+
+
+def _family_key(family) -> str | None:
+    # "Arial", "arial" and "Arial " are the same family, as for SysFont
+    return family.lower().replace(" ", "") if family else None
+
+
+class FontRegistry:
+
+    def __init__(self, fonts_path=FONTS_PATH):
+        self.fonts_path = Path(fonts_path)
+        self._files = {}  # (family, bold) -> TTF path, None = pygame's default font
+        self._fonts = {}  # (family, size, bold) -> Font
+        self._specs = []  # fonts registered by the views for preload()
+        self.resolve_ms = 0.0 # time spent resolving families, system font scan included
+        self.hits = 0
+        self.misses = 0
+
+    def register(self, family, size: int, bold: bool = False):
+        # Remember a font the views will need, so preload() can open it at startup
+        spec = (_family_key(family), size, bold)
+        if spec not in self._specs:
+            self._specs.append(spec)
+
+    def get(self, family, size: int, bold: bool = False) -> pygame.font.Font:
+        # Shared Font of this family, size and weight, opened on the first request
+        key = (_family_key(family), size, bold)
+        font = self._fonts.get(key)
+        if font is not None:
+            self.hits += 1
+            return font
+
+        self.misses += 1
+        if not self._fonts:
+            # Fonts die with the font module, forget them when pygame quits
+            pygame.register_quit(self.clear)
+        path = self.resolve(family, bold)
+        font = pygame.font.Font(path, size)
+        if bold and path == self.resolve(family, False): # no bold file, embolden the regular one
+            font.set_bold(True)
+        self._fonts[key] = font
+        return font
+
+    def resolve(self, family, bold: bool = False) -> str | None:
+        # TTF file of a family (see the fallback chain above), None = pygame's default font
+        key = (_family_key(family), bold)
+        if key in self._files:
+            return self._files[key]
+
+        start = time.perf_counter()
+        path = self._files[key] = self._resolve(key[0], bold)
+        self.resolve_ms += (time.perf_counter() - start) * 1000
+        return path
+
+    def preload(self, specs=None) -> float:
+        # Resolve and open the given (family, size, bold) fonts, or every registered one.
+        # Returns the milliseconds it took
+        start = time.perf_counter()
+        for spec in (self._specs if specs is None else specs):
+            self.get(*spec)
+        return (time.perf_counter() - start) * 1000
+
+    def stats(self) -> dict:
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'fonts': len(self._fonts),
+            'families': len(self._files),
+            'resolve_ms': round(self.resolve_ms, 2),
+        }
+
+    def clear(self):
+        # Drop every open font (resolved families and registered specs are kept)
+        self._fonts.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def _resolve(self, family, bold: bool) -> str | None:
+        if family is None:
+            return None
+        # a bundled regular TTF beats a system bold one, it gets emboldened instead
+        for filename in ((f"{family}-bold.ttf", f"{family}.ttf") if bold else (f"{family}.ttf",)):
+            if (self.fonts_path / filename).is_file():
+                return str(self.fonts_path / filename)
+        for candidate in (family, *FALLBACK_FAMILIES):
+            # match_font scans the system fonts on its first call, later calls are lookups
+            path = pygame.font.match_font(candidate, bold=bold)
+            if path:
+                return path
+        return None
+
+
+# Process-wide instance used by the views
+font_registry = FontRegistry()
+
+
+def get_font(family, size: int, bold: bool = False) -> pygame.font.Font:
+    return font_registry.get(family, size, bold)
@@ -0,0 +1,142 @@
+import csv
+import json
+import math
+import time
+from collections import deque
+from pathlib import Path
+
+# Per-phase frame timing for the game loop.
+# The loop calls start_frame(), then lap(name) at the end of every phase (events, input,
+# each update, each collision pass, draw, flip...) and end_frame(). Each lap is the time
+# since the previous one, measured with perf_counter_ns. Rolling windows give the
+# percentiles shown by the overlay, whole-run totals go in the CSV/JSON summary.
+
+FRAME_BUDGET_MS = 1000 / 60  # 16.6 ms at 60 FPS
+FRAME = 'frame'              # name of the whole-frame entry
+PERCENTILES = (50, 95, 99)
+PROFILE_NAME = "garden_invasion_profile"
+DEFAULT_PROFILE_DIR = Path.home() / ".cache" / "garden_invasion" / "profiles"
+
+
+def output_prefix(setting) -> Path:
+    # Where the summary of a profiled game goes (+ ".csv" / ".json"), from GARDEN_INVASION_PROFILE:
+    # "1" -> the current directory, a path prefix -> there, not set or "0" (profiler only
+    # switched on with F3) -> DEFAULT_PROFILE_DIR, so games don't leave files where they're launched
+    if setting == '1':
+        return Path(PROFILE_NAME)
+    if setting and setting != '0':
+        return Path(setting)
+    DEFAULT_PROFILE_DIR.mkdir(parents=True, exist_ok=True)
+    return DEFAULT_PROFILE_DIR / PROFILE_NAME
+
+
+def percentile(sorted_values, p: float):
+    # Nearest-rank percentile of an already sorted list
+    if not sorted_values:
+        return 0
+    rank = max(0, min(len(sorted_values) - 1, math.ceil(p / 100 * len(sorted_values)) - 1))
+    return sorted_values[rank]
+
+
+class _PhaseStats:
+
+    def __init__(self, window: int):
+        self.recent = deque(maxlen=window) # last laps in ns, for rolling percentiles
+        self.count = 0
+        self.total_ns = 0
+        self.max_ns = 0
+
+    def add(self, elapsed_ns: int):
+        self.recent.append(elapsed_ns)
+        self.count += 1
+        self.total_ns += elapsed_ns
+        if elapsed_ns > self.max_ns:
+            self.max_ns = elapsed_ns
+
+
+class FrameProfiler:
+
+    def __init__(self, enabled: bool = True, window: int = 600, budget_ms: float = FRAME_BUDGET_MS):
+        self.enabled = enabled
+        self.window = window
+        self.budget_ms = budget_ms
+        self.phases = {}            # name -> _PhaseStats, in first-seen order (= loop order)
+        self.over_budget = 0        # frames slower than budget_ms
+        self._frame_start = None
+        self._last = None
+
+    def start_frame(self):
+        if not self.enabled:
+            return
+        self._frame_start = self._last = time.perf_counter_ns()
+
+    def lap(self, name: str):
+        # Close the phase that started at the previous lap (or at start_frame)
+        if not self.enabled or self._last is None:
+            return
+        now = time.perf_counter_ns()
+        self._stats(name).add(now - self._last)
+        self._last = now
+
+    def end_frame(self):
+        if not self.enabled or self._frame_start is None:
+            return
+        elapsed = time.perf_counter_ns() - self._frame_start
+        self._stats(FRAME).add(elapsed)
+        if elapsed > self.budget_ms * 1_000_000:
+            self.over_budget += 1
+        self._frame_start = self._last = None
+
+    def discard_frame(self):
+        # Drop the frame being timed (a modal screen ran in it), laps and end_frame()
+        # record nothing until the next start_frame()
+        self._frame_start = self._last = None
+
+    def toggle(self):
+        self.enabled = not self.enabled
+        self._frame_start = self._last = None # don't time a frame started while disabled
+
+    def recent_frames_ms(self) -> list:
+        # Whole-frame times of the rolling window, oldest first
+        stats = self.phases.get(FRAME)
+        return [ns / 1_000_000 for ns in stats.recent] if stats else []
+
+    def summary(self) -> dict:
+        # Per-phase timings in ms: whole-run mean/max and rolling-window percentiles
+        phases = {}
+        for name, stats in self.phases.items():
+            recent = sorted(stats.recent)
+            entry = {
+                'count': stats.count,
+                'mean_ms': stats.total_ns / stats.count / 1_000_000,
+                'max_ms': stats.max_ns / 1_000_000,
+            }
+            for p in PERCENTILES:
+                entry[f'p{p}_ms'] = percentile(recent, p) / 1_000_000
+            phases[name] = entry
+        frames = self.phases.get(FRAME)
+        return {
+            'frames': frames.count if frames else 0,
+            'budget_ms': self.budget_ms,
+            'over_budget': self.over_budget,
+            'phases': phases,
+        }
+
+    def write_csv(self, path):
+        summary = self.summary()
+        columns = ['count', 'mean_ms'] + [f'p{p}_ms' for p in PERCENTILES] + ['max_ms']
+        with open(path, 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(['phase'] + columns)
+            for name, entry in summary['phases'].items():
+                writer.writerow([name] + [entry['count']] + [f"{entry[c]:.4f}" for c in columns[1:]])
+
+    def write_json(self, path):
+        with open(path, 'w') as f:
+            json.dump(self.summary(), f, indent=4)
+
+    def _stats(self, name: str) -> _PhaseStats:
+        stats = self.phases.get(name)
+        if stats is None:
+            stats = self.phases[name] = _PhaseStats(self.window)
+        return stats
@@ -0,0 +1,29 @@
+import pygame
+
+# Game time used by the models (cooldowns, spawn delays, wave timers).
+# Models take an optional clock: without one they read pygame's real time as before,
+# with a LogicalClock they only see the time the game loop or a simulation advanced
+
+FIXED_DT_MS = 1000 / 60  # one logic step at 60 updates per second
+
+
+class LogicalClock:
+    # Milliseconds of game time, moved forward only by advance()
+
+    def __init__(self, start_ms: float = 0):
+        self.time_ms = start_ms
+
+    def advance(self, dt_ms: float = FIXED_DT_MS):
+        self.time_ms += dt_ms
+
+    def get_ticks(self) -> int:
+        # same unit and type as pygame.time.get_ticks()
+        return round(self.time_ms)
+
+
+def get_ticks(clock=None) -> int:
+    # Current game time from the given clock, or pygame's real time if there is none.
+    # pygame.time.get_ticks is looked up on every call so tests can still patch it
+    if clock is not None:
+        return clock.get_ticks()
+    return pygame.time.get_ticks()
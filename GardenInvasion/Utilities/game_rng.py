@@ -0,0 +1,61 @@
+import hashlib
+import random
+
+# Random numbers of one game session.
+# A session has a single seed; every subsystem draws from its own named stream derived
+# from it, so the same seed replays the same game and drawing more numbers in one
+# stream (e.g. a new drop rule) doesn't shift the others.
+
+DROPS = 'drops'    # power-up drop rolls and drop type
+SPAWNS = 'spawns'  # wave and spawn variations
+AI = 'ai'          # zombie behaviour
+
+# seeds are signed 64-bit integers, the range the input log stores
+MIN_SEED = -2 ** 63
+MAX_SEED = 2 ** 63 - 1
+
+
+def derive_seed(seed: int, stream: str) -> int:
+    # Stable 64-bit seed for a stream, the same on every run and platform
+    # (unlike hash(), which is salted per process)
+    digest = hashlib.sha256(f"{seed}:{stream}".encode()).digest()
+    return int.from_bytes(digest[:8], 'big')
+
+
+def parse_seed(text: str) -> int:
+    # Seed from its text form (GARDEN_INVASION_SEED), ValueError with the reason if it isn't one
+    try:
+        seed = int(text)
+    except ValueError:
+        raise ValueError(f"seed {text!r} is not an integer") from None
+    if not MIN_SEED <= seed <= MAX_SEED:
+        raise ValueError(f"seed {seed} is out of range ({MIN_SEED} to {MAX_SEED})")
+    return seed
+
+
+class GameRng:
+
+    def __init__(self, seed: int = None):
+        if seed is None:
+            seed = random.SystemRandom().randrange(2 ** 32) # fresh session, still logged and replayable
+        self.seed = seed
+        self._streams = {}
+
+    def stream(self, name: str) -> random.Random:
+        # random.Random for the given stream, created on first use
+        rng = self._streams.get(name)
+        if rng is None:
+            rng = self._streams[name] = random.Random(derive_seed(self.seed, name))
+        return rng
+
+    @property
+    def drops(self) -> random.Random:
+        return self.stream(DROPS)
+
+    @property
+    def spawns(self) -> random.Random:
+        return self.stream(SPAWNS)
+
+    @property
+    def ai(self) -> random.Random:
+        return self.stream(AI)
@@ -0,0 +1,61 @@
+import pygame
+
+# Redraw-on-change for the menu and modal loops.
+# Menus only change when the player does something, so instead of drawing and flipping
+# the whole screen 60 times a second the loops sleep in pygame.event.wait until an event
+# comes (or IDLE_TIMEOUT_MS passes) and draw only when the view is dirty:
+#   - a key press, click or window event (sub-screens and dialogs opened by one of them
+#     draw over the menu, it has to be drawn again when they return)
+#   - a change of the watched model state (selected item, modal button, volume), which
+#     is how mouse hover shows up
+# A loop with nothing to draw costs one wake-up per timeout instead of 60 frames a second.
+
+IDLE_TIMEOUT_MS = 250 # longest sleep of an idle loop
+
+REDRAW_EVENTS = frozenset((
+    pygame.QUIT, pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN,
+    pygame.VIDEOEXPOSE, pygame.VIDEORESIZE, pygame.ACTIVEEVENT,
+    pygame.WINDOWEXPOSED, pygame.WINDOWSHOWN, pygame.WINDOWRESTORED,
+    pygame.WINDOWRESIZED, pygame.WINDOWSIZECHANGED, pygame.WINDOWFOCUSGAINED,
+))
+
+
+class IdleRedraw:
+
+    def __init__(self, timeout_ms: int | None = None):
+        self.timeout_ms = IDLE_TIMEOUT_MS if timeout_ms is None else timeout_ms
+        self.dirty = True # the first frame is always drawn
+        self._state = None
+        self.frames = 0 # frames drawn
+        self.waits = 0  # times the loop slept waiting for events
+
+    def get_events(self) -> list:
+        # pygame.event.get() for the loop, sleeping first while there is nothing to draw
+        waited = None
+        if not self.dirty:
+            waited = pygame.event.wait(self.timeout_ms) # NOEVENT on timeout
+            self.waits += 1
+        events = list(pygame.event.get())
+        if waited is not None and waited.type != pygame.NOEVENT:
+            events.insert(0, waited) # wait() took it off the queue, it came first
+        for event in events:
+            if event.type in REDRAW_EVENTS:
+                self.dirty = True
+        return events
+
+    def watch(self, *state):
+        # Model values the view shows, it's redrawn when one of them changes
+        if state != self._state:
+            self._state = state
+            self.dirty = True
+
+    def mark_dirty(self):
+        self.dirty = True
+
+    def should_draw(self) -> bool:
+        # True once per change: the caller draws and flips, then the loop can sleep again
+        if not self.dirty:
+            return False
+        self.dirty = False
+        self.frames += 1
+        return True
@@ -0,0 +1,158 @@
+import os
+import struct
+import pygame
+from .game_rng import MIN_SEED, MAX_SEED
+
+# Compact binary log of the input consumed by the game, one key state per logical tick.
+#
+# Layout (little endian):
+#   header  magic "GILG", version u8, seed i64, dt_ms f64, skin id length u8 + utf-8 skin id,
+#           game mode: flags u8 (ENDLESS_FLAG, HORDE_FLAG), wave file length u16 + utf-8 path
+#           (version 2, version 1 logs have no mode and replay the campaign)
+#   records tick u32, key mask u16 -- written only when the mask differs from the previous tick
+#   end     last tick u32, END_MARK u16
+#
+# A match of a few minutes with normal play is a few KB.
+
+MAGIC = b"GILG"
+VERSION = 2
+HEADER = struct.Struct("<4sBqd")
+MODE = struct.Struct("<BH")
+ENDLESS_FLAG = 1
+HORDE_FLAG = 2
+RECORD = struct.Struct("<IH")
+END_MARK = 0xFFFF
+
+# Keys the game reads, bit i of the mask = RECORDED_KEYS[i] pressed
+RECORDED_KEYS = (
+    pygame.K_LEFT, pygame.K_a, pygame.K_RIGHT, pygame.K_d,  # movement
+    pygame.K_1, pygame.K_2, pygame.K_3, pygame.K_4,         # wall-nut slots
+    pygame.K_ESCAPE,                                        # pause
+)
+
+
+def encode_keys(keys) -> int:
+    # Key mask from anything indexable like pygame.key.get_pressed()
+    mask = 0
+    for bit, key in enumerate(RECORDED_KEYS):
+        if keys[key]:
+            mask |= 1 << bit
+    return mask
+
+
+def decode_keys(mask: int) -> set:
+    # Set of pressed keys from a key mask
+    return {key for bit, key in enumerate(RECORDED_KEYS) if mask & (1 << bit)}
+
+
+_session_paths = set() # logs written by this process
+
+
+def session_log_path(pattern: str, seed: int) -> str:
+    # Path of a new log from the GARDEN_INVASION_RECORD pattern ("{seed}" = session seed).
+    # A path already written by this process (pattern without "{seed}", fixed seed,
+    # in-game restart) gets a -2, -3... suffix instead of overwriting the earlier game
+    path = pattern.format(seed=seed)
+    root, ext = os.path.splitext(path)
+    number = 1
+    while path in _session_paths:
+        number += 1
+        path = f"{root}-{number}{ext}"
+    _session_paths.add(path)
+    return path
+
+
+class InputRecorder:
+    # Writes the input log while a game is played
+
+    # waves, endless, horde: the game mode, as passed to GameSimulation (waves = wave file path)
+    def __init__(self, path, seed: int, dt_ms: float, skin_id: str = "default", waves: str = None,
+                 endless: bool = False, horde: bool = False):
+        if not MIN_SEED <= seed <= MAX_SEED:
+            raise ValueError(f"seed {seed} is out of range for the input log ({MIN_SEED} to {MAX_SEED})")
+        self.path = path
+        self._file = open(path, "wb")
+        skin = skin_id.encode("utf-8")[:255]
+        self._file.write(HEADER.pack(MAGIC, VERSION, seed, dt_ms))
+        self._file.write(bytes([len(skin)]) + skin)
+        wave_file = (waves or "").encode("utf-8")
+        if len(wave_file) > 0xFFFF:
+            raise ValueError(f"wave file path too long for the input log: {waves}")
+        flags = (ENDLESS_FLAG if endless else 0) | (HORDE_FLAG if horde else 0)
+        self._file.write(MODE.pack(flags, len(wave_file)) + wave_file)
+        self._last_mask = 0
+        self.last_tick = 0
+
+    def record(self, tick: int, keys, escape: bool = False):
+        # Key state consumed at the given logical tick; escape = ESC pressed this frame
+        mask = encode_keys(keys)
+        if escape:
+            mask |= 1 << RECORDED_KEYS.index(pygame.K_ESCAPE)
+        if mask != self._last_mask:
+            self._file.write(RECORD.pack(tick, mask))
+            self._last_mask = mask
+        self.last_tick = tick
+
+    def close(self):
+        if self._file.closed:
+            return
+        self._file.write(RECORD.pack(self.last_tick, END_MARK))
+        self._file.close()
+
+
+class InputLog:
+    # Input log read back from disk
+
+    def __init__(self, seed: int, dt_ms: float, skin_id: str, changes: list, last_tick: int,
+                 waves: str = None, endless: bool = False, horde: bool = False):
+        self.seed = seed
+        self.dt_ms = dt_ms
+        self.skin_id = skin_id
+        self.waves = waves          # wave file path, None for the campaign
+        self.endless = endless
+        self.horde = horde
+        self.changes = changes      # [(tick, mask)] in tick order
+        self.last_tick = last_tick  # number of ticks recorded
+
+    def masks(self):
+        # Key mask of every tick, from tick 1 to last_tick
+        changes = iter(self.changes)
+        next_change = next(changes, None)
+        mask = 0
+        for tick in range(1, self.last_tick + 1):
+            while next_change is not None and next_change[0] <= tick:
+                mask = next_change[1]
+                next_change = next(changes, None)
+            yield mask
+
+
+def read_input_log(path) -> InputLog:
+    with open(path, "rb") as f:
+        data = f.read()
+
+    magic, version, seed, dt_ms = HEADER.unpack_from(data, 0)
+    if magic != MAGIC or version not in (1, VERSION):
+        raise ValueError(f"{path} is not a Garden Invasion input log")
+    offset = HEADER.size
+    skin_length = data[offset]
+    skin_id = data[offset + 1:offset + 1 + skin_length].decode("utf-8")
+    offset += 1 + skin_length
+    flags, waves = 0, None
+    if version >= 2:
+        flags, waves_length = MODE.unpack_from(data, offset)
+        offset += MODE.size
+        waves = data[offset:offset + waves_length].decode("utf-8") or None
+        offset += waves_length
+
+    changes = []
+    last_tick = 0
+    body = data[offset:]
+    body = body[:len(body) - len(body) % RECORD.size] # drop a record cut by an abrupt exit
+    for tick, mask in RECORD.iter_unpack(body):
+        if mask == END_MARK:
+            last_tick = tick
+            break
+        changes.append((tick, mask))
+        last_tick = tick # logs cut short (game closed abruptly) replay up to the last change
+    return InputLog(seed, dt_ms, skin_id, changes, last_tick,
+                    waves, bool(flags & ENDLESS_FLAG), bool(flags & HORDE_FLAG))
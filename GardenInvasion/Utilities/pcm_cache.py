@@ -0,0 +1,94 @@
+import hashlib
+import mmap
+import os
+import struct
+import tempfile
+from pathlib import Path
+import pygame
+
+# On-disk cache of decoded sound effects.
+# The first launch decodes an effect (OGG, MP3, WAV) with pygame.mixer.Sound as usual and
+# writes its samples, already converted to the mixer's frequency and format, to one file
+# per effect; later launches map the file and build the Sound from the raw PCM
+# (pygame.mixer.Sound(buffer=...)), no decoding and no resampling.
+# An entry is keyed by the hash of the source file, the mixer format and the pygame
+# version, so editing a sound or opening the mixer with other settings just makes new
+# entries. Music is not cached here, pygame.mixer.music streams it.
+
+CACHE_VERSION = 1
+HEADER = struct.Struct("<8sI") # magic, sample bytes
+MAGIC = b"GIPCM001"
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "garden_invasion" / "sounds"
+
+
+class PcmCache:
+
+    def __init__(self, directory=DEFAULT_CACHE_DIR):
+        self.directory = Path(directory)
+        self._digests = {} # source path -> hash of its content, read once per process
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+
+    def get_sound(self, path) -> pygame.mixer.Sound:
+        # Sound of this file, from the cache or decoded (and then cached).
+        # Raises pygame.error / FileNotFoundError like pygame.mixer.Sound
+        sound = self.load(path)
+        if sound is None:
+            sound = pygame.mixer.Sound(str(path))
+            self.store(path, sound)
+        return sound
+
+    def load(self, path):
+        # Cached Sound of this file, None if there is none (or it can't be read).
+        # Raises FileNotFoundError when the source file doesn't exist
+        entry = self._entry_path(path)
+        try:
+            with open(entry, "rb") as f:
+                samples = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError): # missing or empty
+            self.misses += 1
+            return None
+
+        try:
+            magic, length = HEADER.unpack_from(samples) if len(samples) >= HEADER.size else (b"", 0)
+            if magic != MAGIC or len(samples) != HEADER.size + length: # not an entry, or cut short
+                self.misses += 1
+                return None
+            # the Sound keeps its own copy of the samples, the map can go
+            sound = pygame.mixer.Sound(buffer=memoryview(samples)[HEADER.size:])
+        finally:
+            samples.close()
+        self.hits += 1
+        return sound
+
+    def store(self, path, sound: pygame.mixer.Sound):
+        # Write the samples of a decoded effect, failures only cost the next launch a decode
+        raw = sound.get_raw()
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            # write aside and rename, a crash never leaves a half-written entry
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                f.write(HEADER.pack(MAGIC, len(raw)))
+                f.write(raw)
+            os.replace(tmp_path, self._entry_path(path))
+            self.writes += 1
+        except OSError as e:
+            print(f"Warning: Could not write sound cache entry for '{path}': {e}")
+
+    def stats(self) -> dict:
+        return {'hits': self.hits, 'misses': self.misses, 'writes': self.writes}
+
+    def _digest(self, path) -> str:
+        path = str(path)
+        digest = self._digests.get(path)
+        if digest is None:
+            with open(path, "rb") as f:
+                digest = self._digests[path] = hashlib.sha1(f.read()).hexdigest()
+        return digest
+
+    def _entry_path(self, path) -> Path:
+        # (frequency, format, channels) of the open mixer, the samples are in that format
+        key = f"{CACHE_VERSION}|{self._digest(path)}|{pygame.mixer.get_init()!r}|{pygame.version.ver}"
+        return self.directory / (hashlib.sha1(key.encode()).hexdigest() + ".pcm")
@@ -0,0 +1,45 @@
+from concurrent.futures import ThreadPoolExecutor
+import pygame
+
+# Background loading of game assets.
+# Tasks run one after the other on a single worker thread while the caller keeps going
+# (the main menu keeps responding to input); wait() blocks until a named task is done.
+# A failed or missing task is not fatal: wait() returns None and the game loads the
+# asset on demand, as it would without a preloader.
+# The worker uses pygame (image loading, convert_alpha): it is stopped by pygame.quit(),
+# before pygame shuts down, whichever screen the game is quit from.
+
+
+class Preloader:
+
+    def __init__(self):
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="preload")
+        self._futures = {} # task name -> Future
+        pygame.register_quit(self.shutdown) # runs before pygame's modules quit
+
+    def submit(self, name: str, fn, *args):
+        # Start fn(*args) in the background, once per name. Returns its Future
+        future = self._futures.get(name)
+        if future is None:
+            future = self._futures[name] = self._executor.submit(fn, *args)
+        return future
+
+    def done(self, name: str) -> bool:
+        future = self._futures.get(name)
+        return future is not None and future.done()
+
+    def wait(self, name: str, timeout=None):
+        # Result of the named task, waiting for it if it's still running.
+        # None if it was never submitted or failed
+        future = self._futures.get(name)
+        if future is None:
+            return None
+        try:
+            return future.result(timeout)
+        except Exception as e:
+            print(f"Warning: Preloading '{name}' failed: {e}")
+            return None
+
+    def shutdown(self):
+        # Stop the worker, tasks not started yet are dropped
+        self._executor.shutdown(wait=True, cancel_futures=True)
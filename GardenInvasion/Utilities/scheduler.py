@@ -0,0 +1,104 @@
+import heapq
+import itertools
+from .game_clock import get_ticks
+
+# Timed callbacks on game time.
+# Events live in a min-heap keyed by (time, insertion order): scheduling and running the
+# next due event are O(log n), and nothing is scanned while waiting. Cancelled events stay
+# in the heap and are skipped when they come up (the heap is rebuilt when they pile up).
+# Events due at the same time run in the order they were scheduled.
+
+COMPACT_MIN = 64  # don't bother rebuilding tiny heaps
+
+
+class ScheduledEvent:
+    # Handle returned by Scheduler.schedule_at/schedule_in
+
+    __slots__ = ('time', 'callback', 'args', 'cancelled', '_scheduler')
+
+    def __init__(self, time: float, callback, args: tuple, scheduler):
+        self.time = time
+        self.callback = callback
+        self.args = args
+        self.cancelled = False
+        self._scheduler = scheduler
+
+    @property
+    def pending(self) -> bool:
+        # still waiting to run
+        return self._scheduler is not None and not self.cancelled
+
+    def cancel(self):
+        # The callback won't run; no effect once it ran
+        if self.pending:
+            self.cancelled = True
+            self._scheduler._cancelled_one()
+
+
+class Scheduler:
+
+    def __init__(self, clock=None):
+        self.clock = clock # game clock, None = pygame real time
+        self._heap = []
+        self._order = itertools.count()
+        self._live = 0      # scheduled, not cancelled, not run
+        self._cancelled = 0 # cancelled events still in the heap
+
+    def __len__(self) -> int:
+        return self._live
+
+    def schedule_at(self, time_ms: float, callback, *args) -> ScheduledEvent:
+        # Run callback(*args) once game time reaches time_ms
+        event = ScheduledEvent(time_ms, callback, args, self)
+        heapq.heappush(self._heap, (time_ms, next(self._order), event))
+        self._live += 1
+        return event
+
+    def schedule_in(self, delay_ms: float, callback, *args) -> ScheduledEvent:
+        # Run callback(*args) delay_ms from now
+        return self.schedule_at(get_ticks(self.clock) + delay_ms, callback, *args)
+
+    def next_time(self):
+        # Time of the next pending event, None if there is none
+        self._drop_cancelled()
+        return self._heap[0][0] if self._heap else None
+
+    def run_due(self, now: float = None) -> int:
+        # Run every event due at now (default: the current game time), returns how many ran.
+        # Events scheduled by a callback run in the same call if they are already due
+        if now is None:
+            now = get_ticks(self.clock)
+        heap = self._heap
+        ran = 0
+        while heap and heap[0][0] <= now:
+            event = heapq.heappop(heap)[2]
+            if event.cancelled:
+                self._cancelled -= 1
+                continue
+            event._scheduler = None
+            self._live -= 1
+            event.callback(*event.args)
+            ran += 1
+        return ran
+
+    def clear(self):
+        # Drop every pending event
+        for _, _, event in self._heap:
+            event._scheduler = None
+        self._heap = []
+        self._live = self._cancelled = 0
+
+    def _cancelled_one(self):
+        self._live -= 1
+        self._cancelled += 1
+        # rebuild once most of the heap is dead weight, keeps pushes and pops O(log live)
+        if self._cancelled > COMPACT_MIN and self._cancelled > self._live:
+            self._heap = [entry for entry in self._heap if not entry[2].cancelled]
+            heapq.heapify(self._heap)
+            self._cancelled = 0
+
+    def _drop_cancelled(self):
+        heap = self._heap
+        while heap and heap[0][2].cancelled:
+            heapq.heappop(heap)
+            self._cancelled -= 1
@@ -0,0 +1,135 @@
+import pygame
+
+# Uniform grid broadphase for the collision passes.
+# The groups that get hit (zombies, zombie projectiles, wall-nuts, power-ups) are bucketed
+# into fixed-size cells once per frame, then every pass only tests the sprites sharing a cell
+# with the one being checked instead of scanning the whole group.
+# groupcollide/spritecollide have the same signature and kill semantics as pygame.sprite,
+# so the collision handlers can use either one.
+# Building the cells costs more than it saves on a small field: below MIN_PAIR_CHECKS rect
+# tests per frame (hitters x targets over all passes, see pair_checks) rebuild() leaves the
+# groups unindexed and every query goes straight to pygame.sprite.
+# Measured (benchmarks collisions vs collisions_bruteforce): 300 sprites of each kind,
+# 93k tests, 11.8 ms with the grid vs 9.4 ms without; 400 sprites, 164k tests, 13.1 vs 14.5 ms.
+
+DEFAULT_CELL_SIZE = 64  # about one zombie wide, so most sprites fall in 1-4 cells
+MIN_PAIR_CHECKS = 120_000
+
+
+def pair_checks(*pairs) -> int:
+    # rect tests the plain pygame passes would do: len(hitters) * len(targets), summed
+    return sum(len(hitters) * len(targets) for hitters, targets in pairs)
+
+
+class SpatialGrid:
+
+    def __init__(self, cell_size: int = DEFAULT_CELL_SIZE, min_pair_checks: int = MIN_PAIR_CHECKS):
+        self.cell_size = cell_size
+        self.min_pair_checks = min_pair_checks
+        self._cells = {}     # (column, row) -> ([sprites], [their rects]) overlapping that cell
+        self._order = {}     # sprite -> position in the indexed groups, keeps pygame's result order
+        self._groups = []    # groups indexed by the last rebuild()
+
+    def rebuild(self, *groups, checks: int = None):
+        # Index every sprite of the given groups at its current position.
+        # Call it after the sprites moved and before the collision passes.
+        # checks = pair_checks() of the coming passes: below min_pair_checks nothing is
+        # indexed and the passes use pygame.sprite. Returns True if the groups are indexed
+        self._cells.clear()
+        self._order.clear()
+        if checks is not None and checks < self.min_pair_checks:
+            self._groups = []
+            return False
+        self._groups = list(groups)
+        for group in groups:
+            for sprite in group:
+                self._insert(sprite)
+        return True
+
+    def is_indexed(self, group) -> bool:
+        return any(indexed is group for indexed in self._groups)
+
+    def spritecollide(self, sprite, group, dokill, collided=None):
+        # Same as pygame.sprite.spritecollide, answered from the grid when group is indexed
+        if not self._can_answer(group, collided):
+            return pygame.sprite.spritecollide(sprite, group, dokill, collided)
+
+        crashed = self._hits(sprite.rect, group)
+        if dokill:
+            for group_sprite in crashed:
+                group_sprite.kill()
+        return crashed
+
+    def groupcollide(self, groupa, groupb, dokilla, dokillb, collided=None):
+        # Same as pygame.sprite.groupcollide, groupb must be indexed to use the grid
+        if not self._can_answer(groupb, collided):
+            return pygame.sprite.groupcollide(groupa, groupb, dokilla, dokillb, collided)
+
+        crashed = {}
+        for group_a_sprite in groupa.sprites():
+            collision = self.spritecollide(group_a_sprite, groupb, dokillb, collided)
+            if collision:
+                crashed[group_a_sprite] = collision
+                if dokilla:
+                    group_a_sprite.kill()
+        return crashed
+
+    def stats(self) -> dict:
+        sizes = [len(sprites) for sprites, _ in self._cells.values()]
+        return {
+            'sprites': len(self._order),
+            'cells': len(sizes),
+            'max_per_cell': max(sizes, default=0),
+        }
+
+    def _can_answer(self, group, collided) -> bool:
+        # only plain rect collisions can be answered from the cells
+        return (collided is None or collided is pygame.sprite.collide_rect) and self.is_indexed(group)
+
+    def _insert(self, sprite):
+        if sprite in self._order:
+            return # sprite in more than one indexed group
+        self._order[sprite] = len(self._order)
+        rect = sprite.rect
+        for cell in self._cells_for(rect):
+            bucket = self._cells.get(cell)
+            if bucket is None:
+                bucket = self._cells[cell] = ([], [])
+            bucket[0].append(sprite)
+            bucket[1].append(rect)
+
+    def _cells_for(self, rect):
+        size = self.cell_size
+        first_column, first_row = rect.left // size, rect.top // size
+        last_column = max(first_column, (rect.right - 1) // size)
+        last_row = max(first_row, (rect.bottom - 1) // size)
+        return [
+            (column, row)
+            for column in range(first_column, last_column + 1)
+            for row in range(first_row, last_row + 1)
+        ]
+
+    def _hits(self, rect, group):
+        # sprites of group colliding with rect, in group order.
+        # Each cell is tested with Rect.collidelistall, sprites killed since the
+        # rebuild are no longer in the group and are skipped
+        in_group = group.has_internal
+        cells = self._cells_for(rect)
+        if len(cells) == 1:
+            # common case for small sprites: one cell, already in order and without duplicates
+            bucket = self._cells.get(cells[0])
+            if bucket is None:
+                return []
+            sprites = bucket[0]
+            return [sprites[i] for i in rect.collidelistall(bucket[1]) if in_group(sprites[i])]
+
+        found = set()
+        for cell in cells:
+            bucket = self._cells.get(cell)
+            if bucket is not None:
+                sprites = bucket[0]
+                found.update(sprites[i] for i in rect.collidelistall(bucket[1]))
+        return sorted(
+            (sprite for sprite in found if in_group(sprite)),
+            key=self._order.__getitem__
+        )
@@ -0,0 +1,198 @@
+import argparse
+import hashlib
+import json
+import sys
+from pathlib import Path
+import pygame
+from .asset_cache import AssetCache, IMAGES_PATH
+
+# Texture atlas of the gameplay sprites.
+# An offline build step decodes the sprites, scales them exactly as AssetCache would and
+# packs the results into one or a few sheets, with a JSON index of where each one is:
+#
+#   python -m GardenInvasion.Utilities.texture_atlas          # rebuild Assets/atlas
+#   python -m GardenInvasion.Utilities.texture_atlas --check  # exit 1 if it is out of date
+#
+# At runtime AtlasLoader decodes a sheet once and hands out subsurfaces of it, so the
+# large source PNGs (plants, zombies, hearts) are never read or kept in memory.
+# Index keys are "<file>|<size>|<scale mode>", the arguments of AssetCache.get_image.
+
+ATLAS_PATH = IMAGES_PATH.parent / "atlas"
+DEFAULT_ATLAS = ATLAS_PATH / "sprites.json"
+SHEET_SIZE = 1024  # max sheet width and height
+PADDING = 1        # transparent pixels between sprites
+ATLAS_VERSION = 1
+
+
+def atlas_key(path, size, mode):
+    # Index key of an AssetCache spec, None for images outside Assets/images
+    path = Path(path)
+    if path.parent.resolve() != IMAGES_PATH:
+        return None
+    if isinstance(size, list):
+        size = tuple(size)
+    return f"{path.name}|{size!r}|{mode}"
+
+
+def _file_digest(path) -> str:
+    with open(path, "rb") as f:
+        return hashlib.sha1(f.read()).hexdigest()
+
+
+def pack(sizes: dict, sheet_size: int = SHEET_SIZE, padding: int = PADDING) -> dict:
+    # Shelf packing: tallest first, left to right in rows, a new sheet when one is full.
+    # sizes = key -> (w, h), returns key -> (sheet, x, y)
+    placements = {}
+    sheet, x, y, row_height = 0, 0, 0, 0
+    for key, (width, height) in sorted(sizes.items(), key=lambda item: (-item[1][1], item[0])):
+        if width > sheet_size or height > sheet_size:
+            raise ValueError(f"{key}: {width}x{height} doesn't fit a {sheet_size}px sheet")
+        if x + width > sheet_size: # next row
+            x, y, row_height = 0, y + row_height + padding, 0
+        if y + height > sheet_size: # next sheet
+            sheet, x, y, row_height = sheet + 1, 0, 0, 0
+        placements[key] = (sheet, x, y)
+        x += width + padding
+        row_height = max(row_height, height)
+    return placements
+
+
+def build_atlas(specs, index_path=DEFAULT_ATLAS, sheet_size: int = SHEET_SIZE) -> dict:
+    # Build the sheets and index of the given (path, size, mode) specs. Needs a display
+    # (convert_alpha), a hidden 1x1 one is enough. Returns the index
+    index_path = Path(index_path)
+    cache = AssetCache() # same decode and scaling code as the game
+    images, sources = {}, {}
+    for path, size, mode in specs:
+        key = atlas_key(path, size, mode)
+        if key is None:
+            raise ValueError(f"{path} is not in {IMAGES_PATH}")
+        images[key] = cache.get_image(path, size, mode)
+        sources[key] = Path(path)
+
+    placements = pack({key: image.get_size() for key, image in images.items()}, sheet_size)
+    sheet_count = max((sheet for sheet, _, _ in placements.values()), default=-1) + 1
+    sheets = []
+    for number in range(sheet_count):
+        keys = [key for key, placement in placements.items() if placement[0] == number]
+        # trim the sheet to what it uses
+        width = max(placements[key][1] + images[key].get_width() for key in keys)
+        height = max(placements[key][2] + images[key].get_height() for key in keys)
+        surface = pygame.Surface((width, height), pygame.SRCALPHA)
+        for key in keys:
+            # copy the pixels as they are, alpha included
+            surface.blit(images[key], placements[key][1:], special_flags=pygame.BLEND_RGBA_MAX)
+        sheets.append(surface)
+
+    index_path.parent.mkdir(parents=True, exist_ok=True)
+    sheet_names = []
+    for number, surface in enumerate(sheets):
+        name = f"{index_path.stem}_{number}.png"
+        pygame.image.save(surface, str(index_path.parent / name))
+        sheet_names.append(name)
+
+    index = {
+        'version': ATLAS_VERSION,
+        'sheets': sheet_names,
+        'sprites': {
+            key: {
+                'sheet': placements[key][0],
+                'rect': [placements[key][1], placements[key][2], *images[key].get_size()],
+                'sha1': _file_digest(sources[key]), # of the source file, to spot stale atlases
+            }
+            for key in sorted(images)
+        },
+    }
+    with open(index_path, "w", encoding="utf-8") as f:
+        json.dump(index, f, indent=1)
+        f.write("\n")
+    return index
+
+
+class AtlasLoader:
+    # Sprites of a built atlas, as subsurfaces of sheets decoded on first use
+
+    def __init__(self, index_path=DEFAULT_ATLAS):
+        self.index_path = Path(index_path)
+        with open(self.index_path, encoding="utf-8") as f:
+            index = json.load(f)
+        if index.get('version') != ATLAS_VERSION:
+            raise ValueError(f"{self.index_path}: unsupported atlas version {index.get('version')!r}")
+        self._sheet_names = index['sheets']
+        self._sprites = index['sprites']
+        self._sheets = {} # sheet number -> decoded Surface
+
+    def __len__(self) -> int:
+        return len(self._sprites)
+
+    def __contains__(self, key) -> bool:
+        return key in self._sprites
+
+    def lookup(self, path, size, mode):
+        # Atlas sprite of an AssetCache spec, None when the atlas doesn't have it
+        key = atlas_key(path, size, mode)
+        if key not in self._sprites:
+            return None
+        return self.get(key)
+
+    def get(self, key: str) -> pygame.Surface:
+        entry = self._sprites[key]
+        sheet = self._sheets.get(entry['sheet'])
+        if sheet is None:
+            path = self.index_path.parent / self._sheet_names[entry['sheet']]
+            sheet = self._sheets[entry['sheet']] = pygame.image.load(str(path)).convert_alpha()
+        return sheet.subsurface(pygame.Rect(entry['rect']))
+
+    def stale_keys(self) -> list:
+        # Sprites whose source file changed (or is gone) since the atlas was built
+        stale = []
+        for key, entry in self._sprites.items():
+            source = IMAGES_PATH / key.split("|", 1)[0]
+            if not source.exists() or _file_digest(source) != entry['sha1']:
+                stale.append(key)
+        return stale
+
+
+def game_sprite_specs() -> list:
+    # Every gameplay sprite spec: the ones registered by the game modules (zombies,
+    # wall-nuts, shots, life heart), plus the player skins and the power-ups (sized like
+    # the zombie shots)
+    from ..Controller import NewGame_controller # imports every gameplay module, registering their sprites
+    from ..Model.plant_model import PLAYER_SPRITE_SCALE
+    from ..Model.skin_selection_model import SKINS, skin_sprite_path
+    from ..Model.PowerUp_model import INCREASE_FIRE_SPRITE, REPAIR_WALLNUT_SPRITE, get_zombie_projectile_size
+    from .asset_cache import asset_cache, SCALE_SMOOTH
+
+    specs = list(asset_cache._specs)
+    specs += [(skin_sprite_path(skin_id), PLAYER_SPRITE_SCALE, SCALE_SMOOTH) for skin_id, _, _ in SKINS]
+    powerup_size = get_zombie_projectile_size()
+    specs += [(INCREASE_FIRE_SPRITE, powerup_size, SCALE_SMOOTH), (REPAIR_WALLNUT_SPRITE, powerup_size, SCALE_SMOOTH)]
+    return specs
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m GardenInvasion.Utilities.texture_atlas",
+                                     description="Build the texture atlas of the gameplay sprites")
+    parser.add_argument("-o", "--output", default=str(DEFAULT_ATLAS), help="index file, sheets are written next to it")
+    parser.add_argument("--check", action="store_true", help="only check that the atlas is up to date")
+    args = parser.parse_args(argv)
+
+    pygame.init()
+    pygame.display.set_mode((1, 1), pygame.HIDDEN) # convert_alpha needs a display
+    if args.check:
+        atlas = AtlasLoader(args.output)
+        stale = atlas.stale_keys()
+        missing = [atlas_key(*spec) for spec in game_sprite_specs() if atlas_key(*spec) not in atlas]
+        for key in stale:
+            print(f"out of date: {key}")
+        for key in missing:
+            print(f"missing: {key}")
+        return 1 if stale or missing else 0
+
+    index = build_atlas(game_sprite_specs(), args.output)
+    print(f"{len(index['sprites'])} sprites packed into {len(index['sheets'])} sheet(s): {', '.join(index['sheets'])}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,11 +1,15 @@
 import pygame
-from ..View.zombie_view import draw_zombies
+from .hud_view import GameHUD
 
 def draw_wallnuts(screen: pygame.Surface, wallnut_group: pygame.sprite.Group):
     # Draws all wall-nuts on the screen.
     wallnut_group.draw(screen)
 
-def draw_hearts(screen: pygame.Surface, player_health: int, heart_image: pygame.Surface):
+def _blit_group(screen: pygame.Surface, group) -> list:
+    # Draws every sprite of the group, returns the screen areas they cover
+    return screen.blits([(sprite.image, sprite.rect) for sprite in group])
+
+def draw_hearts(screen: pygame.Surface, player_health: int, heart_image: pygame.Surface) -> list:
     # Heart positioning
     heart_size = 40  
     spacing = 10
@@ -15,12 +19,14 @@ def draw_hearts(screen: pygame.Surface, player_health: int, heart_image: pygame.
     start_x = screen.get_width() - margin - (heart_size * player_health) - (spacing * (player_health - 1))
     start_y = margin
     
-    # Draw hearts
+    # Draw hearts, returns the screen areas they cover.
+    # Scaled once per call, GameHUD keeps the strips pre-rendered across frames
+    heart_rects = []
+    scaled_heart = pygame.transform.scale(heart_image, (heart_size, heart_size))
     for i in range(player_health):
         x_pos = start_x + (i * (heart_size + spacing))
-        # Scale heart image if needed
-        scaled_heart = pygame.transform.scale(heart_image, (heart_size, heart_size))
-        screen.blit(scaled_heart, (x_pos, start_y))
+        heart_rects.append(screen.blit(scaled_heart, (x_pos, start_y)))
+    return heart_rects
 
 
 def draw_game(screen: pygame.Surface, 
@@ -32,7 +38,8 @@ def draw_game(screen: pygame.Surface,
               heart_image: pygame.Surface,
               zombie_group=None,
               zombie_projectile_group=None,
-              powerup_group=None):
+              powerup_group=None,
+              hud: GameHUD = None):
     
     # Draw background
     if game_background.surface:
@@ -41,26 +48,99 @@ def draw_game(screen: pygame.Surface,
     else:
         screen.fill((0, 0, 0))  # Fallback to black
     
+    _draw_entities(screen, player_group, projectile_group, wallnut_group, player_health, heart_image,
+                   zombie_group, zombie_projectile_group, powerup_group, hud)
+
+
+def _draw_entities(screen: pygame.Surface,
+                   player_group: pygame.sprite.Group,
+                   projectile_group: pygame.sprite.Group,
+                   wallnut_group: pygame.sprite.Group,
+                   player_health: int,
+                   heart_image: pygame.Surface,
+                   zombie_group=None,
+                   zombie_projectile_group=None,
+                   powerup_group=None,
+                   hud: GameHUD = None) -> list:
+    # Draws everything above the background, returns the screen areas that were drawn
+    drawn = []
+
     # Draw wall-nuts (behind player for visual layering)
-    draw_wallnuts(screen, wallnut_group)
+    drawn += _blit_group(screen, wallnut_group)
     
     # Draw zombies if provided (behind player, above wallnuts)
     if zombie_group:
-        draw_zombies(screen, zombie_group)
+        drawn += _blit_group(screen, zombie_group)
 
     if zombie_projectile_group and len(zombie_projectile_group) > 0:
         # Draw a red circle around each projectile for testing
         for proj in zombie_projectile_group:
             # Draw the projectile itself
-            screen.blit(proj.image, proj.rect)
-            pygame.draw.circle(screen, (255, 0, 0), proj.rect.center, 20, 2)
+            drawn.append(screen.blit(proj.image, proj.rect))
+            drawn.append(pygame.draw.circle(screen, (255, 0, 0), proj.rect.center, 20, 2))
     
     if powerup_group: # Draw power-ups if provided
-        powerup_group.draw(screen)
+        drawn += _blit_group(screen, powerup_group)
     
     # Draw player
-    player_group.draw(screen)
+    drawn += _blit_group(screen, player_group)
     # Draw projectiles
-    projectile_group.draw(screen)
-    # Draw hearts
-    draw_hearts(screen, player_health, heart_image)
\ No newline at end of file
+    drawn += _blit_group(screen, projectile_group)
+    # Draw hearts, through the cached HUD layer when there is one
+    if hud:
+        hud.set_life_points(player_health)
+        drawn += hud.draw(screen)
+    else:
+        drawn += draw_hearts(screen, player_health, heart_image)
+    return drawn
+
+
+class DirtyGameRenderer:
+    # Opt-in alternative to draw_game + pygame.display.flip().
+    # Instead of repainting the whole background every frame it only restores the background
+    # under last frame's sprites, redraws the sprites and returns the changed areas
+    # (old and new positions) to be pushed with pygame.display.update(rects)
+
+    def __init__(self, screen: pygame.Surface, game_background, heart_image: pygame.Surface, hud: GameHUD = None):
+        self.screen = screen
+        self.heart_image = heart_image
+        self.hud = hud if hud is not None else GameHUD(heart_image, screen.get_size())
+
+        # background composed once, same result as the full clear in draw_game
+        self.background = pygame.Surface(screen.get_size()).convert()
+        self.background.fill((0, 0, 0))
+        if game_background.surface:
+            self.background.blit(game_background.surface, game_background.rect)
+
+        self._last_drawn = []     # areas drawn in the previous frame
+        self._full_redraw = True  # first frame paints and pushes the whole screen
+
+    def invalidate(self):
+        # Something else drew on the screen (pause menu, dialogs): repaint everything next frame
+        self._full_redraw = True
+
+    def mark_drawn(self, rect: pygame.Rect):
+        # Something was drawn over this frame (e.g. the profiler overlay): erase it next frame
+        self._last_drawn.append(rect)
+
+    def draw(self, player_group, projectile_group, wallnut_group, player_health: int,
+             zombie_group=None, zombie_projectile_group=None, powerup_group=None) -> list:
+        # Draw a frame, returns the rects to pass to pygame.display.update()
+        screen = self.screen
+        if self._full_redraw:
+            screen.blit(self.background, (0, 0))
+            erased = []
+        else:
+            erased = self._last_drawn
+            for rect in erased: # put the background back where the sprites were
+                screen.blit(self.background, rect, rect)
+
+        drawn = _draw_entities(screen, player_group, projectile_group, wallnut_group, player_health,
+                               self.heart_image, zombie_group, zombie_projectile_group, powerup_group,
+                               self.hud)
+        self._last_drawn = drawn
+
+        if self._full_redraw:
+            self._full_redraw = False
+            return [screen.get_rect()]
+        return erased + drawn
@@ -0,0 +1,105 @@
+import pygame
+
+try:
+    import numpy as np
+except ImportError: # optional dependency, backdrops fall back to a smoothscale blur without it
+    np = None
+
+# Blurred and darkened backdrop behind the modal dialogs (pause, quit, contact, game over,
+# victory). It is built once when the modal opens, from a snapshot of the screen, and the
+# modal loop blits it as is: no overlay surface, no blending per frame.
+# The snapshot is shrunk by DOWNSCALE (area average), blurred there with BOX_PASSES
+# separable box filters (close to a Gaussian) on a float copy of its pixels, darkened in
+# the same buffer and scaled back up, which smooths what is left of the box edges.
+# The scratch arrays, the small surface and the output surface are kept for the next
+# modal of the same size; modals never stack, so one output surface is enough.
+
+BLUR_AVAILABLE = np is not None
+
+DOWNSCALE = 8     # blur at an eighth of the screen size, as the game over backdrop did
+BOX_PASSES = 3    # three box blurs approximate a Gaussian
+DARKEN_ALPHA = 150 # as a black overlay of alpha 150 (game over)
+DIALOG_DARKEN = 212 # pause, quit and contact dialogs: the 150 overlay twice, controller and view
+
+
+class Backdrop:
+
+    def __init__(self):
+        self._small = None   # snapshot at 1/DOWNSCALE
+        self._output = None  # backdrop at full size
+        self._scratch = {}   # array shape -> float32 buffer
+        self.builds = 0
+
+    def build(self, screen: pygame.Surface, radius: int = 8, darken: int = DARKEN_ALPHA) -> pygame.Surface:
+        # Blurred copy of the screen, radius in screen pixels, darkened like a black overlay
+        # of alpha darken. The returned surface is reused by the next build
+        size = screen.get_size()
+        small_size = (max(1, size[0] // DOWNSCALE), max(1, size[1] // DOWNSCALE))
+        # same pixel format as the screen, smoothscale writes into them directly
+        if self._small is None or self._small.get_size() != small_size or self._small.get_masks() != screen.get_masks():
+            self._small = pygame.Surface(small_size, 0, screen)
+        if self._output is None or self._output.get_size() != size or self._output.get_masks() != screen.get_masks():
+            self._output = pygame.Surface(size, 0, screen)
+
+        pygame.transform.smoothscale(screen, small_size, self._small)
+        small_radius = max(1, radius // DOWNSCALE)
+        if BLUR_AVAILABLE:
+            self._blur_arrays(small_radius, 1 - darken / 255)
+        else:
+            self._blur_smoothscale(small_radius, darken)
+        pygame.transform.smoothscale(self._small, size, self._output)
+        self.builds += 1
+        return self._output
+
+    def _blur_arrays(self, radius: int, brightness: float):
+        pixels = pygame.surfarray.pixels3d(self._small) # view of the (w, h, 3) pixels, locks the surface
+        try:
+            work = self._buffer('work', pixels.shape)
+            work[...] = pixels
+            for _ in range(BOX_PASSES):
+                self._box_blur(work, radius, axis=0)
+                self._box_blur(work, radius, axis=1)
+            work *= brightness
+            pixels[...] = work # truncates to uint8
+        finally:
+            del pixels
+
+    def _box_blur(self, data, radius: int, axis: int):
+        # in place moving average of 2*radius+1 values along axis, edges repeated.
+        # Running sums: padded = [0, edge*radius, data, edge*radius], its cumsum C gives
+        # every window as C[i + 2r + 1] - C[i]
+        length = data.shape[axis]
+        shape = list(data.shape)
+        shape[axis] = length + 2 * radius + 1
+        padded = self._buffer(('pad', axis), tuple(shape))
+        view = np.moveaxis(padded, axis, 0)
+        source = np.moveaxis(data, axis, 0)
+        view[0] = 0
+        view[1:radius + 1] = source[0]
+        view[radius + 1:radius + 1 + length] = source
+        view[radius + 1 + length:] = source[-1]
+        np.cumsum(view, axis=0, out=view)
+        np.subtract(view[2 * radius + 1:], view[:length], out=source)
+        source /= 2 * radius + 1
+
+    def _blur_smoothscale(self, radius: int, darken: int):
+        # no NumPy: shrink further and grow back, then darken with a multiply fill
+        width, height = self._small.get_size()
+        tiny = pygame.transform.smoothscale(self._small, (max(1, width // radius), max(1, height // radius)))
+        pygame.transform.smoothscale(tiny, (width, height), self._small)
+        level = 255 - darken
+        self._small.fill((level, level, level), special_flags=pygame.BLEND_MULT)
+
+    def _buffer(self, name, shape: tuple):
+        buffer = self._scratch.get(name)
+        if buffer is None or buffer.shape != shape:
+            buffer = self._scratch[name] = np.empty(shape, dtype=np.float32)
+        return buffer
+
+
+# Process-wide instance used by the modal screens
+backdrop = Backdrop()
+
+
+def build_backdrop(screen: pygame.Surface, radius: int = 8, darken: int = DARKEN_ALPHA) -> pygame.Surface:
+    return backdrop.build(screen, radius, darken)
@@ -0,0 +1,85 @@
+import pygame
+from ..Utilities.font_registry import font_registry, get_font
+
+# counter lines
+font_registry.register("Arial", 20)
+
+# Heart layout, same as draw_hearts
+HEART_SIZE = 40
+HEART_SPACING = 10
+HUD_MARGIN = 20
+TEXT_COLOR = (255, 255, 255)
+
+
+class GameHUD:
+    # Heads-up display drawn over the game: life hearts on the top right and optional
+    # text counters (wave info, power-up timers...) on the top left.
+    # Heart strips are pre-rendered once per life-point value and texts are rendered only
+    # when they change; everything is composed on one layer, rebuilt only after a change,
+    # so drawing the HUD costs a single blit per frame
+
+    def __init__(self, heart_image: pygame.Surface, screen_size: tuple, max_life_points: int = 2, font=None):
+        self.screen_width = screen_size[0]
+        self.font = font # created on the first text if not given
+        heart = pygame.transform.scale(heart_image, (HEART_SIZE, HEART_SIZE))
+        self._heart_strips = [self._render_hearts(heart, count) for count in range(max_life_points + 1)]
+        self._life_points = max_life_points
+        self._texts = {}  # key -> (text, color, rendered Surface), drawn in insertion order
+
+        self._layer = None
+        self._bounds = None # visible part of the layer, the only area blitted
+        self._dirty = True
+
+    def set_life_points(self, life_points: int):
+        life_points = max(0, min(life_points, len(self._heart_strips) - 1))
+        if life_points != self._life_points:
+            self._life_points = life_points
+            self._dirty = True
+
+    def set_text(self, key: str, text: str, color: tuple = TEXT_COLOR):
+        # Add or update a counter line, re-rendered only if text or color changed
+        current = self._texts.get(key)
+        if current is not None and current[0] == text and current[1] == color:
+            return
+        if self.font is None:
+            self.font = get_font("Arial", 20)
+        self._texts[key] = (text, color, self.font.render(text, True, color))
+        self._dirty = True
+
+    def remove_text(self, key: str):
+        if self._texts.pop(key, None) is not None:
+            self._dirty = True
+
+    def draw(self, screen: pygame.Surface) -> list:
+        # Blit the HUD, returns the screen areas it covers
+        if self._dirty:
+            self._compose()
+        if not self._bounds.width or not self._bounds.height:
+            return []
+        return [screen.blit(self._layer, self._bounds.topleft, self._bounds)]
+
+    def _render_hearts(self, heart: pygame.Surface, count: int) -> pygame.Surface:
+        width = max(0, HEART_SIZE * count + HEART_SPACING * (count - 1))
+        strip = pygame.Surface((width, HEART_SIZE), pygame.SRCALPHA)
+        for i in range(count):
+            # hearts don't overlap: copy their pixels as they are, no blending on the empty strip
+            strip.blit(heart, (i * (HEART_SIZE + HEART_SPACING), 0), special_flags=pygame.BLEND_RGBA_MAX)
+        return strip
+
+    def _compose(self):
+        hearts = self._heart_strips[self._life_points]
+        text_heights = [surface.get_height() for _, _, surface in self._texts.values()]
+        height = HUD_MARGIN + max(HEART_SIZE, sum(text_heights))
+
+        layer = pygame.Surface((self.screen_width, height), pygame.SRCALPHA)
+        # top right, same position as draw_hearts
+        layer.blit(hearts, (self.screen_width - HUD_MARGIN - hearts.get_width(), HUD_MARGIN),
+                   special_flags=pygame.BLEND_RGBA_MAX)
+        y = HUD_MARGIN
+        for _, _, surface in self._texts.values():
+            layer.blit(surface, (HUD_MARGIN, y), special_flags=pygame.BLEND_RGBA_MAX)
+            y += surface.get_height()
+
+        self._layer = layer
+        self._bounds = layer.get_bounding_rect()
+        self._dirty = False
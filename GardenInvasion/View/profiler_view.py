@@ -0,0 +1,63 @@
+import pygame
+from ..Utilities.font_registry import get_font
+
+GRAPH_SIZE = (180, 60)      # frame-time graph, one column per frame
+PANEL_POS = (10, 70)        # top left, under the HUD line
+TEXT_REFRESH_FRAMES = 30    # percentile text is re-rendered twice per second at 60 FPS
+SLOW_PHASES_SHOWN = 4
+PANEL_COLOR = (0, 0, 0, 170)
+GRAPH_OK = (98, 222, 109)   # frame within budget
+GRAPH_SLOW = (255, 0, 0)    # frame over budget
+BUDGET_LINE = (255, 255, 0)
+TEXT_COLOR = (255, 255, 255)
+
+
+class ProfilerOverlay:
+    # On-screen frame-time graph (last frames, budget line) with the frame p50/p95/p99
+    # and the slowest phases by p95. Texts are cached and refreshed every few frames
+
+    def __init__(self, profiler, font=None):
+        self.profiler = profiler
+        self.font = font if font is not None else get_font("Arial", 12)
+        self._lines = []
+        self._frames_since_text = TEXT_REFRESH_FRAMES
+
+    def draw(self, screen: pygame.Surface) -> pygame.Rect:
+        # Draw the overlay, returns the screen area it covers
+        if self._frames_since_text >= TEXT_REFRESH_FRAMES:
+            self._lines = [self.font.render(text, True, TEXT_COLOR) for text in self._texts()]
+            self._frames_since_text = 0
+        self._frames_since_text += 1
+
+        graph_width, graph_height = GRAPH_SIZE
+        line_height = self.font.get_linesize()
+        panel = pygame.Surface((graph_width + 10, graph_height + 10 + line_height * len(self._lines)), pygame.SRCALPHA)
+        panel.fill(PANEL_COLOR)
+
+        # bars scaled so that twice the budget fills the graph
+        budget = self.profiler.budget_ms
+        scale = graph_height / (budget * 2)
+        frames = self.profiler.recent_frames_ms()[-graph_width:]
+        for x, frame_ms in enumerate(frames):
+            bar = min(graph_height, int(frame_ms * scale))
+            color = GRAPH_SLOW if frame_ms > budget else GRAPH_OK
+            pygame.draw.line(panel, color, (5 + x, 5 + graph_height), (5 + x, 5 + graph_height - bar))
+        budget_y = 5 + graph_height - int(budget * scale)
+        pygame.draw.line(panel, BUDGET_LINE, (5, budget_y), (5 + graph_width, budget_y))
+
+        y = graph_height + 10
+        for line in self._lines:
+            panel.blit(line, (5, y))
+            y += line_height
+        return screen.blit(panel, PANEL_POS)
+
+    def _texts(self) -> list:
+        phases = self.profiler.summary()['phases']
+        frame = phases.pop('frame', None)
+        if frame is None:
+            return ["profiling..."]
+        texts = [f"frame p50 {frame['p50_ms']:.1f}  p95 {frame['p95_ms']:.1f}  p99 {frame['p99_ms']:.1f} ms"]
+        slowest = sorted(phases.items(), key=lambda item: item[1]['p95_ms'], reverse=True)
+        for name, entry in slowest[:SLOW_PHASES_SHOWN]:
+            texts.append(f"{name}  p95 {entry['p95_ms']:.2f} ms")
+        return texts
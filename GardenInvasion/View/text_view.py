@@ -0,0 +1,85 @@
+import pygame
+from collections import OrderedDict
+from ..Utilities.constants import BLACK
+
+# Outlined text shared by the menu views.
+# An outlined label costs two font renders and (2*width+1)^2 - 1 outline blits, 48 for
+# the title, so every label is built once and the same Surface is handed back on the
+# next frames. The cache is an LRU keyed by (font, text, color, outline color, width):
+# changing labels (volume percentage) fill it, the least recently used ones are dropped.
+# Returned surfaces are shared, callers blit them and never draw on them.
+
+MAX_LABELS = 128
+
+
+class OutlinedTextCache:
+
+    def __init__(self, max_labels: int = MAX_LABELS):
+        self.max_labels = max_labels
+        self._labels = OrderedDict() # key -> Surface, least recently used first
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def render(self, font, text, color, outline_color=BLACK, outline_width=2) -> pygame.Surface:
+        # colors as RGBA tuples, pygame.Color isn't hashable and (r, g, b) is the same color
+        key = (font, text, tuple(pygame.Color(color)), tuple(pygame.Color(outline_color)), outline_width)
+        surface = self._labels.get(key)
+        if surface is not None:
+            self._labels.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        surface = self._labels[key] = _render_outlined(font, text, color, outline_color, outline_width)
+        if len(self._labels) > self.max_labels:
+            self._labels.popitem(last=False)
+            self.evictions += 1
+        return surface
+
+    def stats(self) -> dict:
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'labels': len(self._labels),
+        }
+
+    def clear(self):
+        self._labels.clear()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+
+def _render_outlined(font, text, color, outline_color, outline_width) -> pygame.Surface:
+    # Render text with a dark outline for better visibility on dark backgrounds.
+    outline_text = font.render(text, True, outline_color) # Renders outline text
+    text_width = outline_text.get_width()
+    text_height = outline_text.get_height()
+
+    # Create a surface large enough for outline
+    text_surface = pygame.Surface(
+        (text_width + outline_width * 2, text_height + outline_width * 2),
+        pygame.SRCALPHA
+    )
+
+    # Draw outline in all 8 directions
+    for dx in range(-outline_width, outline_width + 1):
+        for dy in range(-outline_width, outline_width + 1):
+            if dx != 0 or dy != 0: # Skip center position
+                text_surface.blit(outline_text, (dx + outline_width, dy + outline_width)) # Blit outline text
+
+    # Draw main text on top
+    main_text = font.render(text, True, color)
+    text_surface.blit(main_text, (outline_width, outline_width))
+    return text_surface
+
+
+# Process-wide instance used by the views
+text_cache = OutlinedTextCache()
+
+
+def render_text_with_outline(font, text, color, outline_color=BLACK, outline_width=2) -> pygame.Surface:
+    # Outlined label, rendered on first use and shared afterwards
+    return text_cache.render(font, text, color, outline_color, outline_width)
@@ -0,0 +1,226 @@
+import functools
+import pygame
+from ..Utilities.constants import BLACK, GREEN_SI
+from .text_view import render_text_with_outline
+
+# Retained widgets of the menu and dialog screens.
+# A screen builds its widgets once (cached_layout): text is rendered, boxes are placed and
+# button faces are drawn the first time, every frame after that only blits them.
+# The controllers hit-test the mouse against the same widgets, so a button is where it is
+# drawn and the geometry is not computed again on every event.
+# Widgets hold pre-rendered surfaces; one whose content depends on a value (a label's
+# text, a slider's level) renders again only when the value changes.
+
+BUTTON_TEXT = (20, 20, 20)
+BUTTON_BORDER = (40, 40, 40)
+
+
+class HitIndex:
+    # Rects to hit-test against, in order; index of the first one under a point
+    def __init__(self, rects):
+        self.rects = [pygame.Rect(rect) for rect in rects]
+        self._probe = pygame.Rect(0, 0, 1, 1)
+
+    def hit(self, pos) -> int:
+        # -1 if the point is on none of them
+        self._probe.topleft = pos
+        return self._probe.collidelist(self.rects)
+
+
+class Label:
+    # Text centered on a point, outlined (outline_width > 0) or plain.
+    # hit_size: clickable box centered on the text, the text rect if None
+    def __init__(self, font, text, color, center, outline_width=0, outline_color=BLACK, hit_size=None):
+        self.font = font
+        self.color = color
+        self.center = center
+        self.outline_width = outline_width
+        self.outline_color = outline_color
+        self.hit_size = hit_size
+        self.text = None
+        self.set_text(text)
+
+    def set_text(self, text):
+        if text == self.text:
+            return
+        self.text = text
+        if self.outline_width:
+            self.surface = render_text_with_outline(self.font, text, self.color, self.outline_color, self.outline_width)
+        else:
+            self.surface = self.font.render(text, True, self.color)
+        self.rect = self.surface.get_rect(center=self.center)
+        self.hit_rect = pygame.Rect(0, 0, *self.hit_size) if self.hit_size else self.rect.copy()
+        self.hit_rect.center = self.rect.center
+
+    def draw(self, surface, offset=(0, 0)):
+        surface.blit(self.surface, self.rect.move(offset))
+
+
+class Button:
+    # Rounded box with a centered label, one face per state (normal, selected) drawn once
+    def __init__(self, text, font, rect, fill, selected_fill, border=BUTTON_BORDER, border_width=2, radius=8,
+                 text_color=BUTTON_TEXT, selected_text_color=None):
+        self.text = text
+        self.font = font
+        self.rect = pygame.Rect(rect)
+        self.fill = fill
+        self.selected_fill = selected_fill
+        self.border = border
+        self.border_width = border_width
+        self.radius = radius
+        self.text_color = text_color
+        self.selected_text_color = selected_text_color or text_color
+        self._faces = {} # selected -> Surface
+
+    def face(self, selected=False) -> pygame.Surface:
+        face = self._faces.get(selected)
+        if face is None:
+            face = self._faces[selected] = pygame.Surface(self.rect.size, pygame.SRCALPHA)
+            box = face.get_rect()
+            pygame.draw.rect(face, self.selected_fill if selected else self.fill, box, border_radius=self.radius)
+            pygame.draw.rect(face, self.border, box, width=self.border_width, border_radius=self.radius)
+            label = self.font.render(self.text, True, self.selected_text_color if selected else self.text_color)
+            face.blit(label, label.get_rect(center=box.center))
+        return face
+
+    def draw(self, surface, selected=False, offset=(0, 0)):
+        surface.blit(self.face(selected), self.rect.move(offset))
+
+
+class Slider:
+    # Horizontal bar filled in proportion to value / maximum, redrawn when the value changes
+    def __init__(self, rect, fill=GREEN_SI, track=(50, 50, 50), border=(200, 200, 200), radius=5, maximum=100):
+        self.rect = pygame.Rect(rect)
+        self.fill = fill
+        self.track = track
+        self.border = border
+        self.radius = radius
+        self.maximum = maximum
+        self._value = None
+        self._image = pygame.Surface(self.rect.size, pygame.SRCALPHA)
+
+    def draw(self, surface, value):
+        if value != self._value:
+            self._value = value
+            box = self._image.get_rect()
+            self._image.fill((0, 0, 0, 0))
+            pygame.draw.rect(self._image, self.track, box, border_radius=self.radius)
+            filled = pygame.Rect(0, 0, int(value / self.maximum * box.width), box.height)
+            pygame.draw.rect(self._image, self.fill, filled, border_radius=self.radius)
+            pygame.draw.rect(self._image, self.border, box, width=2, border_radius=self.radius)
+        surface.blit(self._image, self.rect)
+
+
+class ItemList:
+    # Vertical list of outlined labels, arrows around the selected one
+    def __init__(self, font, items, center_x, top_y, step, color=GREEN_SI, outline_width=2):
+        self.labels = [Label(font, text, color, (center_x, top_y + i * step), outline_width)
+                       for i, text in enumerate(items)]
+        self.color = color
+        self._index = HitIndex(label.hit_rect for label in self.labels)
+
+    @property
+    def rects(self) -> list:
+        return [label.rect.copy() for label in self.labels]
+
+    def hit_test(self, pos) -> int:
+        return self._index.hit(pos)
+
+    def draw(self, surface, selected=-1):
+        for i, label in enumerate(self.labels):
+            label.draw(surface)
+            if i == selected:
+                draw_selection_arrows(surface, label.rect, self.color)
+
+
+class Modal:
+    # Dialog box with its text (the panel, drawn once) and a row of buttons.
+    # Labels and buttons are placed in screen coordinates
+    def __init__(self, rect, labels=(), buttons=(), fill=(230, 230, 230), border=BUTTON_BORDER, border_width=3, radius=10):
+        self.rect = pygame.Rect(rect)
+        self.labels = list(labels)
+        self.buttons = list(buttons)
+        self.fill = fill
+        self.border = border
+        self.border_width = border_width
+        self.radius = radius
+        self._panel = None
+        self._frame = None # panel and buttons together, faded in as one surface
+        self._frame_selected = None # selected button the frame was composed with
+        self._index = HitIndex(button.rect for button in self.buttons)
+
+    def hit_test(self, pos) -> int:
+        # index of the button under pos, -1 if none
+        return self._index.hit(pos)
+
+    def panel(self) -> pygame.Surface:
+        if self._panel is None:
+            self._panel = pygame.Surface(self.rect.size, pygame.SRCALPHA)
+            box = self._panel.get_rect()
+            pygame.draw.rect(self._panel, self.fill, box, border_radius=self.radius)
+            pygame.draw.rect(self._panel, self.border, box, width=self.border_width, border_radius=self.radius)
+            offset = (-self.rect.x, -self.rect.y)
+            for label in self.labels:
+                label.draw(self._panel, offset)
+        return self._panel
+
+    def draw(self, surface, selected=-1, alpha=255):
+        if alpha >= 255:
+            surface.blit(self.panel(), self.rect)
+            for i, button in enumerate(self.buttons):
+                button.draw(surface, i == selected)
+            return
+
+        # fading: panel and buttons composed once on a surface of their own, blended as one
+        if self._frame is None:
+            self._frame = pygame.Surface(self.rect.size, pygame.SRCALPHA)
+        if self._frame_selected != selected:
+            self._frame_selected = selected
+            self._frame.fill((0, 0, 0, 0))
+            self._frame.blit(self.panel(), (0, 0), special_flags=pygame.BLEND_RGBA_MAX) # plain copy, no blending
+            offset = (-self.rect.x, -self.rect.y)
+            for i, button in enumerate(self.buttons):
+                button.draw(self._frame, i == selected, offset)
+        self._frame.set_alpha(alpha)
+        surface.blit(self._frame, self.rect)
+
+
+def draw_selection_arrows(screen, target_rect, color=GREEN_SI):
+    # Draw left and right arrows around a selected menu item.
+    left_x = target_rect.left - 30
+    mid_y = target_rect.centery
+    left_arrow = [(left_x, mid_y), (left_x + 12, mid_y - 8), (left_x + 12, mid_y + 8)]
+    pygame.draw.polygon(screen, color, left_arrow)
+
+    right_x = target_rect.right + 30
+    right_arrow = [(right_x, mid_y), (right_x - 12, mid_y - 8), (right_x - 12, mid_y + 8)]
+    pygame.draw.polygon(screen, color, right_arrow)
+
+
+_layouts = [] # cached layout builders
+_quit_registered = False
+
+
+def cached_layout(build):
+    # Decorator for the functions building a screen's widgets: built once per arguments.
+    # Widgets keep their fonts, which die with pygame: the layouts are dropped when it quits
+    cached = functools.lru_cache(maxsize=8)(build)
+
+    @functools.wraps(build)
+    def layout(*args):
+        global _quit_registered
+        if not _quit_registered:
+            pygame.register_quit(clear_layouts)
+            _quit_registered = True
+        return cached(*args)
+
+    layout.cache_info = cached.cache_info
+    _layouts.append(cached)
+    return layout
+
+
+def clear_layouts():
+    global _quit_registered
+    for cached in _layouts:
+        cached.cache_clear()
+    _quit_registered = False
@@ -1,26 +1,51 @@
 import pygame, sys
 from pathlib import Path
-from GardenInvasion.Utilities.constants import SCREEN_WIDTH, SCREEN_HEIGHT
+import os
+from GardenInvasion.Utilities.constants import SCREEN_WIDTH, SCREEN_HEIGHT, IMAGE_CACHE_ENV, SOUND_CACHE_ENV
 from GardenInvasion.Model.menu_model import BackgroundModel
 from GardenInvasion.Controller.menu_controller import main_menu_loop
+from GardenInvasion.Utilities.asset_cache import asset_cache
+from GardenInvasion.Utilities.texture_atlas import AtlasLoader, DEFAULT_ATLAS
+from GardenInvasion.Utilities.disk_image_cache import DiskImageCache, DEFAULT_CACHE_DIR
+from GardenInvasion.Utilities.preloader import Preloader
+from GardenInvasion.Utilities.pcm_cache import PcmCache, DEFAULT_CACHE_DIR as DEFAULT_SOUND_CACHE_DIR
+from GardenInvasion.Model.sound_manager_model import use_pcm_cache
+from GardenInvasion.Utilities.font_registry import font_registry, get_font
 
 if __name__ == "__main__":
     pygame.init()
     screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
     pygame.display.set_caption("Garden Invasion")
+    # gameplay sprites come pre-scaled from the texture atlas, when it has been built
+    if DEFAULT_ATLAS.exists():
+        asset_cache.use_atlas(AtlasLoader(DEFAULT_ATLAS))
+    # images outside the atlas are scaled once and mapped from disk on the next launches
+    image_cache_dir = os.environ.get(IMAGE_CACHE_ENV, str(DEFAULT_CACHE_DIR))
+    if image_cache_dir != '0':
+        asset_cache.use_disk_cache(DiskImageCache(image_cache_dir))
+    # same for the sound effects, kept as raw samples in the mixer's format
+    sound_cache_dir = os.environ.get(SOUND_CACHE_ENV, str(DEFAULT_SOUND_CACHE_DIR))
+    if sound_cache_dir != '0':
+        use_pcm_cache(PcmCache(sound_cache_dir))
 
     pkg_root = Path(__file__).resolve().parent
     bg_path = pkg_root / "Assets" / "images" / "Menu_background.png"
     background_model = BackgroundModel(bg_path)
-    font_item = pygame.font.SysFont("Arial", 30)
-    font_inst = pygame.font.SysFont("Arial", 16)
-    font_title = pygame.font.SysFont("Arial", 72)
+    font_item = get_font("Arial", 30)
+    font_inst = get_font("Arial", 16)
+    font_title = get_font("Arial", 72)
+    # open every font the views draw with now, not in the middle of a frame
+    fonts_ms = font_registry.preload()
+    print(f"Fonts ready in {fonts_ms:.1f} ms (system font lookup {font_registry.resolve_ms:.1f} ms)")
     fonts = (font_item, font_inst, font_title)
 
+    # gameplay sprites, background and soundtrack load on a worker thread while the menu is up
+    preloader = Preloader()
     try:
-        main_menu_loop(screen, background_model.surface, background_model.rect, fonts)
+        main_menu_loop(screen, background_model.surface, background_model.rect, fonts, preloader)
     except Exception as e:
         print("Fatal error:", e)
     finally:
+        preloader.shutdown()
         pygame.quit()
         sys.exit()
@@ -0,0 +1 @@
+# Headless performance benchmarks of the game loop, run with: python -m benchmarks
@@ -0,0 +1,63 @@
+import argparse
+import sys
+from .runner import setup_display, measure, result_key, load_baseline, save_baseline, compare, BASELINE_PATH
+
+# python -m benchmarks                       run everything, compare with benchmarks/baseline.json
+# python -m benchmarks --save                run everything and store the results as the new baseline
+# python -m benchmarks -s collisions -c 1000 run a single scenario at one count
+# Exits with status 1 when a result regressed past the tolerance.
+
+DEFAULT_COUNTS = (10, 30, 100, 300, 1000, 10000) # 10 and 30: campaign waves
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="Garden Invasion game loop benchmarks")
+    parser.add_argument('-s', '--scenario', action='append', help="scenario to run (repeatable), all by default")
+    parser.add_argument('-c', '--counts', default=",".join(map(str, DEFAULT_COUNTS)),
+                        help="comma separated entity counts (default: %(default)s)")
+    parser.add_argument('-f', '--frames', type=int, default=60, help="timed frames per run (default: %(default)s)")
+    parser.add_argument('-t', '--tolerance', type=float, default=0.5,
+                        help="allowed slowdown over the baseline, 0.5 = 50%% (default: %(default)s)")
+    parser.add_argument('--baseline', default=BASELINE_PATH, help="baseline file (default: benchmarks/baseline.json)")
+    parser.add_argument('--save', action='store_true', help="store the results as the new baseline")
+    args = parser.parse_args(argv)
+
+    setup_display()
+    # imported after the display exists, model modules register their sprites on import
+    from .scenarios import SCENARIOS
+
+    names = args.scenario or list(SCENARIOS)
+    for name in names:
+        if name not in SCENARIOS:
+            parser.error(f"unknown scenario {name}, choose from {', '.join(SCENARIOS)}")
+    counts = [int(count) for count in args.counts.split(",")]
+
+    baseline = load_baseline(args.baseline)
+    results = {}
+    regressed = False
+    print(f"{'scenario':<32}{'ticks/s':>12}{'ms/frame':>12}{'p95 ms':>10}{'peak KB':>12}  vs baseline")
+    for name in names:
+        scenario, max_count = SCENARIOS[name]
+        for count in counts:
+            if max_count is not None and count > max_count:
+                continue
+            key = result_key(name, count)
+            result = results[key] = measure(scenario, count, args.frames)
+            if key not in baseline:
+                status = "new"
+            else:
+                regressions = compare(result, baseline[key], args.tolerance)
+                regressed = regressed or bool(regressions)
+                status = "REGRESSION " + ", ".join(regressions) if regressions else "ok"
+            print(f"{key:<32}{result['ticks_per_sec']:>12.1f}{result['ms_per_frame']:>12.3f}"
+                  f"{result['p95_ms']:>10.3f}{result['peak_kb']:>12.1f}  {status}", flush=True)
+
+    if args.save:
+        save_baseline({**baseline, **results}, args.frames, args.baseline)
+        print(f"Baseline saved to {args.baseline}")
+        return 0
+    return 1 if regressed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
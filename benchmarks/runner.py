@@ -0,0 +1,99 @@
+import contextlib
+import io
+import json
+import os
+import time
+import tracemalloc
+import pygame
+from GardenInvasion.Utilities.constants import SCREEN_WIDTH, SCREEN_HEIGHT
+from GardenInvasion.Utilities.frame_profiler import percentile
+
+# Times a scenario and compares the results with a stored baseline.
+# Peak memory is measured in a separate, shorter run under tracemalloc (which slows Python
+# down) and covers Python allocations of the scene build and its frames: pixel buffers
+# allocated by SDL are not included.
+
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), "baseline.json")
+WARMUP_FRAMES = 3
+MEMORY_FRAMES = 3
+MIN_FRAMES = 5      # timed frames always run, even past the time budget
+TIME_BUDGET_S = 3   # a run stops early once its timed frames took this long
+
+
+def setup_display():
+    # Headless display, sprites need one to convert their images
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+    if not pygame.get_init():
+        pygame.init()
+    if not pygame.display.get_surface():
+        pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+
+
+def _run(step, reset, frames: int, time_budget_s: float = None) -> list:
+    # frame times in ns, only step() is timed
+    times = []
+    budget_ns = time_budget_s * 1e9 if time_budget_s is not None else None
+    spent_ns = 0
+    for _ in range(frames):
+        if budget_ns is not None and spent_ns > budget_ns and len(times) >= MIN_FRAMES:
+            break
+        if reset:
+            reset()
+        started = time.perf_counter_ns()
+        step()
+        elapsed = time.perf_counter_ns() - started
+        times.append(elapsed)
+        spent_ns += elapsed
+    return times
+
+
+def measure(scenario, count: int, frames: int) -> dict:
+    # Run a scenario with count entities, returns its timings and peak memory.
+    # Up to frames frames are timed, fewer for slow runs (see TIME_BUDGET_S).
+    # Game prints (wave starts, hits...) are silenced, they would flood the report
+    with contextlib.redirect_stdout(io.StringIO()):
+        step, reset = scenario(count)
+        _run(step, reset, WARMUP_FRAMES)
+        times = sorted(_run(step, reset, frames, TIME_BUDGET_S))
+
+        tracemalloc.start()
+        step, reset = scenario(count)
+        _run(step, reset, MEMORY_FRAMES)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+    # median frame, a stray slow frame (GC, another process) doesn't move it
+    median_ns = percentile(times, 50)
+    return {
+        'ticks_per_sec': round(1e9 / median_ns, 1),
+        'ms_per_frame': round(median_ns / 1e6, 4),
+        'p95_ms': round(percentile(times, 95) / 1e6, 4),
+        'peak_kb': round(peak / 1024, 1),
+    }
+
+
+def result_key(name: str, count: int) -> str:
+    return f"{name}[{count}]"
+
+
+def load_baseline(path=BASELINE_PATH) -> dict:
+    if not os.path.exists(path):
+        return {}
+    with open(path) as f:
+        return json.load(f)['results']
+
+
+def save_baseline(results: dict, frames: int, path=BASELINE_PATH):
+    with open(path, 'w') as f:
+        json.dump({'frames': frames, 'results': results}, f, indent=4, sort_keys=True)
+        f.write("\n")
+
+
+def compare(result: dict, baseline: dict, tolerance: float) -> list:
+    # Metrics that got worse than the baseline by more than tolerance (0.5 = 50%)
+    regressions = []
+    for metric in ('ms_per_frame', 'peak_kb'):
+        if metric in baseline and result[metric] > baseline[metric] * (1 + tolerance):
+            regressions.append(f"{metric} {baseline[metric]} -> {result[metric]}")
+    return regressions
@@ -0,0 +1,246 @@
+import math
+import random
+from pathlib import Path
+import pygame
+from GardenInvasion.Utilities.constants import SCREEN_WIDTH, SCREEN_HEIGHT
+from GardenInvasion.Utilities.game_clock import LogicalClock
+from GardenInvasion.Utilities.spatial_grid import SpatialGrid, pair_checks
+from GardenInvasion.Utilities.asset_cache import asset_cache, image_path, SCALE_NONE
+from GardenInvasion.Model.menu_model import BackgroundModel
+from GardenInvasion.Model.plant_model import Player
+from GardenInvasion.Model.projectile_model import Projectile
+from GardenInvasion.Model.zombie_projectile_model import ZombieProjectile
+from GardenInvasion.Model.zombie_model import RedZombie, OrangeZombie
+from GardenInvasion.Model.wallnut_model import WallNutManager
+from GardenInvasion.Model.wave_model import WaveManager
+from GardenInvasion.Model.horde_model import HORDE_AVAILABLE, RED, ORANGE
+from GardenInvasion.Model.movement_pattern_model import MOVEMENT_REGISTRY
+from GardenInvasion.Controller.simulation_controller import GameSimulation, NO_KEYS, PLAYER_START_POS
+from GardenInvasion.Controller.NewGame_controller import (
+    _handle_projectile_zombie_collisions,
+    _handle_zombie_projectile_plant_collisions,
+    _handle_zombie_projectile_wallnut_collisions,
+    _handle_zombie_plant_collisions,
+    _handle_zombie_wallnut_collisions,
+)
+from GardenInvasion.View.RunGame_view import draw_game
+
+# Stress scenarios. Each one is a function taking the entity count that builds its scene
+# and returns (step, reset): step() is one timed frame, reset() (or None) runs untimed
+# before every frame to put back what the previous frame destroyed, so all frames
+# measure the same load. Scenes are laid out with a fixed seed, runs are comparable.
+
+MOVEMENT_PATTERNS = tuple(MOVEMENT_REGISTRY)  # the built-in patterns, the benchmarks register none
+ZOMBIE_AREA = 0.6  # zombies fill the top 60% of the screen, above wall-nuts and plant
+ZOMBIES_PER_SCREEN = 50  # density of the collision field, a crowded in-game screen
+
+
+def _positions(count: int, rng: random.Random, bottom: float, scale: float = 1) -> list:
+    # count random positions over the screen width, from the top down to bottom (fraction of height).
+    # scale > 1 spreads them over a field scale times wider and taller than the screen
+    width, height = int(SCREEN_WIDTH * scale), int(SCREEN_HEIGHT * bottom * scale)
+    return [(rng.randrange(width), rng.randrange(height)) for _ in range(count)]
+
+
+def _zombies(count: int, rng: random.Random, clock: LogicalClock, scale: float = 1) -> list:
+    # a red/orange mix with every movement pattern
+    zombies = []
+    for i, pos in enumerate(_positions(count, rng, ZOMBIE_AREA, scale)):
+        pattern = MOVEMENT_PATTERNS[i % len(MOVEMENT_PATTERNS)]
+        if i % 2:
+            zombies.append(OrangeZombie(pos, 'A', movement_pattern=pattern, clock=clock))
+        else:
+            zombies.append(RedZombie(pos, pattern, 'B', clock=clock))
+    return zombies
+
+
+def wave_update(count: int, horde: bool = False):
+    # WaveManager.update(): zombie movement, zombie shooting through the pool, projectile updates
+    clock = LogicalClock()
+    wave_manager = WaveManager(clock=clock, rng=random.Random(0), horde=horde)
+    wave_manager.current_wave = wave_manager.total_waves # no scripted wave starts during the run
+    wave_manager.wave_complete = False
+    if horde:
+        # same mix as _zombies, spawned in the horde arrays
+        horde = wave_manager.horde
+        def spawn(i, pos):
+            pattern = MOVEMENT_PATTERNS[i % len(MOVEMENT_PATTERNS)]
+            color, spawn_point = (ORANGE, 'A') if i % 2 else (RED, 'B')
+            horde.spawn(color, pos, pattern, spawn_point)
+        for i, pos in enumerate(_positions(count, random.Random(count), ZOMBIE_AREA)):
+            spawn(i, pos)
+        # fallen zombies come back at the top (their slot and sprite are reused)
+        def reset():
+            for i in range(count - len(horde)):
+                spawn(i, (SCREEN_WIDTH // 2, 0))
+        return lambda: (clock.advance(), wave_manager.update()), reset
+    zombies = _zombies(count, random.Random(count), clock)
+    wave_manager.zombie_group.add(zombies)
+
+    def step():
+        clock.advance()
+        wave_manager.update()
+
+    def reset():
+        # zombies walking off the bottom are put back at the top
+        for zombie in zombies:
+            if not zombie.alive():
+                zombie.rect.y = 0
+                wave_manager.zombie_group.add(zombie)
+
+    return step, reset
+
+
+def wave_update_horde(count: int):
+    # wave_update with the NumPy horde backend
+    return wave_update(count, horde=True)
+
+
+def _collision_scene(count: int, use_grid: bool):
+    # The field grows with count to keep the density of a crowded screen: thousands of
+    # sprites piled on one screen would time the handling of the hits, not the passes
+    rng = random.Random(count)
+    scale = max(1, math.sqrt(count / ZOMBIES_PER_SCREEN))
+    clock = LogicalClock()
+    player = Player(PLAYER_START_POS, clock=clock)
+    zombies = _zombies(count, rng, clock, scale)
+    projectiles = [Projectile(pos) for pos in _positions(count, rng, ZOMBIE_AREA, scale)]
+    zombie_projectiles = [ZombieProjectile(pos) for pos in _positions(count, rng, 1, scale)]
+    zombie_group = pygame.sprite.Group(zombies)
+    projectile_group = pygame.sprite.Group(projectiles)
+    zombie_projectile_group = pygame.sprite.Group(zombie_projectiles)
+    player_group = pygame.sprite.GroupSingle(player)
+    grid = SpatialGrid() if use_grid else None
+    drop_rng = random.Random(0)
+    scene = {}
+
+    def step():
+        wallnut_manager = scene['wallnuts']
+        if grid is not None:
+            wallnuts = wallnut_manager.get_wallnuts()
+            grid.rebuild(zombie_group, zombie_projectile_group, wallnuts, checks=pair_checks(
+                (projectile_group, zombie_group),
+                (player_group, zombie_projectile_group),
+                (zombie_projectile_group, wallnuts),
+                (player_group, zombie_group),
+                (zombie_group, wallnuts)
+            ))
+        _handle_projectile_zombie_collisions(projectile_group, zombie_group, None, None, grid, drop_rng)
+        _handle_zombie_projectile_plant_collisions(zombie_projectile_group, player, None, grid)
+        _handle_zombie_projectile_wallnut_collisions(zombie_projectile_group, wallnut_manager, None, grid)
+        _handle_zombie_plant_collisions(zombie_group, player, None, grid)
+        _handle_zombie_wallnut_collisions(zombie_group, wallnut_manager, None, grid)
+
+    def reset():
+        # every frame starts from the full scene
+        projectile_group.add(projectiles)
+        zombie_projectile_group.add(zombie_projectiles)
+        zombie_group.add(zombies)
+        for zombie in zombies:
+            zombie.health = zombie.max_health
+        player.life_points = player.max_life_points
+        scene['wallnuts'] = WallNutManager(PLAYER_START_POS, SCREEN_WIDTH, SCREEN_HEIGHT)
+        scene['wallnuts'].place_all_wallnuts()
+
+    return step, reset
+
+
+def collisions(count: int):
+    # the five gameplay collision passes, through the spatial grid as in the game
+    # (indexed only above MIN_PAIR_CHECKS, plain pygame below)
+    return _collision_scene(count, use_grid=True)
+
+
+def collisions_bruteforce(count: int):
+    # the same passes with plain pygame.sprite collisions, the reference for the grid
+    return _collision_scene(count, use_grid=False)
+
+
+def draw(count: int):
+    # draw_game with count zombies, zombie projectiles and player projectiles on screen
+    rng = random.Random(count)
+    clock = LogicalClock()
+    screen = pygame.display.get_surface()
+    background = BackgroundModel(Path(image_path("RunGame01.png")))
+    heart_image = asset_cache.get_image(image_path("HeartShape.png"), None, SCALE_NONE)
+    player_group = pygame.sprite.GroupSingle(Player(PLAYER_START_POS, clock=clock))
+    zombie_group = pygame.sprite.Group(_zombies(count, rng, clock))
+    projectile_group = pygame.sprite.Group([Projectile(pos) for pos in _positions(count, rng, 1)])
+    zombie_projectile_group = pygame.sprite.Group([ZombieProjectile(pos) for pos in _positions(count, rng, 1)])
+    wallnut_manager = WallNutManager(PLAYER_START_POS, SCREEN_WIDTH, SCREEN_HEIGHT)
+    wallnut_manager.place_all_wallnuts()
+
+    def step():
+        draw_game(screen, background, player_group, projectile_group, wallnut_manager.get_wallnuts(),
+                  player_group.sprite.life_points, heart_image, zombie_group, zombie_projectile_group,
+                  pygame.sprite.Group())
+
+    return step, None
+
+
+def sprite_construction(count: int):
+    # building count zombies, zombie projectiles and player projectiles (images from the asset cache)
+    clock = LogicalClock()
+    positions = _positions(count, random.Random(count), 1)
+
+    def step():
+        for i, pos in enumerate(positions):
+            if i % 2:
+                OrangeZombie(pos, clock=clock)
+            else:
+                RedZombie(pos, clock=clock)
+            ZombieProjectile(pos)
+            Projectile(pos)
+
+    return step, None
+
+
+def simulation(count: int):
+    # full GameSimulation steps (input, updates, grid, collisions) with count extra zombies
+    game = GameSimulation(seed=0)
+    zombies = _zombies(count, random.Random(count), game.clock)
+    game.wave_manager.zombie_group.add(zombies)
+
+    def step():
+        game.step(NO_KEYS)
+
+    def reset():
+        # keep the horde at full size: shot or fallen zombies come back at the top
+        for zombie in zombies:
+            if not zombie.alive():
+                zombie.health = zombie.max_health
+                zombie.rect.y = 0
+                game.wave_manager.zombie_group.add(zombie)
+        game.player.life_points = game.player.max_life_points
+
+    return step, reset
+
+
+def endless(count: int):
+    # endless mode deep into the waves, count = zombie cap: spawning runs into back-pressure
+    game = GameSimulation(seed=0, endless=True)
+    wave_manager = game.wave_manager
+    wave_manager.max_zombies = count
+    wave_manager.waiting_for_next_wave = False
+    wave_manager.next_wave_timer = 0 # drops the first-wave countdown
+    wave_manager.current_wave = 39
+    wave_manager._execute_wave_start()
+
+    def reset():
+        game.player.life_points = game.player.max_life_points
+
+    return (lambda: game.step(NO_KEYS)), reset
+
+
+# name -> (scenario, largest count it is run with)
+SCENARIOS = {
+    'wave_update': (wave_update, None),
+    'collisions': (collisions, None),
+    'collisions_bruteforce': (collisions_bruteforce, 1000), # O(n^2): 10,000 takes minutes per frame
+    'draw': (draw, None),
+    'sprite_construction': (sprite_construction, None),
+    'simulation': (simulation, None),
+    'endless': (endless, None),
+}
+if HORDE_AVAILABLE: # optional NumPy backend
+    SCENARIOS['wave_update_horde'] = (wave_update_horde, None)
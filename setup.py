@@ -100,10 +100,14 @@ setup(
     ],
     keywords='game pygame, space-invaders, plants-vs-zombies arcade',
     # package_dir={'': 'src'},  # Optional
-    packages=find_packages(),  # Required
+    packages=find_packages(exclude=['benchmarks']),  # Required
     include_package_data=True,
     python_requires=python_version,
     install_requires=dependencies,
+    extras_require={
+        'horde': ['numpy>=1.26'],  # vectorized zombie backend, GARDEN_INVASION_HORDE=1
+        'blur': ['numpy>=1.26'],   # box-blurred modal backdrops (smoothscale blur without it)
+    },
     zip_safe=False,
     platforms="Independant",
     project_urls={  # Optional
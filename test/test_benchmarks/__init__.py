@@ -0,0 +1 @@
+# Smoke tests of the performance benchmarks
@@ -0,0 +1,39 @@
+import os
+import tempfile
+import unittest
+
+os.environ['SDL_VIDEODRIVER'] = 'dummy'
+os.environ['SDL_AUDIODRIVER'] = 'dummy'
+
+from benchmarks.runner import setup_display, measure, compare, save_baseline, load_baseline
+
+class TestBenchmarks(unittest.TestCase):
+    # Smoke tests of the benchmark suite, so scenarios keep up with the game code
+
+    @classmethod
+    def setUpClass(cls):
+        setup_display()
+
+    def test_every_scenario_runs(self):
+        from benchmarks.scenarios import SCENARIOS
+        for name, (scenario, max_count) in SCENARIOS.items():
+            with self.subTest(scenario=name):
+                result = measure(scenario, 10, frames=2)
+                self.assertGreater(result['ticks_per_sec'], 0)
+                self.assertGreater(result['peak_kb'], 0)
+        print("Every benchmark scenario runs")
+
+    def test_regressions_against_baseline(self):
+        baseline = {'ms_per_frame': 10, 'peak_kb': 100}
+        self.assertEqual(compare({'ms_per_frame': 12, 'peak_kb': 100}, baseline, 0.25), [])
+        self.assertEqual(len(compare({'ms_per_frame': 13, 'peak_kb': 130}, baseline, 0.25)), 2)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "baseline.json")
+            self.assertEqual(load_baseline(path), {})
+            save_baseline({'draw[10]': baseline}, 60, path)
+            self.assertEqual(load_baseline(path), {'draw[10]': baseline})
+        print("Benchmark results are compared with the baseline")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -21,6 +21,9 @@ class TestMenuController(unittest.TestCase):
         self.mock_surface = pygame.Surface((100, 100))
         self.image_patcher = patch('pygame.image.load', return_value=self.mock_surface)
         self.image_patcher.start()
+        # events come from the patched pygame.event.get, don't sleep waiting for real ones
+        self.idle_patcher = patch('GardenInvasion.Utilities.idle_redraw.IDLE_TIMEOUT_MS', 1)
+        self.idle_patcher.start()
         
         # Create test objects
         self.screen = pygame.Surface((600, 600))
@@ -35,6 +38,7 @@ class TestMenuController(unittest.TestCase):
     
     def tearDown(self):
         self.image_patcher.stop()
+        self.idle_patcher.stop()
         pygame.event.clear()
     
     @patch('GardenInvasion.Controller.menu_controller.run_game') # Mock run_game function
@@ -15,13 +15,17 @@ from GardenInvasion.Controller.NewGame_controller import (
     _handle_zombie_wallnut_collisions,
     _handle_zombie_plant_collisions
 )
+from GardenInvasion.View.menu_view import get_pause_menu_button_rects
 from GardenInvasion.Model.menu_model import MenuModel
 from GardenInvasion.Model.setting_volume_model import SettingsModel
+from GardenInvasion.Utilities.asset_cache import asset_cache
 
 class TestNewGameController(unittest.TestCase):
     # Test suite for NewGame controller
 
     def setUp(self):
+        asset_cache.clear() # image loading is mocked, drop sprites cached by other tests
+        self.addCleanup(asset_cache.clear)
         self.mock_surface = pygame.Surface((100, 100))
         self.image_patcher = patch('pygame.image.load', return_value=self.mock_surface)
         self.image_patcher.start()
@@ -323,16 +327,15 @@ class TestNewGameController(unittest.TestCase):
         print("Pause menu: navigation OK")
 
     @patch('GardenInvasion.Controller.NewGame_controller.draw_pause_modal')
-    @patch('GardenInvasion.Controller.NewGame_controller.get_pause_menu_button_rects')
     @patch('pygame.display.flip')
-    def test_pause_menu_mouse_click(self, mock_flip, mock_rects, mock_draw):
-        # test clicking the "Resume" button in the pause menu 
-        resume_rect = pygame.Rect(230, 300, 140, 50)
-        mock_rects.return_value = (pygame.Rect(0,0,140,50), resume_rect, pygame.Rect(0,0,140,50))
+    def test_pause_menu_mouse_click(self, mock_flip, mock_draw):
+        # test clicking the "Resume" button in the pause menu, where the view draws it
+        menu_rect, resume_rect, quit_rect = get_pause_menu_button_rects()
         
         events = [
-            [pygame.event.Event(pygame.MOUSEMOTION, {'pos': (300, 325)})],
-            [pygame.event.Event(pygame.MOUSEBUTTONDOWN, {'button': 1, 'pos': (300, 325)})],
+            [pygame.event.Event(pygame.KEYDOWN, {'key': pygame.K_LEFT})], # select Main Menu first
+            [pygame.event.Event(pygame.MOUSEMOTION, {'pos': resume_rect.center})],
+            [pygame.event.Event(pygame.MOUSEBUTTONDOWN, {'button': 1, 'pos': resume_rect.center})],
             []
         ]
         with patch('pygame.event.get', side_effect=events):
@@ -8,13 +8,18 @@ pygame.display.set_mode((1, 1))
 
 from GardenInvasion.Controller.plant_controller import handle_player_input
 from GardenInvasion.Model.plant_model import Player
+from GardenInvasion.Model.projectile_model import Projectile
+from GardenInvasion.Model.projectile_pool_model import ProjectilePool
 from GardenInvasion.Model.setting_volume_model import SettingsModel
 from GardenInvasion.Model.sound_manager_model import SoundManager
+from GardenInvasion.Utilities.asset_cache import asset_cache
 
 class TestPlantController(unittest.TestCase):
     # Test suite for plant controller
     
     def setUp(self):
+        asset_cache.clear() # image loading is mocked, drop sprites cached by other tests
+        self.addCleanup(asset_cache.clear)
         # Set up test fixtures
         self.mock_surface = pygame.Surface((100, 100))
         
@@ -157,6 +162,33 @@ class TestPlantController(unittest.TestCase):
         # Sound should NOT have been called
         self.mock_sound_manager.play_sound.assert_not_called()
         print("No sound plays during shooting cooldown")
+
+    @patch('pygame.time.get_ticks')
+    def test_shooting_reuses_pooled_projectile(self, mock_ticks):
+        # Test that with a pool the shot is taken from it and returns to it when killed
+        pool = ProjectilePool(Projectile, max_size=4)
+        mock_ticks.return_value = 1000
+        self.player.last_shot = 0
+
+        with patch('pygame.key.get_pressed', return_value={pygame.K_LEFT: False, pygame.K_RIGHT: False,
+                                                           pygame.K_a: False, pygame.K_d: False}):
+            handle_player_input(self.player, self.projectile_group, self.mock_sound_manager, pool)
+
+        self.assertEqual(len(self.projectile_group), 1)
+        first = self.projectile_group.sprites()[0]
+        self.assertEqual(first.rect.midbottom, self.player.rect.midtop)
+        self.mock_sound_manager.play_sound.assert_called_once_with('plant_shoot')
+
+        first.kill() # back to the pool
+        mock_ticks.return_value = 2000
+        with patch('pygame.key.get_pressed', return_value={pygame.K_LEFT: False, pygame.K_RIGHT: False,
+                                                           pygame.K_a: False, pygame.K_d: False}):
+            handle_player_input(self.player, self.projectile_group, self.mock_sound_manager, pool)
+
+        self.assertIs(self.projectile_group.sprites()[0], first)
+        self.assertEqual(pool.created, 1)
+        self.assertEqual(pool.reused, 1)
+        print("Shooting reuses pooled projectiles")
     
 if __name__ == '__main__':
     unittest.main()
@@ -11,6 +11,7 @@ from GardenInvasion.Model.plant_model import Player
 from GardenInvasion.Model.wallnut_model import WallNutManager
 from GardenInvasion.Model.setting_volume_model import SettingsModel
 from GardenInvasion.Model.sound_manager_model import SoundManager
+from GardenInvasion.Utilities.asset_cache import asset_cache
 
 
 class TestPowerUpController(unittest.TestCase):
@@ -24,6 +25,8 @@ class TestPowerUpController(unittest.TestCase):
             pygame.display.set_mode((1, 1))
 
     def setUp(self):
+        asset_cache.clear() # image loading is mocked, drop sprites cached by other tests
+        self.addCleanup(asset_cache.clear)
         if not pygame.get_init():
             pygame.init()
 
@@ -0,0 +1,84 @@
+import unittest
+import pygame
+import os
+import random
+import tempfile
+from unittest.mock import patch
+
+os.environ['SDL_VIDEODRIVER'] = 'dummy'
+os.environ['SDL_AUDIODRIVER'] = 'dummy'
+
+from GardenInvasion.Controller.replay_controller import replay_input_log
+from GardenInvasion.Controller.simulation_controller import GameSimulation, KeyState
+from GardenInvasion.Model.setting_volume_model import SettingsModel
+from GardenInvasion.Model.endless_wave_model import EndlessWaveManager
+from GardenInvasion.Utilities.input_log import InputRecorder, read_input_log
+
+class TestReplayController(unittest.TestCase):
+    # Test suite for recording a match and replaying it headlessly
+
+    @classmethod
+    def setUpClass(cls):
+        if not pygame.get_init():
+            pygame.init()
+        if not pygame.display.get_surface():
+            pygame.display.set_mode((1, 1))
+
+    def setUp(self):
+        handle, self.path = tempfile.mkstemp(suffix=".gilg")
+        os.close(handle)
+        self.addCleanup(os.remove, self.path)
+
+    def _record_match(self, ticks, endless=False):
+        # play a match with scripted random input, recording it like run_game does
+        script = random.Random(3)
+        moves = [set(), {pygame.K_LEFT}, {pygame.K_RIGHT}, {pygame.K_d}, {pygame.K_1}, {pygame.K_4}]
+        simulation = GameSimulation(SettingsModel(), seed=1234, endless=endless)
+        recorder = InputRecorder(self.path, simulation.rng.seed, simulation.dt_ms, "default", endless=endless)
+
+        keys = KeyState()
+        while simulation.ticks < ticks and not simulation.is_over():
+            if script.random() < 0.05:
+                keys = KeyState(script.choice(moves))
+            recorder.record(simulation.ticks + 1, keys)
+            simulation.step(keys)
+        recorder.close()
+        return simulation
+
+    def _state(self, simulation):
+        return (simulation.ticks,
+                simulation.player.rect.topleft,
+                simulation.player.life_points,
+                simulation.wave_manager.current_wave,
+                sorted((zombie.rect.topleft, zombie.health) for zombie in simulation.wave_manager.zombie_group),
+                sorted((w.slot_index, w.health) for w in simulation.wallnut_manager.get_wallnuts()))
+
+    def test_replay_reproduces_recorded_match(self):
+        # replaying the log ends in exactly the state of the recorded match
+        recorded = self._record_match(60 * 40)
+        replayed = replay_input_log(self.path)
+
+        self.assertEqual(self._state(replayed), self._state(recorded))
+        print("Replay reproduces the recorded match frame by frame")
+
+    def test_replay_uses_the_recorded_game_mode(self):
+        # an endless match replays as endless from its log, whatever the environment says
+        recorded = self._record_match(60 * 20, endless=True)
+        with patch.dict(os.environ, {'GARDEN_INVASION_ENDLESS': '0', 'GARDEN_INVASION_HORDE': '1'}):
+            replayed = replay_input_log(self.path)
+
+        self.assertIsInstance(replayed.wave_manager, EndlessWaveManager)
+        self.assertIsNone(replayed.wave_manager.horde)
+        self.assertEqual(self._state(replayed), self._state(recorded))
+        print("Replay takes the game mode from the log")
+
+    def test_replay_can_stop_early(self):
+        # max_ticks limits how much of the log is replayed
+        self._record_match(600)
+        replayed = replay_input_log(read_input_log(self.path), max_ticks=100)
+
+        self.assertEqual(replayed.ticks, 100)
+        print("Replay stops at max_ticks")
+
+if __name__ == '__main__':
+    unittest.main()
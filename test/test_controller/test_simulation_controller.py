@@ -0,0 +1,112 @@
+import unittest
+import pygame
+import os
+import time
+from unittest.mock import patch
+
+os.environ['SDL_VIDEODRIVER'] = 'dummy'
+os.environ['SDL_AUDIODRIVER'] = 'dummy'
+
+from GardenInvasion.Controller.simulation_controller import GameSimulation, KeyState
+from GardenInvasion.Utilities.game_clock import LogicalClock, FIXED_DT_MS
+from GardenInvasion.Utilities.frame_profiler import FrameProfiler
+
+class TestGameSimulation(unittest.TestCase):
+    # Test suite for the headless fixed-step game simulation
+
+    @classmethod
+    def setUpClass(cls):
+        if not pygame.get_init():
+            pygame.init()
+
+    def setUp(self):
+        self.simulation = GameSimulation()
+
+    def test_step_advances_logical_clock(self):
+        # every step moves game time forward by the fixed dt, independent of real time
+        for _ in range(60):
+            self.simulation.step(KeyState())
+
+        self.assertEqual(self.simulation.ticks, 60)
+        self.assertEqual(self.simulation.clock.get_ticks(), 1000)
+        print("Each step advances the logical clock by the fixed dt")
+
+    @patch('pygame.time.get_ticks', return_value=0)
+    def test_first_wave_starts_on_logical_time(self, mock_ticks):
+        # the first wave begins after 3 seconds of game time, real time is never read
+        self.simulation.run(170)
+        self.assertEqual(self.simulation.wave_manager.current_wave, 0)
+
+        self.simulation.run(20)
+        self.assertEqual(self.simulation.wave_manager.current_wave, 1)
+        self.assertGreater(len(self.simulation.wave_manager.zombie_group), 0)
+        mock_ticks.assert_not_called()
+        print("First wave starts after 3s of logical time")
+
+    def test_injected_keys_move_player(self):
+        # key state passed to step() drives the player instead of the keyboard
+        start_x = self.simulation.player.rect.x
+        self.simulation.step(KeyState({pygame.K_LEFT}))
+
+        self.assertLess(self.simulation.player.rect.x, start_x)
+        print("Injected key state moves the player")
+
+    def test_player_shoots_on_logical_cooldown(self):
+        # auto-shooting follows the 1000ms cooldown measured on the logical clock
+        self.simulation.run(61)
+        self.assertEqual(self.simulation.projectile_pool.created, 8) # only the prewarmed ones
+        self.assertEqual(self.simulation.projectile_pool.reused, 1)
+        print("Player shoots following the logical clock")
+
+    def test_match_runs_to_the_end_faster_than_real_time(self):
+        # a full match without input ends well before its game time elapses
+        started = time.perf_counter()
+        ticks = self.simulation.run(60 * 300)
+        elapsed = time.perf_counter() - started
+
+        self.assertTrue(self.simulation.is_over())
+        self.assertLess(ticks, 60 * 300)
+        self.assertLess(elapsed, ticks * FIXED_DT_MS / 1000)
+        print("Headless match ends faster than real time")
+
+    def test_shared_clock(self):
+        # a clock passed in is the one every model reads
+        clock = LogicalClock(start_ms=5000)
+        simulation = GameSimulation(clock=clock)
+        simulation.step(KeyState())
+
+        self.assertIs(simulation.wave_manager.clock, clock)
+        self.assertIs(simulation.player.clock, clock)
+        self.assertEqual(clock.get_ticks(), round(5000 + FIXED_DT_MS))
+        print("Simulation models share the injected clock")
+
+    def test_same_seed_replays_the_same_match(self):
+        # two sessions with the same seed and input end in the same state
+        def play(seed):
+            simulation = GameSimulation(seed=seed)
+            simulation.run(60 * 120)
+            return (simulation.ticks, simulation.player.life_points, simulation.wave_manager.current_wave,
+                    sorted(wallnut.health for wallnut in simulation.wallnut_manager.get_wallnuts()),
+                    simulation.powerup_manager.rng.random())
+
+        self.assertEqual(play(7), play(7))
+        self.assertEqual(GameSimulation(seed=7).rng.seed, 7)
+        print("Same seed replays the same match")
+
+    def test_profiler_times_every_phase(self):
+        # a profiler passed in gets one lap per update and collision pass of every step
+        profiler = FrameProfiler()
+        simulation = GameSimulation(profiler=profiler)
+        for _ in range(10):
+            profiler.start_frame()
+            simulation.step(KeyState())
+            profiler.end_frame()
+
+        self.assertIn('update_waves', profiler.phases)
+        self.assertIn('collide_projectile_zombie', profiler.phases)
+        self.assertEqual(profiler.phases['powerup_pickup'].count, 10)
+        self.assertEqual(profiler.summary()['frames'], 10)
+        print("Profiler times every simulation phase")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -49,6 +49,9 @@ class TestVolumeController(unittest.TestCase):
         self.mock_surface = pygame.Surface((100, 100))
         self.image_patcher = patch('pygame.image.load', return_value=self.mock_surface)
         self.image_patcher.start()
+        # events come from the patched pygame.event.get, don't sleep waiting for real ones
+        self.idle_patcher = patch('GardenInvasion.Utilities.idle_redraw.IDLE_TIMEOUT_MS', 1)
+        self.idle_patcher.start()
         
         self.screen = pygame.Surface((600, 600))
         self.menu_model = MenuModel()
@@ -65,6 +68,7 @@ class TestVolumeController(unittest.TestCase):
     def tearDown(self):
         # Clean up after each test
         self.image_patcher.stop()
+        self.idle_patcher.stop()
         if pygame.get_init():
             pygame.event.clear()
     
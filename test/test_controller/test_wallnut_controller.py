@@ -12,11 +12,14 @@ pygame.display.set_mode((1, 1))
 from GardenInvasion.Model.wallnut_model import WallNut, WallNutManager
 from GardenInvasion.Model.projectile_model import Projectile
 from GardenInvasion.Model.sound_manager_model import SoundManager
+from GardenInvasion.Utilities.asset_cache import asset_cache
 
 class TestWallnutController(unittest.TestCase):
     # Test suite for wallnut controller
     
     def setUp(self):
+        asset_cache.clear() # image loading is mocked, drop sprites cached by other tests
+        self.addCleanup(asset_cache.clear)
         # Set up test fixtures
 
         # Create a mock surface for images
@@ -0,0 +1,151 @@
+import unittest
+import random
+import pygame
+import os
+
+from GardenInvasion.Model.endless_wave_model import (
+    EndlessWaveManager, wave_difficulty, generate_wave, MAX_WAVE_SPAWNS, BACKPRESSURE_RETRY_MS, MIN_ZOMBIES,
+    EARLY_MOVEMENTS
+)
+from GardenInvasion.Model.movement_pattern_model import MOVEMENT_REGISTRY, Movement, movement_pattern, create_movement
+from GardenInvasion.Model.horde_model import HORDE_AVAILABLE
+from GardenInvasion.Controller.simulation_controller import GameSimulation
+from GardenInvasion.Utilities.game_clock import LogicalClock
+
+class TestEndlessWaveModel(unittest.TestCase):
+    # Test suite for the endless mode and its generated waves
+
+    def setUp(self):
+        os.environ['SDL_AUDIODRIVER'] = 'dummy'
+        pygame.init()
+
+    def tearDown(self):
+        if 'dive' in MOVEMENT_REGISTRY:
+            del MOVEMENT_REGISTRY['dive']
+            create_movement.cache_clear()
+        pygame.quit()
+
+    def _start_wave(self, wave_manager, wave_number):
+        # jump straight to the given wave
+        wave_manager.current_wave = wave_number - 1
+        wave_manager._execute_wave_start()
+
+    def test_difficulty_grows_up_to_its_ceilings(self):
+        first, tenth, last = wave_difficulty(1), wave_difficulty(10), wave_difficulty(200)
+        self.assertEqual(first.spawns, 4)
+        self.assertGreater(tenth.spawns, first.spawns)
+        self.assertGreater(tenth.orange_share, first.orange_share)
+        self.assertGreater(tenth.speed_scale, first.speed_scale)
+        self.assertLess(tenth.shoot_cooldown, first.shoot_cooldown)
+        self.assertEqual(last.spawns, MAX_WAVE_SPAWNS)
+        self.assertEqual(last.speed_scale, 2.0)
+        self.assertEqual(last.shoot_cooldown, 350)
+        print("Difficulty curves grow and stop at their ceilings")
+
+    def test_generated_waves_follow_the_seed(self):
+        wave = generate_wave(12, random.Random(3))
+        self.assertEqual(wave, generate_wave(12, random.Random(3)))
+        self.assertNotEqual(wave, generate_wave(12, random.Random(4)))
+        self.assertEqual(len(wave), wave_difficulty(12).spawns)
+        self.assertEqual([event.time for event in wave], sorted(event.time for event in wave))
+        early = generate_wave(1, random.Random(3))
+        self.assertTrue(all(event.movement in EARLY_MOVEMENTS for event in early))
+        print("Generated waves depend only on the wave number and the seed")
+
+    def test_registered_patterns_are_generated(self):
+        # a pattern added with @movement_pattern shows up in endless waves,
+        # except with the horde backend, which can't move it
+        @movement_pattern('dive')
+        class DiveMovement(Movement):
+            def move(self, zombie):
+                zombie.rect.y += 3
+
+        wave = generate_wave(30, random.Random(3))
+        self.assertIn('dive', {event.movement for event in wave})
+        self.assertNotIn('dive', {event.movement for event in generate_wave(1, random.Random(3))})
+        if HORDE_AVAILABLE:
+            wave_manager = EndlessWaveManager(clock=LogicalClock(), rng=random.Random(3), horde=True)
+            self.assertNotIn('dive', {event.movement for event in wave_manager._wave_timeline(30)})
+        print("Endless mode uses the registered movement patterns")
+
+    def test_no_victory_and_difficulty_applied(self):
+        wave_manager = EndlessWaveManager(clock=LogicalClock(), rng=random.Random(0))
+        self._start_wave(wave_manager, 15)
+        self.assertFalse(wave_manager.is_victory())
+        self.assertFalse(wave_manager.all_waves_completed())
+        difficulty = wave_difficulty(15)
+        for zombie in wave_manager.zombie_group:
+            self.assertEqual(zombie.shoot_cooldown, difficulty.shoot_cooldown)
+            self.assertAlmostEqual(zombie.speed_y, (1.5 if zombie.can_shoot else 2) * difficulty.speed_scale)
+
+        for zombie in list(wave_manager.zombie_group):
+            zombie.kill()
+        wave_manager.next_spawn = len(wave_manager.wave_timeline)
+        wave_manager.update()
+        self.assertTrue(wave_manager.waiting_for_next_wave) # wave 16 is on its way
+        self.assertIn("Ondata 16", wave_manager.get_wave_info())
+        print("Endless mode has no victory and scales the zombies of each wave")
+
+    def test_zombie_cap_holds_spawns_back(self):
+        clock = LogicalClock()
+        wave_manager = EndlessWaveManager(clock=clock, rng=random.Random(0), max_zombies=3)
+        self._start_wave(wave_manager, 10)
+        self.assertEqual(len(wave_manager.zombie_group), 3)
+        self.assertGreater(wave_manager.pending_spawns(), 0)
+
+        for _ in range(120):
+            clock.advance()
+            wave_manager.update()
+            self.assertLessEqual(len(wave_manager.zombie_group), 3)
+        self.assertGreater(wave_manager.held_back, 0)
+
+        pending = wave_manager.pending_spawns()
+        for zombie in list(wave_manager.zombie_group):
+            zombie.kill()
+        clock.advance(BACKPRESSURE_RETRY_MS)
+        wave_manager.update()
+        self.assertLess(wave_manager.pending_spawns(), pending) # room again, the wave goes on
+        print("Spawns wait while the zombie cap is reached")
+
+    def test_slow_frames_hold_spawns_back(self):
+        clock = LogicalClock()
+        wave_manager = EndlessWaveManager(clock=clock, rng=random.Random(0), min_zombies=0)
+        for _ in range(50):
+            wave_manager.report_frame_time(50)
+        self._start_wave(wave_manager, 5)
+        self.assertEqual(len(wave_manager.zombie_group), 0)
+
+        for _ in range(50):
+            wave_manager.report_frame_time(5)
+        clock.advance(BACKPRESSURE_RETRY_MS)
+        wave_manager.update()
+        self.assertGreater(len(wave_manager.zombie_group), 0)
+        print("Spawns wait while frames run over budget")
+
+    def test_slow_frames_keep_a_minimum_field(self):
+        # every frame over budget: zombies still come, up to the floor
+        clock = LogicalClock()
+        wave_manager = EndlessWaveManager(clock=clock, rng=random.Random(0))
+        self._start_wave(wave_manager, 10)
+        for _ in range(600):
+            wave_manager.report_frame_time(50)
+            clock.advance()
+            wave_manager.update()
+            self.assertLessEqual(len(wave_manager.zombie_group), MIN_ZOMBIES)
+        self.assertGreater(wave_manager.frame_time_ms, wave_manager.frame_budget_ms)
+        self.assertEqual(len(wave_manager.zombie_group), MIN_ZOMBIES)
+        self.assertGreater(wave_manager.held_back, 0)
+        print("Slow frames never empty the field")
+
+    def test_endless_simulation_is_seeded(self):
+        outcomes = []
+        for _ in range(2):
+            simulation = GameSimulation(seed=9, endless=True)
+            simulation.run(3000)
+            self.assertFalse(simulation.victory)
+            outcomes.append((simulation.ticks, simulation.plant_destroyed, simulation.wave_manager.current_wave))
+        self.assertEqual(outcomes[0], outcomes[1])
+        print("An endless match replays the same from its seed")
+
+if __name__ == '__main__':
+    unittest.main()
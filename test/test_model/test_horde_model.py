@@ -0,0 +1,124 @@
+import unittest
+import pygame
+import os
+
+from GardenInvasion.Model.horde_model import Horde, HORDE_AVAILABLE, RED, ORANGE, SHOOT_COOLDOWN
+from GardenInvasion.Model.zombie_model import RedZombie, OrangeZombie
+from GardenInvasion.Model.wave_model import WaveManager
+from GardenInvasion.Controller.simulation_controller import GameSimulation
+from GardenInvasion.Utilities.game_clock import LogicalClock
+from GardenInvasion.Utilities.constants import SCREEN_WIDTH
+
+class TestHordeAvailability(unittest.TestCase):
+
+    def test_ci_runs_the_horde_tests(self):
+        # NumPy is optional for players, but CI installs it (requirements-dev.txt):
+        # the vectorized backend must not be skipped there
+        if os.environ.get('GITHUB_ACTIONS') != 'true': # not CI: test_sound_manager_model drops CI from the environment
+            self.skipTest("not running in CI")
+        self.assertTrue(HORDE_AVAILABLE, "NumPy missing, install requirements-dev.txt")
+        print("Horde backend available in CI")
+
+@unittest.skipUnless(HORDE_AVAILABLE, "NumPy not installed")
+class TestHordeModel(unittest.TestCase):
+    # Test suite for the NumPy (structure-of-arrays) zombie backend
+
+    def setUp(self):
+        os.environ['SDL_AUDIODRIVER'] = 'dummy'
+        pygame.init()
+
+    def tearDown(self):
+        pygame.quit()
+
+    def test_movement_matches_sprite_zombies(self):
+        # every pattern, spawn point and delay moves exactly like RedZombie/OrangeZombie
+        clock = LogicalClock()
+        horde = Horde(clock, capacity=4)
+        sprites = pygame.sprite.Group()
+        pairs = []
+        spawn_x = {'A': SCREEN_WIDTH // 2, 'B': SCREEN_WIDTH // 3, 'C': SCREEN_WIDTH * 2 // 3,
+                   'D': SCREEN_WIDTH // 4, 'E': SCREEN_WIDTH * 3 // 4}
+        for pattern in ('straight', 'zigzag', 'roam_left', 'roam_right', 'roam_full'):
+            for spawn_point, x in spawn_x.items():
+                for delay in (0, 500):
+                    red = RedZombie((x, -50), pattern, spawn_point, delay, clock=clock)
+                    orange = OrangeZombie((x, -50), spawn_point, delay, pattern, clock=clock)
+                    sprites.add(red, orange)
+                    pairs.append((red, horde.spawn(RED, (x, -50), pattern, spawn_point, delay)))
+                    pairs.append((orange, horde.spawn(ORANGE, (x, -50), pattern, spawn_point, delay)))
+
+        for frame in range(500):
+            clock.advance()
+            sprites.update()
+            horde.update()
+            for zombie, view in pairs:
+                self.assertEqual(zombie.alive(), view.alive(), (frame, zombie.movement_pattern, zombie.spawn_point))
+                if zombie.alive():
+                    self.assertEqual(zombie.rect.topleft, view.rect.topleft,
+                                     (frame, zombie.movement_pattern, zombie.spawn_point, zombie.color))
+        print("Horde movement matches the sprite zombies")
+
+    def test_damage_frees_and_reuses_slots(self):
+        horde = Horde(LogicalClock(), capacity=2)
+        orange = horde.spawn(ORANGE, (100, 50))
+        self.assertEqual(orange.health, 2)
+        self.assertFalse(orange.take_damage())
+        self.assertEqual(orange.health, 1)
+        self.assertTrue(orange.take_damage())
+        self.assertFalse(orange.alive())
+        self.assertEqual(len(horde), 0)
+        self.assertFalse(horde.alive[orange.index])
+
+        red = horde.spawn(RED, (100, 50))
+        self.assertIs(red, orange) # the sprite is reused too
+        self.assertEqual(red.color, RED)
+        self.assertEqual(red.health, 1)
+        self.assertTrue(horde.alive[red.index])
+        red.kill()
+        red.kill() # killing twice frees the slot once
+        self.assertEqual(horde._free_slots.count(red.index), 1)
+        print("Dead zombies free their slot and sprite for the next spawn")
+
+    def test_grows_past_capacity(self):
+        clock = LogicalClock()
+        horde = Horde(clock, capacity=2)
+        zombies = [horde.spawn(RED, (100 + i, 50)) for i in range(5)]
+        self.assertEqual(len(horde.alive), 8)
+        self.assertEqual(len(horde), 5)
+        clock.advance()
+        horde.update()
+        self.assertEqual([zombie.rect.y for zombie in zombies], [52] * 5)
+        print("Horde arrays grow past their capacity")
+
+    def test_due_shots_respect_cooldown(self):
+        clock = LogicalClock()
+        horde = Horde(clock)
+        orange = horde.spawn(ORANGE, (100, 50))
+        horde.spawn(RED, (200, 50)) # red zombies don't shoot
+        self.assertEqual(horde.due_shots(), [])
+        clock.advance(SHOOT_COOLDOWN)
+        self.assertEqual(horde.due_shots(), [orange.rect.midbottom])
+        self.assertEqual(horde.due_shots(), [])
+        print("Only orange zombies shoot, once per cooldown")
+
+    def test_wave_manager_spawns_in_horde(self):
+        wave_manager = WaveManager(clock=LogicalClock(), horde=True)
+        wave_manager.start_first_wave()
+        wave_manager._execute_wave_start()
+        self.assertIs(wave_manager.zombie_group, wave_manager.horde.group)
+        self.assertGreater(len(wave_manager.zombie_group), 0)
+        self.assertEqual(len(wave_manager.zombie_group), len(wave_manager.horde))
+        print("WaveManager spawns wave zombies in the horde")
+
+    def test_simulation_matches_sprite_backend(self):
+        outcomes = []
+        for horde in (False, True):
+            simulation = GameSimulation(seed=5, horde=horde)
+            ticks = simulation.run(1200)
+            outcomes.append((ticks, simulation.plant_destroyed, simulation.victory,
+                             simulation.wave_manager.current_wave, len(simulation.wave_manager.zombie_group)))
+        self.assertEqual(outcomes[0], outcomes[1])
+        print("A seeded match plays out the same with the horde backend")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,74 @@
+import unittest
+import pygame
+import os
+
+from GardenInvasion.Model.movement_pattern_model import (
+    MOVEMENT_REGISTRY, Movement, movement_pattern, create_movement, ZigzagMovement, RoamFullMovement
+)
+from GardenInvasion.Model.zombie_model import RedZombie, OrangeZombie
+from GardenInvasion.Model.wave_definition_model import compile_waves
+from GardenInvasion.Model.horde_model import Horde, HORDE_AVAILABLE, RED
+from GardenInvasion.Utilities.game_clock import LogicalClock
+from GardenInvasion.Utilities.constants import SCREEN_WIDTH
+
+class TestMovementPatternModel(unittest.TestCase):
+    # Test suite for the movement pattern registry and strategies
+
+    def setUp(self):
+        os.environ['SDL_AUDIODRIVER'] = 'dummy'
+        pygame.init()
+
+    def tearDown(self):
+        if 'dive' in MOVEMENT_REGISTRY:
+            del MOVEMENT_REGISTRY['dive']
+            create_movement.cache_clear()
+        pygame.quit()
+
+    def _register_dive(self):
+        @movement_pattern('dive')
+        class DiveMovement(Movement):
+            # drops 3 extra pixels a frame
+            def move(self, zombie):
+                zombie.rect.y += 3
+        return DiveMovement
+
+    def test_pattern_resolved_once_at_spawn(self):
+        orange = OrangeZombie((100, 50), 'A', movement_pattern='roam_full')
+        self.assertIsInstance(orange.movement, RoamFullMovement)
+        self.assertEqual(orange.movement.speed, 3.0) # faster orange zombies from spawn point A
+        self.assertEqual(OrangeZombie((100, 50), 'B', movement_pattern='roam_full').movement.speed, 2.5)
+
+        red = RedZombie((100, 50), 'zigzag', 'B')
+        self.assertIsInstance(red.movement, ZigzagMovement)
+        self.assertEqual(red.movement.max_x, SCREEN_WIDTH // 2 - 15)
+        # zombies with the same color and spawn point share their strategy
+        self.assertIs(RedZombie((300, 50), 'zigzag', 'B').movement, red.movement)
+        print("Movement patterns are resolved once when the zombie spawns")
+
+    def test_unknown_pattern_raises(self):
+        with self.assertRaises(ValueError):
+            RedZombie((100, 50), 'teleport', 'A')
+        print("Unknown movement patterns are rejected")
+
+    def test_registered_pattern_is_usable(self):
+        self._register_dive()
+        zombie = RedZombie((100, 50), 'dive', 'A')
+        zombie.update()
+        self.assertEqual(zombie.rect.y, 50 + 2 + 3)
+
+        schedule = compile_waves({'waves': [{'phases': [{'at': 0, 'spawns': [
+            {'zombie': 'red', 'spawn_point': 'A', 'movement': 'dive'}]}]}]})
+        self.assertEqual(schedule.waves[0][0].movement, 'dive')
+        print("New patterns can be registered and used by zombies and wave files")
+
+    @unittest.skipUnless(HORDE_AVAILABLE, "NumPy not installed")
+    def test_horde_rejects_patterns_it_cannot_vectorize(self):
+        self._register_dive()
+        horde = Horde(LogicalClock())
+        with self.assertRaises(ValueError):
+            horde.spawn(RED, (100, 50), 'dive')
+        self.assertEqual(len(horde), 0)
+        print("The horde backend rejects custom patterns")
+
+if __name__ == '__main__':
+    unittest.main()
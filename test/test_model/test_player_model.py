@@ -3,6 +3,7 @@ from unittest.mock import MagicMock, Mock, patch
 import pygame
 import os
 from GardenInvasion.Model.plant_model import Player
+from GardenInvasion.Utilities.asset_cache import asset_cache
 
 class TestPlayer(unittest.TestCase):
     @classmethod
@@ -18,6 +19,8 @@ class TestPlayer(unittest.TestCase):
         pygame.quit()
 
     def setUp(self):
+        asset_cache.clear() # image loading is mocked, drop sprites cached by other tests
+        self.addCleanup(asset_cache.clear)
         # Set up test fixtures before each test
         mock_surface = pygame.Surface((100, 100)) # Create a mock surface to return when pygame.image.load is called
         self.mock_surface = mock_surface.convert_alpha()
@@ -14,6 +14,7 @@ from GardenInvasion.Model.wallnut_model import WallNutManager
 from GardenInvasion.Model.sound_manager_model import SoundManager
 from GardenInvasion.Model.setting_volume_model import SettingsModel
 from GardenInvasion.Model.PowerUp_model import PowerUpManager
+from GardenInvasion.Utilities.asset_cache import asset_cache
 
 class TestIncreasingFirePU(unittest.TestCase):
     # Tests for IncreasingFirePU model
@@ -30,6 +31,8 @@ class TestIncreasingFirePU(unittest.TestCase):
         pass
 
     def setUp(self):
+        asset_cache.clear() # image loading is mocked, drop sprites cached by other tests
+        self.addCleanup(asset_cache.clear)
         if not pygame.get_init():
             pygame.init()
 
@@ -103,6 +106,8 @@ class TestRepairWallnutPU(unittest.TestCase):
             pygame.display.set_mode((1, 1))
 
     def setUp(self):
+        asset_cache.clear() # image loading is mocked, drop sprites cached by other tests
+        self.addCleanup(asset_cache.clear)
         if not pygame.get_init():
             pygame.init()
 
@@ -188,6 +193,8 @@ class TestPowerUpManager(unittest.TestCase):
             pygame.display.set_mode((1, 1))
 
     def setUp(self):
+        asset_cache.clear() # image loading is mocked, drop sprites cached by other tests
+        self.addCleanup(asset_cache.clear)
         if not pygame.get_init():
             pygame.init()
 
@@ -3,6 +3,7 @@ from unittest.mock import Mock, patch
 import pygame
 import os
 from GardenInvasion.Model.projectile_model import Projectile
+from GardenInvasion.Utilities.asset_cache import asset_cache
 
 class TestProjectile(unittest.TestCase):
     @classmethod
@@ -18,6 +19,8 @@ class TestProjectile(unittest.TestCase):
         pygame.quit()
 
     def setUp(self):
+        asset_cache.clear() # image loading is mocked, drop sprites cached by other tests
+        self.addCleanup(asset_cache.clear)
         #Set up test fixtures before each test
         mock_surface = pygame.Surface((20, 20)) # Create a mock surface for projectile image
         self.mock_surface = mock_surface.convert_alpha() 
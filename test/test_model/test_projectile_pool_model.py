@@ -0,0 +1,91 @@
+import unittest
+import os
+import pygame
+from GardenInvasion.Model.zombie_projectile_model import ZombieProjectile
+from GardenInvasion.Model.projectile_pool_model import ProjectilePool
+from GardenInvasion.Utilities.constants import SCREEN_HEIGHT
+
+class TestProjectilePoolModel(unittest.TestCase):
+    def setUp(self):
+        os.environ['SDL_AUDIODRIVER'] = 'dummy'
+        pygame.init()
+        self.group = pygame.sprite.Group()
+        self.pool = ProjectilePool(ZombieProjectile, max_size=3)
+
+    def tearDown(self):
+        pygame.quit()
+
+    def test_acquire_places_projectile_in_group(self):
+        # acquired projectile is positioned and added to the given group
+        projectile = self.pool.acquire((100, 200), self.group)
+
+        self.assertIn(projectile, self.group)
+        self.assertEqual(projectile.rect.midbottom, (100, 200))
+        self.assertEqual(self.pool.in_use, 1)
+        print("Acquired projectile is placed in its group")
+
+    def test_killed_projectile_is_reused(self):
+        # a killed projectile goes back to the pool and is reset when acquired again
+        projectile = self.pool.acquire((100, 200), self.group)
+        projectile.speed = 99
+        projectile.kill()
+
+        self.assertNotIn(projectile, self.group)
+        self.assertEqual(self.pool.in_use, 0)
+
+        reused = self.pool.acquire((50, 60), self.group)
+        self.assertIs(reused, projectile)
+        self.assertEqual(reused.rect.midbottom, (50, 60))
+        self.assertEqual(reused.speed, 5)
+        self.assertEqual(self.pool.stats()['created'], 1)
+        self.assertEqual(self.pool.stats()['reused'], 1)
+        print("Killed projectile is reset and reused")
+
+    def test_offscreen_projectile_returns_to_pool(self):
+        # projectile leaving the screen through update() is released
+        projectile = self.pool.acquire((100, SCREEN_HEIGHT - 1), self.group)
+        for _ in range(100):
+            self.group.update()
+
+        self.assertEqual(len(self.group), 0)
+        self.assertEqual(self.pool.stats()['free'], 1)
+        self.assertTrue(projectile.in_pool)
+        print("Off-screen projectile returns to the pool")
+
+    def test_double_kill_releases_once(self):
+        # killing twice (e.g. off screen and collision in the same frame) doesn't duplicate it
+        projectile = self.pool.acquire((100, 200), self.group)
+        projectile.kill()
+        projectile.kill()
+
+        self.assertEqual(self.pool.stats()['free'], 1)
+        self.assertEqual(self.pool.in_use, 0)
+        print("Double kill releases the projectile once")
+
+    def test_max_size_and_high_water(self):
+        # pool refuses new projectiles above max_size and records the peak
+        shots = [self.pool.acquire((i * 10, 100), self.group) for i in range(4)]
+
+        self.assertIsNone(shots[3])
+        self.assertEqual(len(self.group), 3)
+        self.assertEqual(self.pool.dropped, 1)
+
+        shots[0].kill()
+        shots[1].kill()
+        stats = self.pool.stats()
+        self.assertEqual(stats['in_use'], 1)
+        self.assertEqual(stats['high_water'], 3)
+        print("Pool respects max_size and tracks the high-water mark")
+
+    def test_prewarm(self):
+        # prewarmed projectiles are ready before the first shot
+        pool = ProjectilePool(ZombieProjectile, max_size=10, prewarm=4)
+
+        self.assertEqual(pool.stats()['free'], 4)
+        pool.acquire((0, 0), self.group)
+        self.assertEqual(pool.created, 4)
+        self.assertEqual(pool.reused, 1)
+        print("Prewarmed projectiles are reused")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -12,7 +12,7 @@ if 'SDL_AUDIODRIVER' in os.environ:
 pygame.init()
 pygame.display.set_mode((1, 1))
 
-from GardenInvasion.Model.sound_manager_model import SoundManager
+from GardenInvasion.Model.sound_manager_model import SoundManager, SOUND_FILES, get_sound_manager
 from GardenInvasion.Model.setting_volume_model import SettingsModel
 
 
@@ -111,5 +111,75 @@ class TestSoundManagerModel(unittest.TestCase):
         mock_mixer_stop.assert_called_once()
         print("stop_all() works")
 
+    def _playing_sound(self):
+        # mock sound whose play() hands out a new busy channel each time
+        sound = MagicMock()
+        def play():
+            channel = MagicMock()
+            channel.get_busy.return_value = True
+            channel.get_sound.return_value = sound
+            return channel
+        sound.play.side_effect = play
+        return sound
+
+    def test_voice_limit_steals_oldest(self):
+        # a capped effect never plays more than its max voices at once
+        sound_manager = SoundManager(self.settings_model)
+        sound_manager.audio_available = True
+        sound = self._playing_sound()
+        sound_manager.sounds['zombie_hit'] = sound
+        max_voices = SOUND_FILES['zombie_hit'][1]
+
+        for _ in range(max_voices):
+            sound_manager.play_sound('zombie_hit')
+        oldest = sound_manager.voices['zombie_hit'][0]
+        sound_manager.play_sound('zombie_hit')
+
+        oldest.stop.assert_called_once()
+        self.assertEqual(len(sound_manager.voices['zombie_hit']), max_voices)
+        self.assertEqual(sound.play.call_count, max_voices + 1)
+        print("Extra voices of an effect steal the oldest one")
+
+    def test_finished_voices_free_their_slot(self):
+        sound_manager = SoundManager(self.settings_model)
+        sound_manager.audio_available = True
+        sound = self._playing_sound()
+        sound_manager.sounds['plant_shoot'] = sound
+        max_voices = SOUND_FILES['plant_shoot'][1]
+
+        for _ in range(max_voices):
+            sound_manager.play_sound('plant_shoot')
+        for channel in sound_manager.voices['plant_shoot']:
+            channel.get_busy.return_value = False # all done playing
+        channels = list(sound_manager.voices['plant_shoot'])
+        sound_manager.play_sound('plant_shoot')
+
+        for channel in channels:
+            channel.stop.assert_not_called()
+        self.assertEqual(len(sound_manager.voices['plant_shoot']), 1)
+        print("Finished voices don't count against the limit")
+
+    def test_volume_pushed_only_on_change(self):
+        sound_manager = SoundManager(self.settings_model)
+        sound_manager.audio_available = True
+        sound_manager.sounds['plant_shoot'] = self.mock_sound
+        sound_manager.play_sound('plant_shoot') # volume in sync
+        self.mock_sound.set_volume.reset_mock()
+
+        sound_manager.play_sound('plant_shoot')
+        sound_manager.play_sound('plant_shoot')
+        self.mock_sound.set_volume.assert_not_called()
+
+        self.settings_model.volume = 20
+        sound_manager.play_sound('plant_shoot')
+        self.mock_sound.set_volume.assert_called_with(0.2)
+        print("Volume is only pushed to the mixer when the setting changes")
+
+    def test_shared_manager_loads_once(self):
+        with patch('GardenInvasion.Model.sound_manager_model._shared_manager', None):
+            first = get_sound_manager(self.settings_model)
+            self.assertIs(get_sound_manager(self.settings_model), first)
+        print("The shared SoundManager is built once")
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
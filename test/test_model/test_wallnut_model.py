@@ -3,6 +3,7 @@ from unittest.mock import Mock, patch
 import pygame
 import os
 from GardenInvasion.Model.wallnut_model import WallNut, WallNutManager
+from GardenInvasion.Utilities.asset_cache import asset_cache
 
 
 class TestWallNut(unittest.TestCase):
@@ -21,6 +22,8 @@ class TestWallNut(unittest.TestCase):
         pygame.quit()
 
     def setUp(self):
+        asset_cache.clear() # image loading is mocked, drop sprites cached by other tests
+        self.addCleanup(asset_cache.clear)
         # Create mock surfaces for wallnut sprites
         mock_surface = pygame.Surface((60, 60))
         # Now convert_alpha() will work because display mode is set
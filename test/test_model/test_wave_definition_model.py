@@ -0,0 +1,71 @@
+import os
+import tempfile
+import unittest
+
+from GardenInvasion.Model.wave_definition_model import (
+    compile_waves, load_wave_schedule, DEFAULT_WAVES, SpawnEvent
+)
+
+class TestWaveDefinition(unittest.TestCase):
+    # Test suite for the declarative wave files
+
+    def test_campaign_matches_the_five_waves(self):
+        schedule = load_wave_schedule()
+        self.assertEqual(len(schedule), 5)
+        self.assertEqual([len(wave) for wave in schedule.waves], [1, 2, 2, 3, 7])
+        self.assertEqual(schedule.waves[3][2], SpawnEvent(0, 'orange', 'A', 'roam_full', 1000))
+        self.assertEqual([event.time for event in schedule.waves[4]], [0, 0, 0, 1000, 1000, 2000, 2000])
+        print("Campaign wave file has the five waves")
+
+    def test_schedule_compiled_once_per_file(self):
+        self.assertIs(load_wave_schedule(), load_wave_schedule(DEFAULT_WAVES))
+        print("Wave file compiled once")
+
+    def test_timeline_sorted_by_time(self):
+        # phases can be listed in any order, spawns at the same time keep the file order
+        schedule = compile_waves({'waves': [{'phases': [
+            {'at': 500, 'spawns': [{'zombie': 'orange', 'spawn_point': 'B'}]},
+            {'at': 0, 'spawns': [{'zombie': 'red', 'spawn_point': 'A'},
+                                 {'zombie': 'red', 'spawn_point': 'C', 'movement': 'zigzag'}]},
+        ]}]})
+        self.assertEqual(schedule.waves[0], (
+            SpawnEvent(0, 'red', 'A', 'straight', 0),
+            SpawnEvent(0, 'red', 'C', 'zigzag', 0),
+            SpawnEvent(500, 'orange', 'B', 'straight', 0),
+        ))
+        print("Wave timeline sorted by time")
+
+    def test_invalid_definitions_rejected(self):
+        def wave_with(spawn, at=0):
+            return {'waves': [{'phases': [{'at': at, 'spawns': [spawn]}]}]}
+
+        invalid = [
+            {},
+            {'waves': [{'phases': []}]},
+            wave_with({'zombie': 'green', 'spawn_point': 'A'}),
+            wave_with({'zombie': 'red', 'spawn_point': 'Z'}),
+            wave_with({'zombie': 'red', 'spawn_point': 'A', 'movement': 'teleport'}),
+            wave_with({'zombie': 'red', 'spawn_point': 'A', 'delay': -5}),
+            wave_with({'zombie': 'red', 'spawn_point': 'A'}, at=1.5),
+            wave_with("red"),
+        ]
+        for data in invalid:
+            with self.subTest(data=data):
+                with self.assertRaises(ValueError):
+                    compile_waves(data, "test.json")
+        print("Invalid wave files rejected")
+
+    def test_toml_wave_file(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "endless.toml")
+            with open(path, "w") as f:
+                f.write('name = "endless"\n'
+                        '[[waves]]\n[[waves.phases]]\nat = 0\n'
+                        '[[waves.phases.spawns]]\nzombie = "red"\nspawn_point = "D"\nmovement = "zigzag"\n')
+            schedule = load_wave_schedule(path)
+        self.assertEqual(schedule.name, "endless")
+        self.assertEqual(schedule.waves, ((SpawnEvent(0, 'red', 'D', 'zigzag', 0),),))
+        print("TOML wave files load like JSON ones")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -4,6 +4,8 @@ import sys
 import os
 
 from GardenInvasion.Model.wave_model import WaveManager
+from GardenInvasion.Model.wave_definition_model import compile_waves
+from GardenInvasion.Utilities.game_clock import LogicalClock
 from GardenInvasion.Utilities.constants import SCREEN_WIDTH, SCREEN_HEIGHT
 
 class TestWaveModel(unittest.TestCase):
@@ -50,22 +52,19 @@ class TestWaveModel(unittest.TestCase):
     def test_wave_1_spawn(self):
         
         wave_manager = WaveManager()
-        wave_manager.current_wave = 1
-        wave_manager._wave_1()
+        wave_manager._begin_wave(1)
         
         self.assertEqual(len(wave_manager.zombie_group), 1) # wave 1 should spawn 1 zombie base 1
     
     def test_wave_2_spawn(self):
         wave_manager = WaveManager()
-        wave_manager.current_wave = 2
-        wave_manager._wave_2()
+        wave_manager._begin_wave(2)
         
         self.assertEqual(len(wave_manager.zombie_group), 2) # wave 2 should spawn 2 zigzag zombies base 1
     
     def test_wave_3_spawn(self):
         wave_manager = WaveManager()
-        wave_manager.current_wave = 3
-        wave_manager._wave_3()
+        wave_manager._begin_wave(3)
         
         self.assertEqual(len(wave_manager.zombie_group), 2) # wave 3 should spawn 2 zombies base 2
         
@@ -74,33 +73,49 @@ class TestWaveModel(unittest.TestCase):
     
     def test_wave_4_spawn(self):
         wave_manager = WaveManager()
-        wave_manager.current_wave = 4
-        wave_manager._wave_4()
+        wave_manager._begin_wave(4)
         
         self.assertEqual(len(wave_manager.zombie_group), 3) # wave 4 should spawn 3 zigzag zombies base 1
     
     def test_wave_5_spawn(self):
         wave_manager = WaveManager()
-        wave_manager.current_wave = 5
-        wave_manager._wave_5()
+        wave_manager._begin_wave(5)
         
         self.assertEqual(len(wave_manager.zombie_group), 3) # wave 5 phase 1 should spawn 3 zombies base 1
-        self.assertEqual(len(wave_manager.wave_timers), 2)  
+        self.assertEqual(wave_manager.pending_spawns(), 4) # phases 2 and 3 still to come
     
     def test_wave_5_phase2(self):
-        wave_manager = WaveManager()
-        wave_manager._wave_5_phase2()
+        clock = LogicalClock()
+        wave_manager = WaveManager(clock=clock)
+        wave_manager._begin_wave(5)
+        clock.advance(1000)
+        wave_manager._spawn_due(clock.get_ticks())
         
-        self.assertEqual(len(wave_manager.zombie_group), 2) # wave 5 phase 2 should spawn 2 zigzag zombies base 1
+        self.assertEqual(len(wave_manager.zombie_group), 5) # wave 5 phase 2 should spawn 2 more zombies base 1
+        self.assertEqual(wave_manager.pending_spawns(), 2)
     
     def test_wave_5_phase3(self):
-        wave_manager = WaveManager()
-        wave_manager._wave_5_phase3()
+        clock = LogicalClock()
+        wave_manager = WaveManager(clock=clock)
+        wave_manager._begin_wave(5)
+        clock.advance(2000)
+        wave_manager._spawn_due(clock.get_ticks())
         
-        self.assertEqual(len(wave_manager.zombie_group), 2) # wave 5 phase 3 should spawn 2 zombies base 2
+        self.assertEqual(len(wave_manager.zombie_group), 7) # phases 2 and 3 both due
+        self.assertEqual(wave_manager.pending_spawns(), 0)
         
-        for zombie in wave_manager.zombie_group:
-            self.assertEqual(zombie.health, 2)
+        orange = [zombie for zombie in wave_manager.zombie_group if zombie.health == 2]
+        self.assertEqual(len(orange), 2) # wave 5 phase 3 should spawn 2 zombies base 2
+    
+    def test_custom_wave_schedule(self):
+        # a wave set passed in replaces the campaign
+        schedule = compile_waves({'waves': [{'phases': [{'at': 0, 'spawns': [
+            {'zombie': 'orange', 'spawn_point': 'E'}] * 4}]}] * 8})
+        wave_manager = WaveManager(schedule=schedule)
+        self.assertEqual(wave_manager.total_waves, 8)
+        
+        wave_manager._begin_wave(8)
+        self.assertEqual(len(wave_manager.zombie_group), 4)
     
     def test_wave_completion_detection(self):
         wave_manager = WaveManager()
@@ -155,8 +170,7 @@ class TestWaveIntegration(unittest.TestCase):
     
     def test_zombie_movement_in_wave(self):
         wave_manager = WaveManager()
-        wave_manager.current_wave = 2
-        wave_manager._wave_2()
+        wave_manager._begin_wave(2)
         
         initial_positions = [] # check initial positions
         for zombie in wave_manager.zombie_group: # store initial positions
@@ -203,7 +217,7 @@ class TestWaveManagerVictory(unittest.TestCase):
         # No zombies alive
         self.wave_manager.zombie_group.empty()
         # No pending spawns
-        self.wave_manager.wave_timers = []
+        self.assertEqual(self.wave_manager.pending_spawns(), 0)
         
         self.assertTrue(self.wave_manager.is_victory())
         print("Victory detected when all conditions met")
@@ -214,7 +228,6 @@ class TestWaveManagerVictory(unittest.TestCase):
         # Set wave beyond total
         self.wave_manager.current_wave = 6
         self.wave_manager.zombie_group.empty()
-        self.wave_manager.wave_timers = []
         
         self.assertTrue(self.wave_manager.is_victory())
         print("Victory detected after all waves completed")
@@ -47,7 +47,7 @@ class TestWaveManagerVictory(unittest.TestCase):
         # No zombies alive
         self.wave_manager.zombie_group.empty()
         # No pending spawns
-        self.wave_manager.wave_timers = []
+        self.assertEqual(self.wave_manager.pending_spawns(), 0)
         
         self.assertTrue(self.wave_manager.is_victory())
         print("Victory detected when all conditions met")
@@ -58,7 +58,6 @@ class TestWaveManagerVictory(unittest.TestCase):
         # Set wave beyond total
         self.wave_manager.current_wave = 6
         self.wave_manager.zombie_group.empty()
-        self.wave_manager.wave_timers = []
         
         self.assertTrue(self.wave_manager.is_victory())
         print("Victory detected after all waves completed")
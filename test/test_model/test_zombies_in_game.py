@@ -21,9 +21,8 @@ def test_zombies_visual():
     
     # create wave manager and spawn wave 1
     wave_manager = WaveManager()
-    wave_manager.current_wave = 1
     wave_manager.wave_complete = False
-    wave_manager._wave_1()  # Spawna wave 1
+    wave_manager._begin_wave(1)  # Spawna wave 1
     
     # Create player with settings_model
     settings_model = SettingsModel()
@@ -0,0 +1 @@
+# Tests for utility components (shared services)
@@ -0,0 +1,92 @@
+import unittest
+import pygame
+import os
+from unittest.mock import patch
+
+os.environ['SDL_VIDEODRIVER'] = 'dummy'
+
+from GardenInvasion.Utilities.asset_cache import (
+    AssetCache, image_path, SCALE_NONE, SCALE_SUPERSAMPLE, SCALE_ROTOZOOM
+)
+
+class TestAssetCache(unittest.TestCase):
+    # Test suite for the shared image cache
+
+    @classmethod
+    def setUpClass(cls):
+        pygame.init()
+        if not pygame.display.get_surface():
+            pygame.display.set_mode((1, 1))
+
+    def setUp(self):
+        self.cache = AssetCache()
+        self.source = pygame.Surface((100, 200)).convert_alpha()
+
+    def test_image_decoded_once(self):
+        # Asking twice for the same image loads it from disk only once and shares the Surface
+        with patch('pygame.image.load', return_value=self.source) as mock_load:
+            first = self.cache.get_image('plant.png', (50, 50))
+            second = self.cache.get_image('plant.png', (50, 50))
+
+        self.assertIs(first, second)
+        mock_load.assert_called_once()
+        self.assertEqual(self.cache.hits, 1)
+        self.assertEqual(self.cache.misses, 1)
+        print("Image decoded once and shared between requests")
+
+    def test_different_sizes_share_source(self):
+        # Two sizes of the same file are two entries but only one decode
+        with patch('pygame.image.load', return_value=self.source) as mock_load:
+            small = self.cache.get_image('plant.png', (10, 10))
+            big = self.cache.get_image('plant.png', (40, 40))
+
+        self.assertEqual(small.get_size(), (10, 10))
+        self.assertEqual(big.get_size(), (40, 40))
+        mock_load.assert_called_once()
+        self.assertEqual(self.cache.stats()['images'], 2)
+        print("Different sizes reuse the decoded source")
+
+    def test_size_specs(self):
+        # Height-only keeps the aspect ratio, a float is a scale factor
+        with patch('pygame.image.load', return_value=self.source):
+            by_height = self.cache.get_image('plant.png', (None, 70), SCALE_SUPERSAMPLE)
+            by_factor = self.cache.get_image('plant.png', 0.15)
+            rotozoomed = self.cache.get_image('plant.png', (None, 40), SCALE_ROTOZOOM)
+            original = self.cache.get_image('plant.png', None, SCALE_NONE)
+
+        self.assertEqual(by_height.get_size(), (35, 70))
+        self.assertEqual(by_factor.get_size(), (15, 30))
+        self.assertEqual(rotozoomed.get_height(), 40)
+        self.assertEqual(original.get_size(), (100, 200))
+        print("Size specs resolved correctly")
+
+    def test_preload_registered_specs(self):
+        # preload() builds every registered spec, later requests are hits
+        self.cache.register('a.png', (20, 20))
+        self.cache.register('b.png', (30, 30))
+        with patch('pygame.image.load', return_value=self.source):
+            ready = self.cache.preload()
+            self.cache.get_image('a.png', (20, 20))
+
+        self.assertEqual(ready, 2)
+        self.assertEqual(self.cache.misses, 2)
+        self.assertEqual(self.cache.hits, 1)
+        print("preload() builds registered images ahead of time")
+
+    def test_preload_skips_missing_files(self):
+        # A missing file is reported but does not stop the preload
+        with patch('pygame.image.load', side_effect=pygame.error("File not found")):
+            ready = self.cache.preload([('missing.png', (20, 20))])
+
+        self.assertEqual(ready, 0)
+        self.assertEqual(self.cache.stats()['images'], 0)
+        print("preload() skips images that cannot be loaded")
+
+    def test_real_asset_loads(self):
+        # Real zombie sprite is scaled to 70px height
+        image = self.cache.get_image(image_path("BaseZombie02.png"), (None, 70), SCALE_SUPERSAMPLE)
+        self.assertEqual(image.get_height(), 70)
+        print("Real asset loaded through the cache")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,104 @@
+import unittest
+import pygame
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+os.environ['SDL_VIDEODRIVER'] = 'dummy'
+
+from GardenInvasion.Utilities.asset_cache import AssetCache, image_path, SCALE_SUPERSAMPLE
+from GardenInvasion.Utilities.disk_image_cache import DiskImageCache
+
+class TestDiskImageCache(unittest.TestCase):
+    # Test suite for the on-disk cache of scaled images
+
+    @classmethod
+    def setUpClass(cls):
+        pygame.init()
+        if not pygame.display.get_surface():
+            pygame.display.set_mode((1, 1))
+
+    def setUp(self):
+        self.cache_dir = tempfile.mkdtemp()
+        # a source image of our own, so it can be edited
+        self.source = os.path.join(self.cache_dir, "zombie.png")
+        shutil.copy(image_path("BaseZombie02.png"), self.source)
+        self.spec = (self.source, (None, 70), SCALE_SUPERSAMPLE)
+
+    def tearDown(self):
+        shutil.rmtree(self.cache_dir)
+
+    def _asset_cache(self):
+        # fresh process-like cache backed by the test directory
+        cache = AssetCache()
+        cache.use_disk_cache(DiskImageCache(os.path.join(self.cache_dir, "images")))
+        return cache
+
+    def test_second_launch_maps_the_scaled_image(self):
+        first = self._asset_cache()
+        built = first.get_image(*self.spec)
+        self.assertEqual(first.disk_cache.stats(), {'hits': 0, 'misses': 1, 'writes': 1})
+
+        second = self._asset_cache()
+        with patch('pygame.image.load') as mock_load:
+            mapped = second.get_image(*self.spec)
+        mock_load.assert_not_called() # no decode, no scaling
+        self.assertEqual(second.disk_cache.hits, 1)
+        self.assertEqual(mapped.get_size(), built.get_size())
+        self.assertEqual(mapped.get_masks(), built.get_masks()) # same layout as convert_alpha()
+        self.assertEqual(pygame.image.tobytes(mapped, 'RGBA'), pygame.image.tobytes(built, 'RGBA'))
+        print("A later launch maps the scaled image from disk")
+
+    def test_edited_source_gets_a_new_entry(self):
+        self._asset_cache().get_image(*self.spec)
+        shutil.copy(image_path("BaseZombie01.png"), self.source)
+
+        cache = self._asset_cache()
+        image = cache.get_image(*self.spec)
+        self.assertEqual(cache.disk_cache.stats(), {'hits': 0, 'misses': 1, 'writes': 1})
+        self.assertEqual(len(os.listdir(os.path.join(self.cache_dir, "images"))), 2)
+        self.assertEqual(image.get_height(), 70)
+        print("Editing the source image invalidates its cache entry")
+
+    def test_broken_entry_is_rebuilt(self):
+        self._asset_cache().get_image(*self.spec)
+        entry = next(Path(self.cache_dir, "images").iterdir())
+        entry.write_bytes(entry.read_bytes()[:100]) # cut short
+
+        cache = self._asset_cache()
+        self.assertEqual(cache.get_image(*self.spec).get_height(), 70)
+        self.assertEqual(cache.disk_cache.writes, 1)
+        self.assertIsNotNone(DiskImageCache(entry.parent).load(*self.spec))
+        print("Broken cache entries are rebuilt")
+
+    def test_clear_closes_the_memory_maps(self):
+        # maps of dropped images are closed, one still backing a held surface stays open
+        self._asset_cache().get_image(*self.spec)
+        cache = self._asset_cache()
+        held = cache.get_image(*self.spec)
+        self.assertEqual(len(cache.disk_cache._maps), 1)
+        cache.clear()
+        self.assertEqual(len(cache.disk_cache._maps), 1)
+        del held
+        cache.clear()
+        self.assertEqual(cache.disk_cache._maps, [])
+        print("Clearing the cache closes the memory maps")
+
+    def test_failed_write_leaves_no_temp_file(self):
+        cache = self._asset_cache()
+        with patch('os.replace', side_effect=OSError("disk full")):
+            cache.get_image(*self.spec)
+        self.assertEqual(cache.disk_cache.writes, 0)
+        self.assertEqual(os.listdir(os.path.join(self.cache_dir, "images")), [])
+        print("A failed cache write leaves no temp file behind")
+
+    def test_missing_source_raises(self):
+        cache = self._asset_cache()
+        with self.assertRaises(FileNotFoundError):
+            cache.get_image(os.path.join(self.cache_dir, "missing.png"), (None, 70))
+        print("Missing source images raise like pygame.image.load")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,73 @@
+import unittest
+import pygame
+import os
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+os.environ['SDL_VIDEODRIVER'] = 'dummy'
+
+from GardenInvasion.Utilities.font_registry import FontRegistry, font_registry
+
+class TestFontRegistry(unittest.TestCase):
+    # Test suite for the shared font registry
+
+    def setUp(self):
+        pygame.init()
+
+    def tearDown(self):
+        pygame.quit()
+
+    def test_fonts_are_shared(self):
+        registry = FontRegistry()
+        font = registry.get("Arial", 20)
+        self.assertIs(registry.get("arial", 20), font) # same family as for SysFont
+        self.assertIsNot(registry.get("Arial", 24), font)
+        self.assertEqual(registry.stats()['hits'], 1)
+        self.assertEqual(registry.stats()['families'], 1) # resolved once for both sizes
+        print("Fonts are opened once per family, size and weight")
+
+    def test_system_fonts_are_looked_up_once(self):
+        registry = FontRegistry()
+        with patch('pygame.font.match_font', return_value=None) as mock_match:
+            registry.get("Arial", 20)
+            registry.get("Arial", 30)
+            registry.get("Arial", 30)
+        # the family and every fallback tried, once
+        self.assertEqual(mock_match.call_count, 5)
+        print("The system font lookup runs once per family")
+
+    def test_bundled_font_comes_first(self):
+        with tempfile.TemporaryDirectory() as fonts_path:
+            bundled = Path(fonts_path) / "gardenfont.ttf"
+            # pygame's own default TTF stands in for a bundled font
+            bundled.write_bytes((Path(pygame.__file__).parent / pygame.font.get_default_font()).read_bytes())
+            registry = FontRegistry(fonts_path)
+            with patch('pygame.font.match_font') as mock_match:
+                self.assertEqual(registry.resolve("Garden Font"), str(bundled))
+                font = registry.get("Garden Font", 20, bold=True) # no bold file, emboldened
+            mock_match.assert_not_called()
+            self.assertTrue(font.get_bold())
+        print("A TTF bundled in Assets/fonts is used before the system fonts")
+
+    def test_fonts_dropped_when_pygame_quits(self):
+        font = font_registry.get("Arial", 20)
+        pygame.quit()
+        pygame.init()
+        new_font = font_registry.get("Arial", 20)
+        self.assertIsNot(new_font, font)
+        self.assertEqual(new_font.render("ok", True, (0, 0, 0)).get_height(), new_font.get_height())
+        print("Fonts are reopened after pygame restarts")
+
+    def test_preload_opens_registered_fonts(self):
+        registry = FontRegistry()
+        registry.register("Arial", 18)
+        registry.register(None, 40)
+        self.assertGreaterEqual(registry.preload(), 0)
+        self.assertEqual(registry.stats()['fonts'], 2)
+        registry.get(None, 40)
+        self.assertEqual(registry.hits, 1)
+        print("preload() opens every registered font at startup")
+
+if __name__ == '__main__':
+    unittest.main()
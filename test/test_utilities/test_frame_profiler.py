@@ -0,0 +1,116 @@
+import csv
+import json
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from GardenInvasion.Utilities.frame_profiler import FrameProfiler, percentile, output_prefix, FRAME, PROFILE_NAME
+
+class TestFrameProfiler(unittest.TestCase):
+    # Test suite for the per-phase frame profiler
+
+    def _run_frames(self, profiler, laps_ns):
+        # Fake perf_counter_ns: every call moves time forward by the next value of laps_ns
+        now = [0]
+        steps = iter(laps_ns)
+        def fake_counter():
+            now[0] += next(steps)
+            return now[0]
+        with patch('time.perf_counter_ns', side_effect=fake_counter):
+            for _ in range(len(laps_ns) // 4):
+                profiler.start_frame()
+                profiler.lap('update')
+                profiler.lap('draw')
+                profiler.end_frame()
+
+    def test_percentile_nearest_rank(self):
+        values = list(range(1, 101))
+        self.assertEqual(percentile(values, 50), 50)
+        self.assertEqual(percentile(values, 95), 95)
+        self.assertEqual(percentile(values, 99), 99)
+        self.assertEqual(percentile([7], 99), 7)
+        self.assertEqual(percentile([], 50), 0)
+        print("Percentiles use the nearest rank")
+
+    def test_laps_time_each_phase(self):
+        # three 12 ms frames (update 2 ms + draw 10 ms) and one 22 ms frame, over the 16.6 ms budget
+        profiler = FrameProfiler()
+        self._run_frames(profiler, [1, 2_000_000, 10_000_000, 0] * 3 + [1, 2_000_000, 20_000_000, 0])
+
+        summary = profiler.summary()
+        self.assertEqual(summary['frames'], 4)
+        self.assertEqual(summary['over_budget'], 1)
+        self.assertEqual(list(summary['phases']), ['update', 'draw', FRAME])
+        self.assertAlmostEqual(summary['phases']['update']['mean_ms'], 2)
+        self.assertAlmostEqual(summary['phases']['draw']['p50_ms'], 10)
+        self.assertAlmostEqual(summary['phases']['draw']['max_ms'], 20)
+        self.assertEqual(profiler.recent_frames_ms(), [12, 12, 12, 22])
+        print("Laps time each phase and frames over budget are counted")
+
+    def test_disabled_profiler_records_nothing(self):
+        profiler = FrameProfiler(enabled=False)
+        profiler.start_frame()
+        profiler.lap('update')
+        profiler.end_frame()
+        self.assertEqual(profiler.phases, {})
+
+        profiler.toggle()
+        profiler.lap('update') # no frame started while disabled
+        self.assertEqual(profiler.phases, {})
+        print("Disabled profiler records nothing")
+
+    def test_discarded_frame_records_nothing(self):
+        # a frame a modal screen ran in is dropped, the next one is timed again
+        profiler = FrameProfiler()
+        profiler.start_frame()
+        profiler.lap('draw')
+        profiler.discard_frame()
+        profiler.lap('flip')
+        profiler.end_frame()
+        self.assertNotIn('flip', profiler.phases)
+        self.assertEqual(profiler.summary()['frames'], 0)
+
+        profiler.start_frame()
+        profiler.lap('flip')
+        profiler.end_frame()
+        self.assertEqual(profiler.summary()['frames'], 1)
+        print("Discarded frames are not timed")
+
+    def test_csv_and_json_output(self):
+        profiler = FrameProfiler()
+        self._run_frames(profiler, [1, 1_000_000, 3_000_000, 0] * 2)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            csv_path = os.path.join(tmp, "profile.csv")
+            json_path = os.path.join(tmp, "profile.json")
+            profiler.write_csv(csv_path)
+            profiler.write_json(json_path)
+
+            with open(csv_path, newline='') as f:
+                rows = list(csv.reader(f))
+            with open(json_path) as f:
+                data = json.load(f)
+
+        self.assertEqual(rows[0], ['phase', 'count', 'mean_ms', 'p50_ms', 'p95_ms', 'p99_ms', 'max_ms'])
+        self.assertEqual([row[0] for row in rows[1:]], ['update', 'draw', FRAME])
+        self.assertEqual(rows[2][1], '2')
+        self.assertEqual(data['frames'], 2)
+        self.assertAlmostEqual(data['phases'][FRAME]['p99_ms'], 4)
+        print("Profile is written as CSV and JSON")
+
+    def test_output_goes_where_the_setting_says(self):
+        # F3 alone writes to the profiles directory, never to the working directory
+        with tempfile.TemporaryDirectory() as tmp:
+            profiles = Path(tmp) / "profiles"
+            with patch('GardenInvasion.Utilities.frame_profiler.DEFAULT_PROFILE_DIR', profiles):
+                self.assertEqual(output_prefix(None), profiles / PROFILE_NAME)
+                self.assertEqual(output_prefix('0'), profiles / PROFILE_NAME)
+                self.assertTrue(profiles.is_dir())
+        self.assertEqual(output_prefix('1'), Path(PROFILE_NAME))
+        self.assertEqual(output_prefix('runs/level1'), Path('runs/level1'))
+        print("Profile output goes where the setting says")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,31 @@
+import unittest
+from unittest.mock import patch
+
+from GardenInvasion.Utilities.game_clock import LogicalClock, get_ticks, FIXED_DT_MS
+
+class TestGameClock(unittest.TestCase):
+    # Test suite for the logical game clock
+
+    def test_logical_clock_moves_only_when_advanced(self):
+        # time stands still until advance() is called
+        clock = LogicalClock()
+        self.assertEqual(clock.get_ticks(), 0)
+
+        for _ in range(120):
+            clock.advance()
+        self.assertEqual(clock.get_ticks(), 2000)
+
+        clock.advance(250)
+        self.assertEqual(clock.get_ticks(), 2250)
+        print("Logical clock moves only when advanced")
+
+    @patch('pygame.time.get_ticks', return_value=1234)
+    def test_get_ticks_falls_back_to_pygame(self, mock_ticks):
+        # without a clock models keep reading pygame's real time
+        self.assertEqual(get_ticks(), 1234)
+        self.assertEqual(get_ticks(LogicalClock(start_ms=FIXED_DT_MS)), 17)
+        mock_ticks.assert_called_once()
+        print("get_ticks falls back to pygame time without a clock")
+
+if __name__ == '__main__':
+    unittest.main()
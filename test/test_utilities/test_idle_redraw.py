@@ -0,0 +1,103 @@
+import unittest
+import pygame
+import os
+import time
+from unittest.mock import patch
+
+os.environ['SDL_VIDEODRIVER'] = 'dummy'
+
+from GardenInvasion.Utilities.idle_redraw import IdleRedraw
+from GardenInvasion.Controller.NewGame_controller import show_pause_menu
+from GardenInvasion.Model.menu_model import MenuModel
+
+class TestIdleRedraw(unittest.TestCase):
+    # Test suite for the redraw-on-change helper of the menu loops
+
+    @classmethod
+    def setUpClass(cls):
+        pygame.init()
+        if not pygame.display.get_surface():
+            pygame.display.set_mode((1, 1))
+
+    def setUp(self):
+        pygame.event.clear()
+
+    def tearDown(self):
+        pygame.event.clear()
+
+    def test_first_frame_is_drawn_once(self):
+        idle = IdleRedraw(timeout_ms=1)
+        idle.get_events()
+        idle.watch(0)
+        self.assertTrue(idle.should_draw())
+        self.assertFalse(idle.should_draw())
+        self.assertEqual(idle.frames, 1)
+        print("First frame drawn once")
+
+    def test_idle_loop_sleeps_until_timeout(self):
+        idle = IdleRedraw(timeout_ms=50)
+        idle.should_draw() # first frame done
+        start = time.perf_counter()
+        events = idle.get_events()
+        self.assertGreaterEqual(time.perf_counter() - start, 0.04)
+        self.assertEqual(events, [])
+        self.assertEqual(idle.waits, 1)
+        self.assertFalse(idle.should_draw())
+        print("Idle loop sleeps instead of drawing")
+
+    def test_waited_event_comes_first(self):
+        idle = IdleRedraw(timeout_ms=1000)
+        idle.should_draw()
+        pygame.event.post(pygame.event.Event(pygame.USEREVENT, {'order': 1}))
+        pygame.event.post(pygame.event.Event(pygame.USEREVENT, {'order': 2}))
+        start = time.perf_counter()
+        events = [e for e in idle.get_events() if e.type == pygame.USEREVENT]
+        self.assertLess(time.perf_counter() - start, 0.5) # woken by the event
+        self.assertEqual([e.order for e in events], [1, 2])
+        print("Events keep their order after the wait")
+
+    def test_watched_state_changes_redraw(self):
+        idle = IdleRedraw(timeout_ms=1)
+        idle.watch(0, False)
+        idle.should_draw()
+        idle.watch(0, False)
+        self.assertFalse(idle.should_draw())
+        idle.watch(1, False)
+        self.assertTrue(idle.should_draw())
+        idle.mark_dirty()
+        self.assertTrue(idle.should_draw())
+        print("Model changes mark the view dirty")
+
+    def test_input_events_redraw_but_motion_alone_does_not(self):
+        idle = IdleRedraw(timeout_ms=1)
+        idle.should_draw()
+        motion = pygame.event.Event(pygame.MOUSEMOTION, {'pos': (1, 1)})
+        with patch('pygame.event.get', return_value=[motion]):
+            idle.get_events()
+        self.assertFalse(idle.should_draw())
+        key = pygame.event.Event(pygame.KEYDOWN, {'key': pygame.K_a})
+        with patch('pygame.event.get', return_value=[key]):
+            idle.get_events()
+        self.assertTrue(idle.should_draw())
+        print("Key presses redraw, plain mouse motion doesn't")
+
+    @patch('GardenInvasion.Controller.NewGame_controller.draw_pause_modal')
+    @patch('pygame.display.flip')
+    def test_pause_menu_draws_only_on_change(self, mock_flip, mock_draw):
+        screen = pygame.Surface((600, 600))
+        events = [
+            [], [], [],
+            [pygame.event.Event(pygame.MOUSEMOTION, {'pos': (0, 0)})], # over no button
+            [pygame.event.Event(pygame.KEYDOWN, {'key': pygame.K_RIGHT})],
+            [], [],
+            [pygame.event.Event(pygame.KEYDOWN, {'key': pygame.K_ESCAPE})],
+        ]
+        with patch('GardenInvasion.Utilities.idle_redraw.IDLE_TIMEOUT_MS', 1), \
+             patch('pygame.event.get', side_effect=events):
+            self.assertEqual(show_pause_menu(screen, MenuModel()), 'resume')
+        self.assertEqual(mock_draw.call_count, 2) # opening frame, then the new selection
+        self.assertEqual(mock_flip.call_count, 2)
+        print("Pause menu redraws only when the selection changes")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,117 @@
+import unittest
+import os
+import tempfile
+from collections import defaultdict
+import pygame
+
+from GardenInvasion.Utilities.input_log import (
+    InputRecorder, read_input_log, session_log_path, encode_keys, decode_keys, HEADER, MODE, RECORD, RECORDED_KEYS
+)
+from GardenInvasion.Utilities.game_rng import MIN_SEED, MAX_SEED
+
+class TestInputLog(unittest.TestCase):
+    # Test suite for the binary input log
+
+    def setUp(self):
+        handle, self.path = tempfile.mkstemp(suffix=".gilg")
+        os.close(handle)
+        self.addCleanup(os.remove, self.path)
+
+    def test_encode_decode_roundtrip(self):
+        # pressed keys survive the mask encoding, unrelated keys are ignored
+        keys = defaultdict(bool, {pygame.K_LEFT: True, pygame.K_3: True, pygame.K_SPACE: True})
+        mask = encode_keys(keys)
+
+        self.assertEqual(decode_keys(mask), {pygame.K_LEFT, pygame.K_3})
+        print("Key mask encodes and decodes pressed keys")
+
+    def test_only_changes_are_written(self):
+        # a long run with few input changes produces a tiny log
+        recorder = InputRecorder(self.path, seed=42, dt_ms=1000 / 60, skin_id="default")
+        for tick in range(1, 1001):
+            pressed = {pygame.K_RIGHT} if 200 <= tick < 300 else set()
+            recorder.record(tick, _released() | {key: True for key in pressed})
+        recorder.close()
+
+        expected_size = HEADER.size + 1 + len("default") + MODE.size + 3 * RECORD.size # 2 changes + end mark
+        self.assertEqual(os.path.getsize(self.path), expected_size)
+        print("Input log stores only input changes")
+
+    def test_log_read_back_per_tick(self):
+        # every tick replays the key state recorded for it, with seed and settings
+        recorder = InputRecorder(self.path, seed=7, dt_ms=20.0, skin_id="skin2")
+        recorder.record(1, _released())
+        recorder.record(2, _released() | {pygame.K_a: True})
+        recorder.record(3, _released(), escape=True)
+        recorder.record(4, _released())
+        recorder.close()
+
+        log = read_input_log(self.path)
+        masks = list(log.masks())
+
+        self.assertEqual((log.seed, log.dt_ms, log.skin_id, log.last_tick), (7, 20.0, "skin2", 4))
+        self.assertEqual([decode_keys(mask) for mask in masks], [set(), {pygame.K_a}, {pygame.K_ESCAPE}, set()])
+        print("Input log is read back tick by tick")
+
+    def test_game_mode_is_in_the_header(self):
+        # wave file, endless and horde are read back with the log, the campaign by default
+        recorder = InputRecorder(self.path, seed=7, dt_ms=20.0, waves="waves/été.toml", endless=True, horde=True)
+        recorder.record(1, _released() | {pygame.K_d: True})
+        recorder.close()
+        log = read_input_log(self.path)
+        self.assertEqual((log.waves, log.endless, log.horde), ("waves/été.toml", True, True))
+        self.assertEqual(decode_keys(list(log.masks())[0]), {pygame.K_d})
+
+        InputRecorder(self.path, seed=7, dt_ms=20.0).close()
+        log = read_input_log(self.path)
+        self.assertEqual((log.waves, log.endless, log.horde), (None, False, False))
+        print("Game mode is stored in the input log header")
+
+    def test_truncated_log_is_readable(self):
+        # a log without end mark (game killed) replays up to the last recorded change
+        recorder = InputRecorder(self.path, seed=1, dt_ms=20.0)
+        recorder.record(5, _released() | {pygame.K_d: True})
+        recorder._file.write(b"\x01\x02") # half record
+        recorder._file.close()
+
+        log = read_input_log(self.path)
+        self.assertEqual(log.last_tick, 5)
+        self.assertEqual(decode_keys(list(log.masks())[-1]), {pygame.K_d})
+        print("Truncated input log is still readable")
+
+    def test_restarted_sessions_get_their_own_log(self):
+        # the same pattern never names the same file twice in a process
+        pattern = os.path.join(os.path.dirname(self.path), "restart_test_{seed}.gilg")
+        first = session_log_path(pattern, 5)
+        self.assertTrue(first.endswith("restart_test_5.gilg"))
+        self.assertTrue(session_log_path(pattern, 5).endswith("restart_test_5-2.gilg"))
+        self.assertTrue(session_log_path(pattern, 5).endswith("restart_test_5-3.gilg"))
+        self.assertEqual(session_log_path(pattern, 6), first.replace("_5", "_6"))
+
+        fixed = os.path.join(os.path.dirname(self.path), "restart_test.gilg") # no {seed}
+        self.assertNotEqual(session_log_path(fixed, 1), session_log_path(fixed, 2))
+        print("Restarted sessions don't overwrite the previous log")
+
+    def test_negative_and_extreme_seeds_round_trip(self):
+        # any seed GameRng takes from GARDEN_INVASION_SEED is stored as it is
+        for seed in (-5, MIN_SEED, MAX_SEED):
+            InputRecorder(self.path, seed=seed, dt_ms=20.0).close()
+            self.assertEqual(read_input_log(self.path).seed, seed)
+        with self.assertRaises(ValueError):
+            InputRecorder(self.path, seed=MAX_SEED + 1, dt_ms=20.0)
+        print("Negative and extreme seeds round-trip through the log")
+
+    def test_rejects_other_files(self):
+        # files that aren't input logs are refused
+        with open(self.path, "wb") as f:
+            f.write(b"not a log at all, really not")
+        with self.assertRaises(ValueError):
+            read_input_log(self.path)
+        print("Non-log files are rejected")
+
+def _released():
+    # key state with every recorded key released
+    return {key: False for key in RECORDED_KEYS}
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,78 @@
+import unittest
+import pygame
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+from GardenInvasion.Utilities.pcm_cache import PcmCache
+
+SOUNDS_PATH = Path(__file__).resolve().parents[2] / "GardenInvasion" / "Assets" / "sounds"
+
+class TestPcmCache(unittest.TestCase):
+    # Test suite for the on-disk cache of decoded sound effects
+
+    def setUp(self):
+        # the disk driver runs without an audio device, samples go nowhere
+        self.env_patcher = patch.dict(os.environ, {'SDL_AUDIODRIVER': 'disk', 'SDL_DISKAUDIOFILE': os.devnull})
+        self.env_patcher.start()
+        pygame.mixer.quit()
+        try:
+            pygame.mixer.init()
+        except pygame.error as e:
+            self.env_patcher.stop()
+            self.skipTest(f"no mixer: {e}")
+        self.cache_dir = tempfile.mkdtemp()
+        self.source = os.path.join(self.cache_dir, "hit.ogg")
+        shutil.copy(SOUNDS_PATH / "zombie_hit.ogg", self.source)
+
+    def tearDown(self):
+        pygame.mixer.quit()
+        self.env_patcher.stop()
+        shutil.rmtree(self.cache_dir)
+
+    def _cache(self):
+        return PcmCache(os.path.join(self.cache_dir, "sounds"))
+
+    def test_second_launch_skips_decoding(self):
+        first = self._cache()
+        decoded = first.get_sound(self.source)
+        self.assertEqual(first.stats(), {'hits': 0, 'misses': 1, 'writes': 1})
+
+        second = self._cache()
+        decodes = []
+        real_sound = pygame.mixer.Sound
+        def sound(*args, **kwargs): # records file loads only, keeps no reference to the samples
+            decodes.extend(args)
+            return real_sound(*args, **kwargs)
+        with patch('pygame.mixer.Sound', new=sound):
+            cached = second.get_sound(self.source)
+        self.assertEqual(decodes, []) # built from buffer=, no file decoded
+        self.assertEqual(second.hits, 1)
+        self.assertEqual(cached.get_raw(), decoded.get_raw())
+        print("A later launch builds the effect from cached samples")
+
+    def test_other_mixer_format_gets_a_new_entry(self):
+        self._cache().get_sound(self.source)
+        pygame.mixer.quit()
+        pygame.mixer.init(frequency=22050)
+
+        cache = self._cache()
+        cache.get_sound(self.source)
+        self.assertEqual(cache.stats(), {'hits': 0, 'misses': 1, 'writes': 1})
+        self.assertEqual(len(os.listdir(os.path.join(self.cache_dir, "sounds"))), 2)
+        print("Samples are cached per mixer format")
+
+    def test_broken_entry_is_rebuilt(self):
+        self._cache().get_sound(self.source)
+        entry = next(Path(self.cache_dir, "sounds").iterdir())
+        entry.write_bytes(entry.read_bytes()[:100]) # cut short
+
+        cache = self._cache()
+        self.assertGreater(cache.get_sound(self.source).get_length(), 0)
+        self.assertEqual(cache.writes, 1)
+        print("Broken cache entries are rebuilt")
+
+if __name__ == '__main__':
+    unittest.main()
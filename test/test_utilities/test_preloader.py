@@ -0,0 +1,92 @@
+import unittest
+import pygame
+import os
+import threading
+import time
+from unittest.mock import MagicMock
+
+os.environ['SDL_VIDEODRIVER'] = 'dummy'
+
+from GardenInvasion.Utilities.preloader import Preloader
+from GardenInvasion.Utilities.asset_cache import asset_cache
+from GardenInvasion.Controller.NewGame_controller import start_preloading, HEART_SPEC
+
+class TestPreloader(unittest.TestCase):
+    # Test suite for the background asset preloader
+
+    @classmethod
+    def setUpClass(cls):
+        pygame.init()
+        if not pygame.display.get_surface():
+            pygame.display.set_mode((1, 1))
+
+    def setUp(self):
+        self.preloader = Preloader()
+
+    def tearDown(self):
+        self.preloader.shutdown()
+
+    def test_tasks_run_off_the_calling_thread(self):
+        release = threading.Event()
+        def task():
+            release.wait(5)
+            return threading.current_thread()
+        self.preloader.submit('slow', task)
+        self.assertFalse(self.preloader.done('slow')) # the caller isn't blocked
+        release.set()
+        self.assertIsNot(self.preloader.wait('slow'), threading.current_thread())
+        self.assertTrue(self.preloader.done('slow'))
+        print("Preload tasks run on a worker thread")
+
+    def test_each_task_is_submitted_once(self):
+        task = MagicMock(return_value=3)
+        first = self.preloader.submit('sprites', task)
+        self.assertIs(self.preloader.submit('sprites', task), first)
+        self.assertEqual(self.preloader.wait('sprites'), 3)
+        task.assert_called_once()
+        print("A task is only queued once per name")
+
+    def test_failed_or_unknown_tasks_return_none(self):
+        def broken():
+            raise pygame.error("corrupt image")
+        self.preloader.submit('broken', broken)
+        self.assertIsNone(self.preloader.wait('broken'))
+        self.assertIsNone(self.preloader.wait('never_submitted'))
+        print("Failed and unknown tasks fall back to loading on demand")
+
+    def test_game_assets_are_ready_after_waiting(self):
+        asset_cache.clear()
+        sound_manager = MagicMock()
+        start_preloading(self.preloader, sound_manager)
+        self.assertGreater(self.preloader.wait('sprites'), 0)
+        self.assertIsNotNone(self.preloader.wait('background'))
+        self.preloader.wait('music')
+        sound_manager.preload_music.assert_called_once_with('gameplay')
+
+        misses = asset_cache.misses
+        asset_cache.get_image(*HEART_SPEC)
+        self.assertEqual(asset_cache.misses, misses) # already built by the worker
+        asset_cache.clear()
+        print("Gameplay assets are built by the preloader before the game starts")
+
+    def test_quitting_pygame_stops_the_worker_first(self):
+        # the running task finishes with pygame still up, the queued one never starts
+        seen = []
+        def running():
+            time.sleep(0.2)
+            seen.append(pygame.get_init())
+        queued = MagicMock()
+        self.preloader.submit('sprites', running)
+        self.preloader.submit('music', queued)
+        try:
+            pygame.quit() # what the quit paths of the menus and the game do
+            self.assertEqual(seen, [True])
+            queued.assert_not_called()
+            self.assertTrue(self.preloader._futures['music'].cancelled())
+        finally:
+            pygame.init()
+            pygame.display.set_mode((1, 1))
+        print("Quitting pygame stops the preloader before pygame goes down")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,86 @@
+import unittest
+
+from GardenInvasion.Utilities.game_clock import LogicalClock
+from GardenInvasion.Utilities.scheduler import Scheduler, COMPACT_MIN
+from GardenInvasion.Model.plant_model import Player
+from GardenInvasion.Model.zombie_model import RedZombie
+
+class TestScheduler(unittest.TestCase):
+    # Test suite for the game event scheduler
+
+    def setUp(self):
+        self.clock = LogicalClock()
+        self.scheduler = Scheduler(self.clock)
+        self.ran = []
+
+    def test_events_run_in_time_order(self):
+        # events run once due, by time, same-time events in scheduling order
+        for time_ms, name in ((300, 'c'), (100, 'a'), (300, 'd'), (200, 'b')):
+            self.scheduler.schedule_at(time_ms, self.ran.append, name)
+        self.assertEqual(self.scheduler.next_time(), 100)
+
+        self.assertEqual(self.scheduler.run_due(150), 1)
+        self.clock.advance(300)
+        self.scheduler.run_due()
+        self.assertEqual(self.ran, ['a', 'b', 'c', 'd'])
+        self.assertEqual(len(self.scheduler), 0)
+        self.assertIsNone(self.scheduler.next_time())
+        print("Scheduled events run in time order")
+
+    def test_cancelled_events_do_not_run(self):
+        keep = self.scheduler.schedule_in(10, self.ran.append, 'keep')
+        drop = self.scheduler.schedule_in(5, self.ran.append, 'drop')
+        drop.cancel()
+        self.assertFalse(drop.pending)
+        self.assertEqual(len(self.scheduler), 1)
+        self.assertEqual(self.scheduler.next_time(), 10)
+
+        self.scheduler.run_due(10)
+        keep.cancel() # already ran: no effect
+        self.assertEqual(self.ran, ['keep'])
+        self.assertEqual(len(self.scheduler), 0)
+        print("Cancelled events don't run")
+
+    def test_callbacks_can_schedule_due_events(self):
+        # an event scheduled by a callback for a time already reached runs in the same call
+        def chain(step):
+            self.ran.append(step)
+            if step < 3:
+                self.scheduler.schedule_at(step * 10, chain, step + 1)
+        self.scheduler.schedule_at(0, chain, 1)
+        self.assertEqual(self.scheduler.run_due(100), 3)
+        self.assertEqual(self.ran, [1, 2, 3])
+        print("Callbacks can schedule events due right away")
+
+    def test_heap_compacted_after_mass_cancel(self):
+        events = [self.scheduler.schedule_at(i, self.ran.append, i) for i in range(COMPACT_MIN * 4)]
+        for event in events[:-1]:
+            event.cancel()
+        self.assertLess(len(self.scheduler._heap), COMPACT_MIN * 2)
+        self.scheduler.run_due(COMPACT_MIN * 4)
+        self.assertEqual(self.ran, [COMPACT_MIN * 4 - 1])
+        print("Heap compacted after many cancellations")
+
+    def test_models_on_a_shared_scheduler(self):
+        # delayed zombies and power-up expiry run from the scheduler, not from update()
+        player = Player((300, 500), clock=self.clock, scheduler=self.scheduler)
+        zombie = RedZombie((100, 50), wave_delay=500, clock=self.clock, scheduler=self.scheduler)
+        player.apply_fire_rate_boost(0.5, 1000)
+        self.assertEqual(len(self.scheduler), 2)
+
+        self.clock.advance(600)
+        zombie.update()
+        self.assertFalse(zombie.active) # update() doesn't poll with a scheduler
+        self.scheduler.run_due()
+        self.assertTrue(zombie.active)
+
+        player.apply_fire_rate_boost(0.5, 1000) # extends the boost, one expiry pending
+        self.assertEqual(len(self.scheduler), 1)
+        self.clock.advance(1000)
+        self.scheduler.run_due()
+        self.assertEqual(player.shoot_SecondTime, player.base_shoot_cooldown)
+        self.assertEqual(player.fire_rate_boost_end_time, 0)
+        print("Models register timed events on the shared scheduler")
+
+if __name__ == '__main__':
+    unittest.main()
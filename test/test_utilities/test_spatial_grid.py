@@ -0,0 +1,111 @@
+import unittest
+import random
+import pygame
+from unittest.mock import patch
+
+from GardenInvasion.Utilities.spatial_grid import SpatialGrid, pair_checks, MIN_PAIR_CHECKS
+
+def _make_group(count, size, rng, area=(600, 600)):
+    # group of plain sprites with random rects, some partly off screen
+    group = pygame.sprite.Group()
+    for _ in range(count):
+        sprite = pygame.sprite.Sprite()
+        sprite.rect = pygame.Rect(rng.randint(-60, area[0]), rng.randint(-60, area[1]), *size)
+        group.add(sprite)
+    return group
+
+class TestSpatialGrid(unittest.TestCase):
+    # Test suite for the uniform grid collision broadphase
+
+    def setUp(self):
+        rng = random.Random(42)
+        self.projectiles = _make_group(150, (10, 20), rng)
+        self.zombies = _make_group(200, (40, 70), rng)
+        self.grid = SpatialGrid()
+        self.grid.rebuild(self.zombies)
+
+    def test_groupcollide_matches_pygame(self):
+        # same pairs, in the same order, as pygame.sprite.groupcollide
+        expected = pygame.sprite.groupcollide(self.projectiles, self.zombies, False, False)
+        result = self.grid.groupcollide(self.projectiles, self.zombies, False, False)
+
+        self.assertGreater(len(expected), 0)
+        self.assertEqual(result, expected)
+        print("Grid groupcollide matches pygame")
+
+    def test_spritecollide_matches_pygame(self):
+        # same hits for a big sprite covering many cells
+        player = pygame.sprite.Sprite()
+        player.rect = pygame.Rect(200, 200, 150, 150)
+
+        expected = pygame.sprite.spritecollide(player, self.zombies, False, pygame.sprite.collide_rect)
+        result = self.grid.spritecollide(player, self.zombies, False, pygame.sprite.collide_rect)
+
+        self.assertGreater(len(expected), 0)
+        self.assertEqual(result, expected)
+        print("Grid spritecollide matches pygame")
+
+    def test_dokill_matches_pygame(self):
+        # killed sprites are the same, and zombies killed by one projectile aren't hit again
+        zombies_copy = pygame.sprite.Group()
+        projectiles_copy = pygame.sprite.Group()
+        for zombie in self.zombies:
+            clone = pygame.sprite.Sprite(zombies_copy)
+            clone.rect = zombie.rect.copy()
+        for projectile in self.projectiles:
+            clone = pygame.sprite.Sprite(projectiles_copy)
+            clone.rect = projectile.rect.copy()
+
+        expected = pygame.sprite.groupcollide(projectiles_copy, zombies_copy, True, True)
+        result = self.grid.groupcollide(self.projectiles, self.zombies, True, True)
+
+        self.assertEqual(len(result), len(expected))
+        self.assertEqual(sum(map(len, result.values())), sum(map(len, expected.values())))
+        self.assertEqual(len(self.zombies), len(zombies_copy))
+        self.assertEqual(len(self.projectiles), len(projectiles_copy))
+        print("Grid kill semantics match pygame")
+
+    def test_unindexed_group_falls_back_to_pygame(self):
+        # queries against groups that weren't indexed are passed to pygame unchanged
+        with patch('pygame.sprite.groupcollide', return_value={}) as mock_collide:
+            self.grid.groupcollide(self.zombies, self.projectiles, True, False)
+
+        mock_collide.assert_called_once_with(self.zombies, self.projectiles, True, False, None)
+        print("Unindexed groups fall back to pygame")
+
+    def test_sprite_spanning_cells_reported_once(self):
+        # a sprite in several cells (and negative ones) is returned a single time
+        grid = SpatialGrid(cell_size=16)
+        wide = pygame.sprite.Sprite()
+        wide.rect = pygame.Rect(-40, -40, 100, 100)
+        group = pygame.sprite.Group(wide)
+        grid.rebuild(group)
+
+        probe = pygame.sprite.Sprite()
+        probe.rect = pygame.Rect(-30, -30, 80, 80)
+
+        self.assertEqual(grid.spritecollide(probe, group, False), [wide])
+        self.assertEqual(grid.stats()['sprites'], 1)
+        print("Sprite spanning many cells is reported once")
+
+    def test_small_field_is_not_indexed(self):
+        # below the threshold the grid is skipped and every pass is plain pygame
+        checks = pair_checks((self.projectiles, self.zombies))
+        self.assertEqual(checks, 150 * 200)
+        self.assertLess(checks, MIN_PAIR_CHECKS)
+        self.assertFalse(self.grid.rebuild(self.zombies, checks=checks))
+        self.assertFalse(self.grid.is_indexed(self.zombies))
+        self.assertEqual(self.grid.stats()['sprites'], 0)
+
+        expected = pygame.sprite.groupcollide(self.projectiles, self.zombies, False, False)
+        with patch('pygame.sprite.groupcollide', return_value=expected) as mock_collide:
+            result = self.grid.groupcollide(self.projectiles, self.zombies, False, False)
+        mock_collide.assert_called_once()
+        self.assertEqual(result, expected)
+
+        self.assertTrue(self.grid.rebuild(self.zombies, checks=MIN_PAIR_CHECKS))
+        self.assertTrue(self.grid.is_indexed(self.zombies))
+        print("Small fields skip the grid")
+
+if __name__ == '__main__':
+    unittest.main()
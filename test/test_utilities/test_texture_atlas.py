@@ -0,0 +1,86 @@
+import unittest
+import pygame
+import os
+import tempfile
+from unittest.mock import patch
+
+os.environ['SDL_VIDEODRIVER'] = 'dummy'
+
+from GardenInvasion.Utilities.asset_cache import AssetCache, image_path, SCALE_NONE, SCALE_SUPERSAMPLE, SCALE_FAST
+from GardenInvasion.Utilities.texture_atlas import (
+    AtlasLoader, build_atlas, pack, atlas_key, DEFAULT_ATLAS
+)
+
+SPECS = [
+    (image_path("Projectile.png"), None, SCALE_NONE),
+    (image_path("BaseZombie02.png"), (None, 70), SCALE_SUPERSAMPLE),
+    (image_path("HeartShape.png"), (40, 40), SCALE_FAST),
+]
+
+class TestTextureAtlas(unittest.TestCase):
+    # Test suite for the texture atlas builder and loader
+
+    @classmethod
+    def setUpClass(cls):
+        pygame.init()
+        if not pygame.display.get_surface():
+            pygame.display.set_mode((1, 1))
+
+    def test_pack_without_overlaps(self):
+        sizes = {f"sprite{i}": (30 + i * 7, 20 + i * 5) for i in range(12)}
+        placements = pack(sizes, sheet_size=128)
+        self.assertGreater(max(sheet for sheet, _, _ in placements.values()), 0) # spilled to more sheets
+        rects = {key: (sheet, pygame.Rect(x, y, *sizes[key])) for key, (sheet, x, y) in placements.items()}
+        for key, (sheet, rect) in rects.items():
+            self.assertTrue(pygame.Rect(0, 0, 128, 128).contains(rect))
+            for other, (other_sheet, other_rect) in rects.items():
+                if other != key and other_sheet == sheet:
+                    self.assertFalse(rect.colliderect(other_rect), (key, other))
+        with self.assertRaises(ValueError):
+            pack({'huge': (200, 10)}, sheet_size=128)
+        print("Sprites are packed without overlapping")
+
+    def test_atlas_sprites_match_cache_images(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            index_path = os.path.join(tmp, "sprites.json")
+            build_atlas(SPECS, index_path)
+            atlas = AtlasLoader(index_path)
+            cache = AssetCache()
+            for spec in SPECS:
+                sprite = atlas.lookup(*spec)
+                expected = cache.get_image(*spec)
+                self.assertEqual(sprite.get_size(), expected.get_size())
+                self.assertEqual(pygame.image.tobytes(sprite, 'RGBA'), pygame.image.tobytes(expected, 'RGBA'), spec)
+            self.assertIsNone(atlas.lookup(image_path("Projectile.png"), (5, 5), SCALE_FAST))
+            self.assertEqual(atlas.stale_keys(), [])
+        print("Atlas sprites are pixel identical to the cache images")
+
+    def test_cache_serves_atlas_sprites(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            index_path = os.path.join(tmp, "sprites.json")
+            build_atlas(SPECS, index_path)
+            cache = AssetCache()
+            cache.use_atlas(AtlasLoader(index_path))
+            real_load = pygame.image.load
+            with patch('pygame.image.load', side_effect=real_load) as mock_load:
+                zombie = cache.get_image(*SPECS[1])
+                heart = cache.get_image(*SPECS[2])
+                self.assertEqual(mock_load.call_count, 1) # only the sheet is decoded
+                self.assertIs(zombie.get_parent(), heart.get_parent())
+                cache.get_image(image_path("Projectile.png"), (5, 5), SCALE_FAST) # not in the atlas
+                self.assertEqual(mock_load.call_count, 2)
+        print("The asset cache takes atlas sprites from one decoded sheet")
+
+    def test_built_atlas_is_up_to_date(self):
+        atlas = AtlasLoader(DEFAULT_ATLAS)
+        self.assertEqual(atlas.stale_keys(), [])
+        for spec in (
+            (image_path("BaseZombie01.png"), (None, 70), SCALE_SUPERSAMPLE),
+            (image_path("Wallnut_body_Undamaged.png"), (60, 60), 'smooth'),
+            (image_path("HeartShape.png"), (40, 40), SCALE_FAST),
+        ):
+            self.assertIn(atlas_key(*spec), atlas)
+        print("The atlas in Assets/atlas matches the source images")
+
+if __name__ == '__main__':
+    unittest.main()
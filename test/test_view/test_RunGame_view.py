@@ -8,7 +8,8 @@ from GardenInvasion.Model.wallnut_model import WallNut
 from GardenInvasion.Model.projectile_model import Projectile
 from GardenInvasion.Utilities.constants import SCREEN_WIDTH, SCREEN_HEIGHT
 from GardenInvasion.Model.setting_volume_model import SettingsModel
-from GardenInvasion.View.RunGame_view import draw_hearts
+from GardenInvasion.View.RunGame_view import draw_hearts, DirtyGameRenderer
+from GardenInvasion.Utilities.asset_cache import asset_cache
 
 class TestRunGameView(unittest.TestCase):
     # Test suite for game view rendering functions
@@ -27,6 +28,8 @@ class TestRunGameView(unittest.TestCase):
         pygame.quit()
 
     def setUp(self):
+        asset_cache.clear() # image loading is mocked, drop sprites cached by other tests
+        self.addCleanup(asset_cache.clear)
         #Set up test fixtures before each test
         self.screen = self.display # Main display surface
         
@@ -197,5 +200,60 @@ class TestRunGameView(unittest.TestCase):
         self.assertEqual(player_health, 0)
         print("Successfully handled 0 hearts (game over state)")
 
+    def _add_sprite(self, group, pos, color):
+        # plain colored sprite, enough for the renderer tests
+        sprite = pygame.sprite.Sprite()
+        sprite.image = pygame.Surface((30, 30))
+        sprite.image.fill(color)
+        sprite.rect = sprite.image.get_rect(topleft=pos)
+        group.add(sprite)
+        return sprite
+
+    def test_dirty_renderer_first_frame_is_full_screen(self):
+        # Test that the first frame (and frames after invalidate) push the whole screen
+        renderer = DirtyGameRenderer(self.screen, self.game_background, self.heart_image)
+        self._add_sprite(self.zombie_group, (100, 100), (0, 255, 0))
+
+        args = (self.player_group, self.projectile_group, self.wallnut_group, 2, self.zombie_group)
+        self.assertEqual(renderer.draw(*args), [self.screen.get_rect()])
+        self.assertNotIn(self.screen.get_rect(), renderer.draw(*args))
+
+        renderer.invalidate()
+        self.assertEqual(renderer.draw(*args), [self.screen.get_rect()])
+        print("Dirty renderer pushes the full screen only when needed")
+
+    def test_dirty_renderer_returns_old_and_new_areas(self):
+        # Test that a moving sprite reports both where it was and where it is now
+        renderer = DirtyGameRenderer(self.screen, self.game_background, self.heart_image)
+        zombie = self._add_sprite(self.zombie_group, (100, 100), (0, 255, 0))
+        args = (self.player_group, self.projectile_group, self.wallnut_group, 2, self.zombie_group)
+        renderer.draw(*args)
+
+        zombie.rect.topleft = (100, 200)
+        rects = renderer.draw(*args)
+
+        self.assertIn(pygame.Rect(100, 100, 30, 30), rects)
+        self.assertIn(pygame.Rect(100, 200, 30, 30), rects)
+        print("Dirty renderer reports old and new sprite areas")
+
+    def test_dirty_renderer_matches_full_redraw(self):
+        # Test that after sprites move the screen looks the same as with draw_game
+        self.game_background.surface.fill((10, 20, 30))
+        renderer = DirtyGameRenderer(self.screen, self.game_background, self.heart_image)
+        zombie = self._add_sprite(self.zombie_group, (100, 100), (0, 255, 0))
+        self._add_sprite(self.wallnut_group, (300, 400), (139, 69, 19))
+        args = (self.player_group, self.projectile_group, self.wallnut_group, 2, self.zombie_group)
+        renderer.draw(*args)
+
+        zombie.rect.topleft = (110, 140)
+        renderer.draw(*args)
+        dirty_frame = self.screen.copy()
+
+        draw_game(self.screen, self.game_background, self.player_group, self.projectile_group,
+                  self.wallnut_group, 2, self.heart_image, self.zombie_group)
+
+        self.assertEqual(pygame.image.tobytes(dirty_frame, 'RGB'), pygame.image.tobytes(self.screen, 'RGB'))
+        print("Dirty renderer frame matches a full redraw")
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,75 @@
+import unittest
+import pygame
+import os
+from unittest.mock import patch
+from GardenInvasion.View.backdrop_view import Backdrop, BLUR_AVAILABLE, DOWNSCALE
+from GardenInvasion.Utilities.constants import SCREEN_WIDTH, SCREEN_HEIGHT
+
+
+class TestBackdropView(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        os.environ['SDL_VIDEODRIVER'] = 'dummy' # Use dummy video driver for headless testing
+        pygame.init()
+        cls.display = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+
+    @classmethod
+    def tearDownClass(cls):
+        pygame.quit()
+
+    def setUp(self):
+        self.screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), 0, self.display)
+
+    def _check_darkened_flat_color(self, backdrop):
+        self.screen.fill((200, 100, 50))
+        image = backdrop.build(self.screen, darken=150)
+        r, g, b, _ = image.get_at((SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
+        # as a black overlay of alpha 150 over the color, give or take rounding
+        for value, expected in zip((r, g, b), (200, 100, 50)):
+            self.assertAlmostEqual(value, expected * 105 / 255, delta=2)
+
+    def test_ci_runs_the_box_blur(self):
+        # NumPy is optional for players, but CI installs it (requirements-dev.txt):
+        # the surfarray blur must not be skipped there
+        if os.environ.get('GITHUB_ACTIONS') != 'true': # not CI: test_sound_manager_model drops CI from the environment
+            self.skipTest("not running in CI")
+        self.assertTrue(BLUR_AVAILABLE, "NumPy missing, install requirements-dev.txt")
+        print("Box blur available in CI")
+
+    @unittest.skipUnless(BLUR_AVAILABLE, "NumPy not installed")
+    def test_darkening_is_baked_in(self):
+        self._check_darkened_flat_color(Backdrop())
+        print("The backdrop is darkened like the old overlay")
+
+    @unittest.skipUnless(BLUR_AVAILABLE, "NumPy not installed")
+    def test_sharp_edges_are_blurred(self):
+        self.screen.fill((0, 0, 0))
+        self.screen.fill((255, 255, 255), pygame.Rect(0, 0, SCREEN_WIDTH // 2, SCREEN_HEIGHT))
+        image = Backdrop().build(self.screen, radius=16, darken=0)
+        edge = SCREEN_WIDTH // 2
+        row = [image.get_at((x, SCREEN_HEIGHT // 2)).r for x in range(edge - 24, edge + 24)]
+        self.assertEqual(row, sorted(row, reverse=True)) # a ramp from white to black
+        self.assertGreater(len(set(row)), 10) # over many pixels, not a hard step
+        self.assertGreater(image.get_at((10, 10)).r, 240)
+        self.assertLess(image.get_at((SCREEN_WIDTH - 10, 10)).r, 15)
+        print("Sharp edges of the snapshot are blurred")
+
+    def test_smoothscale_fallback(self):
+        with patch('GardenInvasion.View.backdrop_view.BLUR_AVAILABLE', False):
+            self._check_darkened_flat_color(Backdrop())
+        print("Without NumPy the backdrop falls back to a smoothscale blur")
+
+    def test_buffers_reused_between_modals(self):
+        backdrop = Backdrop()
+        first = backdrop.build(self.screen)
+        scratch = dict(backdrop._scratch)
+        second = backdrop.build(self.screen)
+        self.assertIs(first, second)
+        for name, buffer in backdrop._scratch.items():
+            self.assertIs(buffer, scratch[name])
+        self.assertEqual(backdrop.builds, 2)
+        self.assertEqual(backdrop._small.get_size(), (SCREEN_WIDTH // DOWNSCALE, SCREEN_HEIGHT // DOWNSCALE))
+        print("Backdrop surfaces and scratch buffers are reused")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,82 @@
+import unittest
+from unittest.mock import MagicMock
+import pygame
+import os
+from GardenInvasion.View.hud_view import GameHUD
+from GardenInvasion.View.RunGame_view import draw_hearts
+from GardenInvasion.Utilities.constants import SCREEN_WIDTH, SCREEN_HEIGHT
+
+class TestGameHUD(unittest.TestCase):
+    # Test suite for the cached HUD layer
+
+    @classmethod
+    def setUpClass(cls):
+        os.environ['SDL_VIDEODRIVER'] = 'dummy'
+        os.environ['SDL_AUDIODRIVER'] = 'dummy'
+        pygame.init()
+        if not pygame.display.get_surface():
+            pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+
+    def setUp(self):
+        self.screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        # heart with a soft edge, to check alpha is kept as it is
+        self.heart_image = pygame.Surface((20, 20), pygame.SRCALPHA)
+        self.heart_image.fill((255, 0, 0, 128))
+        pygame.draw.circle(self.heart_image, (255, 0, 0, 255), (10, 10), 8)
+
+    def test_hearts_match_draw_hearts(self):
+        # Test that the HUD puts the same pixels on screen as draw_hearts
+        expected = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        expected.fill((0, 80, 0))
+        draw_hearts(expected, 2, self.heart_image)
+
+        self.screen.fill((0, 80, 0))
+        GameHUD(self.heart_image, self.screen.get_size()).draw(self.screen)
+
+        self.assertEqual(pygame.image.tobytes(self.screen, 'RGB'), pygame.image.tobytes(expected, 'RGB'))
+        print("HUD hearts match draw_hearts")
+
+    def test_single_blit_covering_hearts(self):
+        # Test that drawing the HUD is one blit over the heart strip only
+        hud = GameHUD(self.heart_image, self.screen.get_size())
+        rects = hud.draw(self.screen)
+
+        self.assertEqual(rects, [pygame.Rect(SCREEN_WIDTH - 20 - 90, 20, 90, 40)])
+
+        hud.set_life_points(0)
+        self.assertEqual(hud.draw(self.screen), [])
+        print("HUD is drawn with a single blit")
+
+    def test_layer_rebuilt_only_on_change(self):
+        # Test that the layer is recomposed only when life points change
+        hud = GameHUD(self.heart_image, self.screen.get_size())
+        hud.draw(self.screen)
+        layer = hud._layer
+
+        hud.set_life_points(2)
+        hud.draw(self.screen)
+        self.assertIs(hud._layer, layer)
+
+        hud.set_life_points(1)
+        hud.draw(self.screen)
+        self.assertIsNot(hud._layer, layer)
+        print("HUD layer rebuilt only when life points change")
+
+    def test_text_rendered_only_when_changed(self):
+        # Test that counters are rendered once per distinct text
+        font = MagicMock()
+        font.render.side_effect = lambda text, aa, color: pygame.Surface((10 * len(text), 20), pygame.SRCALPHA)
+        hud = GameHUD(self.heart_image, self.screen.get_size(), font=font)
+
+        for _ in range(3):
+            hud.set_text('wave', "Ondata 1 - Zombie: 3")
+            hud.draw(self.screen)
+        hud.set_text('wave', "Ondata 1 - Zombie: 2")
+
+        self.assertEqual(font.render.call_count, 2)
+        hud.remove_text('wave')
+        self.assertNotIn('wave', hud._texts)
+        print("HUD texts are rendered only when they change")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,49 @@
+import unittest
+import pygame
+import os
+from GardenInvasion.View.profiler_view import ProfilerOverlay, PANEL_POS, TEXT_REFRESH_FRAMES
+from GardenInvasion.Utilities.frame_profiler import FrameProfiler, FRAME
+from GardenInvasion.Utilities.constants import SCREEN_WIDTH, SCREEN_HEIGHT
+
+class TestProfilerOverlay(unittest.TestCase):
+    # Test suite for the frame profiler overlay
+
+    @classmethod
+    def setUpClass(cls):
+        os.environ['SDL_VIDEODRIVER'] = 'dummy'
+        os.environ['SDL_AUDIODRIVER'] = 'dummy'
+        pygame.init()
+
+    def setUp(self):
+        self.screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        self.profiler = FrameProfiler()
+        for elapsed_ms in (5, 10, 30):
+            self.profiler._stats(FRAME).add(elapsed_ms * 1_000_000)
+            self.profiler._stats('draw').add(elapsed_ms * 500_000)
+        self.overlay = ProfilerOverlay(self.profiler)
+
+    def test_draw_returns_covered_area(self):
+        # Test that the overlay draws at its position and returns the area it covers
+        self.screen.fill((0, 80, 0))
+        rect = self.overlay.draw(self.screen)
+
+        self.assertEqual(rect.topleft, PANEL_POS)
+        self.assertNotEqual(self.screen.get_at(rect.center)[:3], (0, 80, 0))
+        self.assertEqual(self.screen.get_at((rect.right + 1, rect.bottom + 1))[:3], (0, 80, 0))
+        print("Profiler overlay returns the area it covers")
+
+    def test_text_refreshed_every_few_frames(self):
+        # Test that the percentile text is rendered again only after TEXT_REFRESH_FRAMES frames
+        self.overlay.draw(self.screen)
+        lines = self.overlay._lines
+        self.assertEqual(len(lines), 2) # frame percentiles + the draw phase
+
+        for _ in range(TEXT_REFRESH_FRAMES - 1):
+            self.overlay.draw(self.screen)
+        self.assertIs(self.overlay._lines, lines)
+        self.overlay.draw(self.screen)
+        self.assertIsNot(self.overlay._lines, lines)
+        print("Profiler overlay text refreshed every few frames")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,63 @@
+import unittest
+import pygame
+import os
+from unittest.mock import patch
+from GardenInvasion.View.text_view import OutlinedTextCache, text_cache
+from GardenInvasion.View.menu_view import draw_menu
+from GardenInvasion.Model.menu_model import MenuModel
+from GardenInvasion.Utilities.constants import SCREEN_WIDTH, SCREEN_HEIGHT, GREEN_SI, BLACK
+
+
+class TestTextView(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        os.environ['SDL_VIDEODRIVER'] = 'dummy' # Use dummy video driver for headless testing
+        pygame.init()
+        cls.display = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+
+    @classmethod
+    def tearDownClass(cls):
+        pygame.quit()
+
+    def setUp(self):
+        self.font = pygame.font.Font(None, 30)
+
+    def test_label_is_rendered_once(self):
+        cache = OutlinedTextCache()
+        first = cache.render(self.font, "New Game", GREEN_SI, BLACK, 2)
+        second = cache.render(self.font, "New Game", pygame.Color(*GREEN_SI), BLACK, 2)
+        self.assertIs(first, second) # pygame.Color and tuples hit the same entry
+        width, height = self.font.size("New Game")
+        self.assertEqual(first.get_size(), (width + 4, height + 4)) # room for the outline
+        self.assertEqual(cache.stats(), {'hits': 1, 'misses': 1, 'evictions': 0, 'labels': 1})
+
+        cache.render(self.font, "New Game", GREEN_SI, BLACK, 3) # other outline width, other label
+        self.assertEqual(cache.misses, 2)
+        print("Outlined labels are rendered once and shared")
+
+    def test_least_recently_used_label_is_evicted(self):
+        cache = OutlinedTextCache(max_labels=2)
+        cache.render(self.font, "10%", GREEN_SI)
+        cache.render(self.font, "20%", GREEN_SI)
+        cache.render(self.font, "10%", GREEN_SI) # 20% is now the oldest
+        cache.render(self.font, "30%", GREEN_SI)
+
+        self.assertEqual(cache.evictions, 1)
+        self.assertEqual(cache.stats()['labels'], 2)
+        cache.render(self.font, "10%", GREEN_SI)
+        self.assertEqual(cache.hits, 2)
+        cache.render(self.font, "20%", GREEN_SI)
+        self.assertEqual(cache.misses, 4) # rendered again
+        print("The least recently used label is dropped when the cache is full")
+
+    def test_static_menu_renders_nothing_after_first_frame(self):
+        fonts = (pygame.font.Font(None, 30), pygame.font.Font(None, 16), pygame.font.Font(None, 72))
+        model = MenuModel()
+        draw_menu(self.display, model, None, None, fonts)
+        with patch.object(text_cache, 'misses', 0):
+            draw_menu(self.display, model, None, None, fonts)
+            self.assertEqual(text_cache.misses, 0)
+        print("A static menu frame only blits cached labels")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,105 @@
+import unittest
+import pygame
+import os
+from GardenInvasion.View.widgets import HitIndex, Label, Button, Slider, Modal, cached_layout, clear_layouts
+from GardenInvasion.View.menu_view import draw_menu, menu_layout, draw_pause_modal, pause_modal, get_pause_menu_button_rects
+from GardenInvasion.Model.menu_model import MenuModel
+from GardenInvasion.Utilities.constants import SCREEN_WIDTH, SCREEN_HEIGHT
+
+
+class TestWidgets(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        os.environ['SDL_VIDEODRIVER'] = 'dummy' # Use dummy video driver for headless testing
+        pygame.init()
+        cls.display = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+
+    @classmethod
+    def tearDownClass(cls):
+        pygame.quit()
+
+    def setUp(self):
+        self.screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        self.font = pygame.font.Font(None, 24)
+
+    def test_hit_index_returns_first_rect_under_point(self):
+        index = HitIndex([(0, 0, 10, 10), (20, 0, 10, 10), (0, 0, 30, 30)])
+        self.assertEqual(index.hit((5, 5)), 0)
+        self.assertEqual(index.hit((25, 5)), 1)
+        self.assertEqual(index.hit((15, 20)), 2)
+        self.assertEqual(index.hit((100, 100)), -1)
+        print("Hit index finds the widget under the mouse")
+
+    def test_label_renders_again_only_when_text_changes(self):
+        label = Label(self.font, "50%", (255, 255, 255), (100, 100), hit_size=(60, 30))
+        first = label.surface
+        label.set_text("50%")
+        self.assertIs(label.surface, first)
+        label.set_text("100%")
+        self.assertIsNot(label.surface, first)
+        self.assertEqual(label.rect.center, (100, 100))
+        self.assertEqual(label.hit_rect.size, (60, 30))
+        self.assertEqual(label.hit_rect.center, (100, 100))
+        print("Labels render again only when their text changes")
+
+    def test_button_faces_are_drawn_once_per_state(self):
+        button = Button("Quit", self.font, (10, 10, 140, 50), (210, 210, 210), (180, 220, 180))
+        normal, selected = button.face(False), button.face(True)
+        button.draw(self.screen, True)
+        self.assertIs(button.face(False), normal)
+        self.assertIs(button.face(True), selected)
+        self.assertEqual(tuple(self.screen.get_at((75, 12)))[:3], (180, 220, 180)) # selected fill
+        print("Button faces are drawn once per state")
+
+    def test_slider_fills_in_proportion(self):
+        slider = Slider((0, 0, 100, 10), fill=(0, 255, 0), track=(50, 50, 50))
+        slider.draw(self.screen, 30)
+        self.assertEqual(tuple(self.screen.get_at((20, 5)))[:3], (0, 255, 0))
+        self.assertEqual(tuple(self.screen.get_at((60, 5)))[:3], (50, 50, 50))
+        print("Slider fill follows the value")
+
+    def test_modal_hit_test_matches_drawn_buttons(self):
+        draw_pause_modal(self.screen, selected_button=2, darken=False)
+        modal = pause_modal()
+        for i, rect in enumerate(get_pause_menu_button_rects()):
+            self.assertEqual(modal.hit_test(rect.center), i)
+        self.assertEqual(modal.hit_test((0, 0)), -1)
+        # the selected Quit button is drawn green where it is hit-tested
+        quit_rect = get_pause_menu_button_rects()[2]
+        self.assertEqual(tuple(self.screen.get_at((quit_rect.centerx, quit_rect.top + 5)))[:3], (180, 220, 180))
+        print("Modal buttons are hit-tested where they are drawn")
+
+    def test_faded_modal_is_drawn_with_alpha(self):
+        modal = Modal((0, 0, 100, 100), fill=(255, 255, 255))
+        self.screen.fill((0, 0, 0))
+        modal.draw(self.screen, alpha=128)
+        r, g, b, _ = self.screen.get_at((50, 50))
+        self.assertAlmostEqual(r, 128, delta=2)
+        print("Fading modal blends as one surface")
+
+    def test_menu_layout_is_built_once(self):
+        fonts = (pygame.font.Font(None, 30), pygame.font.Font(None, 16), pygame.font.Font(None, 72))
+        model = MenuModel()
+        layout = menu_layout(fonts, tuple(model.menu_items))
+        rects = draw_menu(self.screen, model, None, None, fonts)
+        self.assertIs(menu_layout(fonts, tuple(model.menu_items)), layout)
+        for i, rect in enumerate(rects):
+            self.assertEqual(layout.items.hit_test(rect.center), i)
+        print("Menu layout is built once and hit-tested where drawn")
+
+    def test_layouts_are_dropped_on_clear(self):
+        builds = []
+
+        @cached_layout
+        def layout(size):
+            builds.append(size)
+            return pygame.Rect(0, 0, size, size)
+
+        self.assertIs(layout(5), layout(5))
+        clear_layouts() # what pygame.quit() does
+        layout(5)
+        self.assertEqual(builds, [5, 5])
+        print("Cached layouts are rebuilt after clearing")
+
+if __name__ == '__main__':
+    unittest.main()